@@ -0,0 +1,35 @@
+"""add user_sessions expires_at index
+
+Revision ID: 4050023451cf
+Revises: d4b7ba48e649
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4050023451cf'
+down_revision: str | Sequence[str] | None = 'd4b7ba48e649'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # user_sessions can be large: build the index without blocking logins
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_sessions_expires_at', 'user_sessions', ['expires_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_sessions_expires_at', table_name='user_sessions',
+            postgresql_concurrently=True, if_exists=True
+        )
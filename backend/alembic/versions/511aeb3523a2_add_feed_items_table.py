@@ -0,0 +1,42 @@
+"""add feed_items table
+
+Revision ID: 511aeb3523a2
+Revises: 6d1895bc0824
+Create Date: 2026-10-17 11:26:05.177342
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '511aeb3523a2'
+down_revision: str | Sequence[str] | None = '6d1895bc0824'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('feed_items',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('circle_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['circle_id'], ['circles.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'post_id')
+    )
+    op.create_index(
+        'ix_feed_items_user_id_created_at_post_id', 'feed_items',
+        ['user_id', sa.text('created_at DESC'), sa.text('post_id DESC')], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_feed_items_user_id_created_at_post_id', table_name='feed_items')
+    op.drop_table('feed_items')
@@ -0,0 +1,29 @@
+"""add version to circles
+
+Revision ID: 544168277d3a
+Revises: 511aeb3523a2
+Create Date: 2026-10-17 13:51:37.761045
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '544168277d3a'
+down_revision: str | Sequence[str] | None = '511aeb3523a2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Constant server default: metadata-only on PostgreSQL 11+, no table rewrite
+    op.add_column('circles', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('circles', 'version')
@@ -0,0 +1,57 @@
+"""add feed and membership indexes
+
+Revision ID: 6d1895bc0824
+Revises: 4050023451cf
+Create Date: 2026-10-17 10:03:27.904116
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6d1895bc0824'
+down_revision: str | Sequence[str] | None = '4050023451cf'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # get_feed / get_circle_posts: WHERE circle_id ... ORDER BY created_at DESC, id DESC
+        op.create_index(
+            'ix_posts_circle_id_created_at_id', 'posts',
+            ['circle_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        # get_feed / get_my_circles: circle_members looked up by user_id alone
+        op.create_index(
+            'ix_circle_members_user_id_circle_id', 'circle_members',
+            ['user_id', 'circle_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            op.f('ix_circles_owner_id'), 'circles', ['owner_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_circles_owner_id'), table_name='circles',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_circle_members_user_id_circle_id', table_name='circle_members',
+            postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            'ix_posts_circle_id_created_at_id', table_name='posts',
+            postgresql_concurrently=True, if_exists=True
+        )
@@ -0,0 +1,69 @@
+"""hash session tokens
+
+Revision ID: 78b72f11e533
+Revises: 94f562ce122f
+Create Date: 2026-10-17 02:41:12.518204
+
+Replaces user_sessions.session_token (raw token, varchar(255)) with
+token_hash, the 32-byte SHA-256 of the token. Existing rows are rewritten
+in committed batches so the table is never locked for the whole rewrite.
+The application code that looks sessions up by token_hash has to be
+deployed together with this revision.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '78b72f11e533'
+down_revision: str | Sequence[str] | None = '94f562ce122f'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BATCH_SIZE = 10_000
+
+# Same digest as app.core.security.hash_session_token
+HASH_BATCH = sa.text(
+    "UPDATE user_sessions SET token_hash = sha256(convert_to(session_token, 'UTF8')) "
+    "WHERE id IN ("
+    " SELECT id FROM user_sessions WHERE token_hash IS NULL"
+    " LIMIT :batch_size FOR UPDATE SKIP LOCKED)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_sessions', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+
+    # One short transaction per batch, then build the index without blocking logins
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while conn.execute(HASH_BATCH, {"batch_size": BATCH_SIZE}).rowcount:
+            pass
+        op.create_index(
+            'ix_user_sessions_token_hash', 'user_sessions', ['token_hash'],
+            unique=True, postgresql_concurrently=True
+        )
+
+    # Rows inserted by the old code while the batches ran
+    op.get_bind().execute(
+        sa.text("UPDATE user_sessions SET token_hash = sha256(convert_to(session_token, 'UTF8')) "
+                "WHERE token_hash IS NULL")
+    )
+    op.alter_column('user_sessions', 'token_hash', nullable=False)
+    op.drop_index('ix_user_sessions_session_token', table_name='user_sessions')
+    op.drop_column('user_sessions', 'session_token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens cannot be recovered from their digests: every session is dropped
+    # and users sign in again
+    op.execute("DELETE FROM user_sessions")
+    op.add_column('user_sessions', sa.Column('session_token', sa.VARCHAR(length=255), nullable=False))
+    op.create_index('ix_user_sessions_session_token', 'user_sessions', ['session_token'], unique=True)
+    op.drop_index('ix_user_sessions_token_hash', table_name='user_sessions')
+    op.drop_column('user_sessions', 'token_hash')
@@ -0,0 +1,35 @@
+"""add session_revocations table
+
+Revision ID: 94f562ce122f
+Revises: 544168277d3a
+Create Date: 2026-10-17 02:19:38.773784
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '94f562ce122f'
+down_revision: str | Sequence[str] | None = '544168277d3a'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_revocations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_session_revocations_expires_at'), 'session_revocations', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_session_revocations_expires_at'), table_name='session_revocations')
+    op.drop_table('session_revocations')
@@ -9,19 +9,36 @@ Matches frontend expectations:
 """
 
 import logging
+import math
 import secrets
 import traceback
 from datetime import datetime, timedelta
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional import check_not_modified, make_etag, set_validators
 from app.core.config import settings
 from app.core.db import get_db
 from app.core.limiter import limiter
-from app.core.security import get_password_hash, verify_password
+from app.core.login_throttle import login_throttle
+from app.core.security import (
+    PasswordHasherBusyError,
+    get_password_hash_async,
+    hash_session_token,
+    verify_and_update_password_async,
+)
+from app.core.session_cache import session_cache
+from app.core.signed_sessions import (
+    ACCESS_COOKIE,
+    issue_session_token,
+    read_session_token,
+    session_id_from_token,
+    session_revocations,
+    signed_sessions_enabled,
+)
 from app.db.models import User, UserSession
 from app.schemas.auth import SessionResponse, UserCreate, UserLogin, UserResponse
 
@@ -38,6 +55,21 @@ logger = logging.getLogger("auth")
 router: APIRouter = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _set_signed_session_cookie(response: Response, user: User, session_id: int, expires_at: datetime) -> None:
+    token, max_age = issue_session_token(user, session_id, expires_at)
+    secure_flag = settings.ENVIRONMENT == "production"
+    samesite_value: Literal["lax", "none"] = "none" if secure_flag else "lax"
+    response.set_cookie(
+        key=ACCESS_COOKIE,
+        value=token,
+        httponly=True,
+        secure=secure_flag,
+        samesite=samesite_value,
+        max_age=max_age,
+        path="/",
+    )
+
+
 # -----------------------------
 # REGISTER
 # -----------------------------
@@ -54,7 +86,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
     if email.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already taken")
 
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
 
     new_user = User(
         username=user_data.username,
@@ -73,7 +105,6 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
         "username": new_user.username,
         "user_id": new_user.id
     })
-    print(f"✅ REGISTER: {new_user.username} (ID: {new_user.id})")
 
     return SessionResponse(
         success=True,
@@ -86,6 +117,9 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
 # -----------------------------
 # LOGIN (with rate limiting + logging)
 # -----------------------------
+# Two layers: slowapi limits each IP to 5/minute, login_throttle backs off
+# per username (attacks spread over many IPs). Both reject before any
+# Argon2 work.
 @router.post("/login", response_model=SessionResponse)
 @limiter.limit("5/minute")
 async def login(
@@ -95,6 +129,20 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ) -> SessionResponse:
 
+    retry_after = login_throttle.check(credentials.username)
+    if retry_after > 0:
+        logger.warning({
+            "event": "login_throttled",
+            "username": credentials.username,
+            "ip": request.client.host if request.client else "unknown",
+            "retry_after": round(retry_after, 1)
+        })
+        raise HTTPException(
+            status_code=429,
+            detail="Too many failed login attempts. Try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+
     try:
         # Find user
         result = await db.execute(
@@ -110,11 +158,12 @@ async def login(
                 "ip": client_ip,
                 "reason": "user_not_found"
             })
-            print(f"❌ LOGIN FAILED: {credentials.username} - {client_ip} - User not found")
+            login_throttle.record_failure(credentials.username)
             raise HTTPException(status_code=401, detail="Invalid username or password")
 
-        # Verify password
-        if not verify_password(credentials.password, user.hashed_password):
+        # Verify password (new_hash is set when the stored Argon2 costs are outdated)
+        valid, new_hash = await verify_and_update_password_async(credentials.password, user.hashed_password)
+        if not valid:
             client_ip = request.client.host if request.client else "unknown"
             logger.warning({
                 "event": "auth_failed",
@@ -122,7 +171,7 @@ async def login(
                 "ip": client_ip,
                 "reason": "invalid_password"
             })
-            print(f"❌ LOGIN FAILED: {credentials.username} - {client_ip} - Invalid password")
+            login_throttle.record_failure(credentials.username)
             raise HTTPException(status_code=401, detail="Invalid username or password")
 
         # Check active
@@ -134,9 +183,15 @@ async def login(
                 "ip": client_ip,
                 "reason": "inactive_account"
             })
-            print(f"❌ LOGIN FAILED: {credentials.username} - {client_ip} - Inactive account")
             raise HTTPException(status_code=403, detail="Account is inactive")
 
+        login_throttle.record_success(credentials.username)
+
+        if new_hash is not None:
+            # Saved by the session commit below
+            user.hashed_password = new_hash
+            logger.info({"event": "password_rehashed", "user_id": user.id})
+
         # SUCCESS LOG
         client_ip = request.client.host if request.client else "unknown"
         logger.info({
@@ -145,7 +200,6 @@ async def login(
             "username": user.username,
             "ip": client_ip
         })
-        print(f"🔐 LOGIN SUCCESS: {user.username} (ID: {user.id}) - {client_ip}")
 
         # Create session
         session_token = secrets.token_urlsafe(32)
@@ -153,7 +207,7 @@ async def login(
         expires_at = now + timedelta(minutes=settings.SESSION_EXPIRE_MINUTES)
 
         new_session = UserSession(
-            session_token=session_token,
+            token_hash=hash_session_token(session_token),
             user_id=user.id,
             created_at=now,
             expires_at=expires_at,
@@ -163,6 +217,14 @@ async def login(
 
         db.add(new_session)
         await db.commit()
+        if new_hash is not None:
+            await db.refresh(user)  # updated_at was set by the database
+            # Other cached sessions of the user still carry the old updated_at
+            session_cache.invalidate_user(user.id)
+        if signed_sessions_enabled():
+            _set_signed_session_cookie(response, user, new_session.id, expires_at)
+        else:
+            session_cache.put(session_token, user, expires_at)
 
         secure_flag = settings.ENVIRONMENT == "production"
         samesite_value: Literal["lax", "none"] = "none" if secure_flag else "lax"
@@ -194,7 +256,7 @@ async def login(
             user=user_response
         )
 
-    except HTTPException:
+    except (HTTPException, PasswordHasherBusyError):
         raise
     except Exception as e:
         logger.error({
@@ -202,46 +264,83 @@ async def login(
             "error": str(e),
             "trace": traceback.format_exc()
         })
-        print(f"🚨 AUTH ERROR: {str(e)}")
         raise HTTPException(status_code=500, detail="Login failed due to server error") from e
 
 
 # -----------------------------
 # GET CURRENT USER
 # -----------------------------
+def _active(user: User) -> User:
+    """The user, unless the account was deactivated (checked on every auth path)"""
+    if not user.is_active:
+        raise HTTPException(status_code=403, detail="Account is inactive")
+    return user
+
+
 async def get_current_user_from_session(
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> User:
 
+    signed = signed_sessions_enabled()
+    if signed:
+        signed_user = read_session_token(request.cookies.get(ACCESS_COOKIE))
+        if signed_user is not None:
+            return _active(signed_user)
+
     session_token = request.cookies.get("session_token")
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    session_result = await db.execute(
-        select(UserSession)
-        .where(UserSession.session_token == session_token)
+    if not signed:
+        cached_user = session_cache.get(session_token)
+        if cached_user is not None:
+            return _active(cached_user)
+
+    # Session and user in a single round trip
+    result = await db.execute(
+        select(User, UserSession.id, UserSession.expires_at)
+        .join(UserSession, UserSession.user_id == User.id)
+        .where(UserSession.token_hash == hash_session_token(session_token))
         .where(UserSession.expires_at > datetime.now())
     )
-    session = session_result.scalar_one_or_none()
+    row = result.first()
 
-    if not session:
+    if not row:
         raise HTTPException(status_code=401, detail="Session expired or invalid")
 
-    user_result = await db.execute(select(User).where(User.id == session.user_id))
-    user = user_result.scalar_one_or_none()
-
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+    user, session_id, expires_at = row
+    _active(user)
+    if signed:
+        # The signed token expired (or was missing): the session is still valid, issue a new one
+        _set_signed_session_cookie(response, user, session_id, expires_at)
+    else:
+        session_cache.put(session_token, user, expires_at)
 
     return user
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_endpoint(
-    current_user: User = Depends(get_current_user_from_session)
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+    current_user: User = Depends(get_current_user_from_session),
+    db: AsyncSession = Depends(get_db)
 ) -> UserResponse:
 
+    # Every profile change bumps updated_at, so it versions the response
+    etag = make_etag("me", current_user.id, current_user.updated_at or current_user.created_at)
+    check_not_modified(if_none_match, etag)
+    set_validators(response, etag)
+
+    if current_user.email is None:
+        # Signed token snapshot (no PII): load the profile fields
+        profile = await db.get(User, current_user.id)
+        if profile is None:
+            raise HTTPException(status_code=401, detail="Session expired or invalid")
+        current_user = profile
+
     return UserResponse(
         id=current_user.id,
         username=current_user.username,
@@ -264,20 +363,25 @@ async def logout(
 ) -> dict[str, Any]:
 
     session_token = request.cookies.get("session_token")
+    signed = signed_sessions_enabled()
+    secure_flag = settings.ENVIRONMENT == "production"
+    samesite_value: Literal["lax", "none"] = "none" if secure_flag else "lax"
 
     if session_token:
+        session_cache.invalidate(session_token)
+
         result = await db.execute(
-            select(UserSession).where(UserSession.session_token == session_token)
+            select(UserSession).where(UserSession.token_hash == hash_session_token(session_token))
         )
         session = result.scalar_one_or_none()
 
         if session:
+            if signed:
+                # Signed tokens of this session stay valid until they expire unless revoked
+                session_revocations.revoke(db, session.id)
             await db.delete(session)
             await db.commit()
 
-        secure_flag = settings.ENVIRONMENT == "production"
-        samesite_value: Literal["lax", "none"] = "none" if secure_flag else "lax"
-
         response.delete_cookie(
             "session_token",
             path="/",
@@ -285,6 +389,21 @@ async def logout(
             samesite=samesite_value
         )
 
+    if signed and ACCESS_COOKIE in request.cookies:
+        if not session_token:
+            # Only the signed cookie was sent: revoke the session it belongs to
+            session_id = session_id_from_token(request.cookies[ACCESS_COOKIE])
+            if session_id is not None:
+                session_revocations.revoke(db, session_id)
+                await db.commit()
+
+        response.delete_cookie(
+            ACCESS_COOKIE,
+            path="/",
+            secure=secure_flag,
+            samesite=samesite_value
+        )
+
     logger.info({
         "event": "logout",
         "ip": (request.client.host if request.client else "unknown")
@@ -6,7 +6,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoints.auth import get_current_user_from_session
+from app.core.config import settings
 from app.core.db import get_db
+from app.core.feed_cache import feed_cache
+from app.db.circles import bump_circle_version
+from app.db.feed import backfill_member, prune_member
 from app.db.models import Circle, CircleMember, User
 from app.schemas.social import (
     AddMemberRequest,
@@ -87,8 +91,12 @@ async def add_member(
         joined_at=datetime.now()
     )
     db.add(new_member)
+    await bump_circle_version(db, circle_id)
+    if settings.FEED_MODE == "write":
+        await backfill_member(db, request.user_id, circle_id, settings.FEED_BACKFILL_LIMIT)
     await db.commit()
     await db.refresh(new_member)
+    feed_cache.invalidate_users([request.user_id])
 
     # 6. Return response with badge
     member_response = CircleMemberResponse(
@@ -196,7 +204,11 @@ async def remove_member(
     username = user.username
 
     await db.delete(member)
+    await bump_circle_version(db, circle_id)
+    if settings.FEED_MODE == "write":
+        await prune_member(db, user_id, circle_id)
     await db.commit()
+    feed_cache.invalidate_users([user_id])
 
     return MemberActionResponse(
         success=True,
@@ -262,6 +274,7 @@ async def update_member_role(
     # 4. Update role
     old_role = member.role
     member.role = request.role
+    await bump_circle_version(db, circle_id)
     await db.commit()
     await db.refresh(member)
 
@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from collections import defaultdict
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import ColumnElement, ScalarSelect, and_, case, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
 
-from app.api.v1.endpoints.auth import get_current_user_endpoint, get_current_user_from_session
+from app.api.v1.endpoints.auth import get_current_user_from_session
+from app.core.conditional import check_not_modified, make_etag, set_validators
 from app.core.db import get_db
+from app.core.feed_cache import feed_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.query_log import query_budget
+from app.core.single_flight import single_flight
+from app.db.circles import bump_circle_version
+from app.db.feed import invalidate_circle_feeds
 from app.db.models import Circle, CircleMember, User
 from app.schemas.social import (
     CircleCreate,
+    CircleMemberPage,
     CircleMemberResponse,
     CircleResponse,
     CircleRole,
@@ -15,68 +27,85 @@ from app.schemas.social import (
 
 router: APIRouter = APIRouter(prefix="/circles", tags=["Circles"])
 
+# Members embedded in CircleResponse / default page size for member listing
+MEMBER_PAGE_SIZE = 50
+MEMBER_PAGE_MAX = 200
+
+# Sort order for member listings: owner first, then moderators, then members
+ROLE_RANK = {
+    CircleRole.OWNER: 0,
+    CircleRole.MODERATOR: 1,
+    CircleRole.MEMBER: 2,
+}
+
+
+def _member_response(member: CircleMember, username: str) -> CircleMemberResponse:
+    """Build a member response (badge is derived from the role by the schema)"""
+    return CircleMemberResponse(
+        circle_id=member.circle_id,
+        user_id=member.user_id,
+        username=username,
+        role=CircleRole(member.role),
+        joined_at=member.joined_at
+    )
+
 
-@router.get("/my", response_model=list[CircleResponse])
+@router.get("/my", response_model=list[CircleResponse], dependencies=[Depends(query_budget(3))])
 async def get_my_circles(
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user_from_session)
 ) -> list[CircleResponse]:
     """
     Get circles where current user is a member
     Used for dashboard display with roles and badges
+
+    Runs a fixed number of queries regardless of how many circles or
+    members there are: one for the circles (with owner usernames) and
+    one for all of their members (with member usernames).
+    The ETag covers the (id, version) of every circle, so a matching
+    If-None-Match gets a 304 before the members are loaded.
     """
-    # Get all circles where user is a member, with member info
+    owner = aliased(User)
+    member_count: ScalarSelect[int] = (
+        select(func.count())
+        .where(CircleMember.circle_id == Circle.id)
+        .correlate(Circle)
+        .scalar_subquery()
+    )
+
+    # 1. Circles where user is a member, with the owner's username, member count and the user's role
     circles_result = await db.execute(
-        select(Circle)
+        select(Circle, owner.username, member_count, CircleMember.role)
         .join(CircleMember, Circle.id == CircleMember.circle_id)
+        .join(owner, Circle.owner_id == owner.id, isouter=True)
         .where(CircleMember.user_id == current_user.id)
-        .options(selectinload(Circle.members))
         .order_by(Circle.created_at.desc())
     )
-    circles = circles_result.scalars().all()
+    circles = circles_result.all()
 
-    # Build response with member info and badges
-    result = []
-    for circle in circles:
-        # Count total members
-        member_count = len(circle.members)
-
-        # Get owner info
-        owner = await db.get(User, circle.owner_id)
-        owner_name = owner.username if owner else None
-
-        # Prepare members list with badges
-        members_list = []
-        for member in circle.members:
-            user_result = await db.get(User, member.user_id)
-            if not user_result:
-                continue
-
-            # Handle role conversion if needed
-            if isinstance(member.role, str):
-                role_enum = CircleRole(member.role)
-            else:
-                role_enum = member.role
-
-            # Get badge
-            badge_map = {
-                CircleRole.OWNER: "👑",
-                CircleRole.MODERATOR: "🛡️",
-                CircleRole.MEMBER: "👤"
-            }
-            badge = badge_map.get(role_enum, "👤")
-
-            members_list.append(
-                CircleMemberResponse(
-                    circle_id=member.circle_id,
-                    user_id=member.user_id,
-                    username=user_result.username,
-                    role=role_enum,  # Use enum, not string
-                    badge=badge,
-                    joined_at=member.joined_at
-                )
-            )
+    etag = make_etag("my-circles", current_user.id, *((circle.id, circle.version) for circle, _, _, _ in circles))
+    check_not_modified(if_none_match, etag)
+    set_validators(response, etag)
+
+    if not circles:
+        return []
+
+    # 2. All members of those circles, with their usernames, in one batch
+    members_result = await db.execute(
+        select(CircleMember, User.username)
+        .join(User, CircleMember.user_id == User.id)
+        .where(CircleMember.circle_id.in_([circle.id for circle, _, _, _ in circles]))
+    )
+    members_by_circle: dict[int, list[CircleMemberResponse]] = defaultdict(list)
+    for member, username in members_result:
+        members_by_circle[member.circle_id].append(_member_response(member, username))
 
+    # 3. Build response with member info and badges
+    result = []
+    for circle, owner_name, total_members, role in circles:
+        members_list = members_by_circle.get(circle.id, [])
         result.append(
             CircleResponse(
                 id=circle.id,
@@ -85,7 +114,9 @@ async def get_my_circles(
                 owner_id=circle.owner_id,
                 owner_name=owner_name,
                 members=members_list,
-                member_count=member_count,
+                member_count=total_members,
+                members_next_cursor=None,  # every member is embedded here
+                current_user_role=CircleRole(role),
                 created_at=circle.created_at
             )
         )
@@ -154,80 +185,99 @@ async def create_circle(
             )
         ],
         member_count=1,
+        members_next_cursor=None,
+        current_user_role=CircleRole.OWNER,
         created_at=new_circle.created_at
     )
 
 
-@router.get("/{circle_id}", response_model=CircleResponse)
-async def get_circle(
+def _role_rank() -> ColumnElement[int]:
+    """SQL expression ranking roles owner < moderator < member"""
+    return case(
+        {role.value: rank for role, rank in ROLE_RANK.items()},
+        value=CircleMember.role,
+        else_=len(ROLE_RANK),
+    )
+
+
+async def _load_member_page(
+    db: AsyncSession,
     circle_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_from_session)
-) -> CircleResponse:
+    limit: int,
+    cursor: str | None = None
+) -> tuple[list[CircleMemberResponse], str | None]:
     """
-    Get circle details by ID
-    User must be a member to view
+    Load one page of circle members ordered by role, then joined_at
+    Uses keyset pagination on (role rank, joined_at, user_id), so every page
+    costs a single query no matter how deep the client scrolls.
     """
-    # Get circle with members
+    rank = _role_rank()
+    stmt = (
+        select(CircleMember, User.username)
+        .join(User, CircleMember.user_id == User.id)
+        .where(CircleMember.circle_id == circle_id)
+        .order_by(rank, CircleMember.joined_at, CircleMember.user_id)
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        try:
+            after_rank, after_joined, after_user = decode_cursor(cursor, 3)
+            after = (int(after_rank), datetime.fromisoformat(after_joined), int(after_user))
+        except (TypeError, ValueError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            ) from e
+        stmt = stmt.where(
+            tuple_(rank, CircleMember.joined_at, CircleMember.user_id) > tuple_(*after)
+        )
+
+    rows = (await db.execute(stmt)).all()
+    page = rows[:limit]
+    members = [_member_response(member, username) for member, username in page]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1][0]
+        next_cursor = encode_cursor(
+            ROLE_RANK.get(CircleRole(last.role), len(ROLE_RANK)), last.joined_at, last.user_id
+        )
+
+    return members, next_cursor
+
+
+async def _load_circle(db: AsyncSession, circle_id: int) -> CircleResponse:
+    """
+    Load a circle with owner name, member count and its first member page
+
+    Holds nothing specific to the caller (current_user_role stays unset), so
+    concurrent readers can share one load through single_flight.
+    """
+    owner = aliased(User)
+    member_count: ScalarSelect[int] = (
+        select(func.count())
+        .where(CircleMember.circle_id == Circle.id)
+        .correlate(Circle)
+        .scalar_subquery()
+    )
+
+    # Circle, owner name and member count in one query
     circle_result = await db.execute(
-        select(Circle)
+        select(Circle, owner.username, member_count)
+        .join(owner, Circle.owner_id == owner.id, isouter=True)
         .where(Circle.id == circle_id)
-        .options(selectinload(Circle.members))
     )
-    circle = circle_result.scalar_one_or_none()
+    row = circle_result.first()
 
-    if not circle:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Circle not found"
         )
 
-    # Check if user is a member
-    user_member = next(
-        (m for m in circle.members if m.user_id == current_user.id),
-        None
-    )
-    if not user_member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this circle"
-        )
-
-    # Get usernames for all members
-    member_responses = []
-    for member in circle.members:
-        user_result = await db.get(User, member.user_id)
-        if not user_result:
-            continue  # Skip if user not found (shouldn't happen)
-
-        # Handle role conversion if needed
-        if isinstance(member.role, str):
-            role_enum = CircleRole(member.role)
-        else:
-            role_enum = member.role
-
-        # Badge map for roles
-        badge_map = {
-            CircleRole.OWNER: "👑",
-            CircleRole.MODERATOR: "🛡️",
-            CircleRole.MEMBER: "👤"
-        }
-        badge = badge_map.get(role_enum, "👤")
-
-        member_responses.append(
-            CircleMemberResponse(
-                circle_id=member.circle_id,
-                user_id=member.user_id,
-                username=user_result.username,
-                role=role_enum,  # Use enum, not string
-                badge=badge,
-                joined_at=member.joined_at
-            )
-        )
-
-    # Get owner
-    owner = await db.get(User, circle.owner_id)
-    owner_name = owner.username if owner else None
+    circle, owner_name, total_members = row
+    members, next_cursor = await _load_member_page(db, circle.id, MEMBER_PAGE_SIZE)
 
     return CircleResponse(
         id=circle.id,
@@ -235,12 +285,120 @@ async def get_circle(
         description=circle.description,
         owner_id=circle.owner_id,
         owner_name=owner_name,
-        members=member_responses,
-        member_count=len(circle.members),
+        members=members,
+        member_count=total_members,
+        members_next_cursor=next_cursor,
+        current_user_role=None,  # set per caller by _circle_detail
         created_at=circle.created_at
     )
 
 
+async def _circle_detail(
+    db: AsyncSession,
+    circle_id: int,
+    current_user: User,
+    if_none_match: str | None = None
+) -> tuple[CircleResponse, str]:
+    """
+    Load a circle with its first member page, for a member of the circle
+
+    The caller's own check (circle version + role, one query) always runs
+    on the caller's session. The ETag is known right after it; when it
+    matches if_none_match, 304 is raised before anything else is loaded.
+    The circle itself is loaded once for all concurrent readers of the same
+    version and completed with each caller's role.
+
+    Returns:
+        (circle response, ETag)
+    """
+    access_result = await db.execute(
+        select(Circle.version, CircleMember.role)
+        .join(
+            CircleMember,
+            and_(CircleMember.circle_id == Circle.id, CircleMember.user_id == current_user.id),
+            isouter=True
+        )
+        .where(Circle.id == circle_id)
+    )
+    access = access_result.first()
+
+    if not access:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Circle not found"
+        )
+
+    version, current_role = access
+
+    # Check if user is a member
+    if current_role is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a member of this circle"
+        )
+
+    etag = make_etag("circle", circle_id, version, current_role)
+    check_not_modified(if_none_match, etag)
+
+    circle = await single_flight.do(
+        ("GET /circles/{circle_id}", circle_id, version),
+        lambda: _load_circle(db, circle_id)
+    )
+    return circle.model_copy(update={"current_user_role": CircleRole(current_role)}), etag
+
+
+# Session lookup (when not cached) + version/role check + circle load + first member page
+@router.get("/{circle_id}", response_model=CircleResponse, dependencies=[Depends(query_budget(4))])
+async def get_circle(
+    circle_id: int,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_session)
+) -> CircleResponse:
+    """
+    Get circle details by ID
+    User must be a member to view
+
+    Only the first page of members is embedded; the rest is available from
+    GET /circles/{circle_id}/members using members_next_cursor.
+    Supports If-None-Match (304) via an ETag derived from the circle version.
+    """
+    circle, etag = await _circle_detail(db, circle_id, current_user, if_none_match)
+    set_validators(response, etag)
+    return circle
+
+
+@router.get("/{circle_id}/members", response_model=CircleMemberPage)
+async def get_circle_members(
+    circle_id: int,
+    limit: Annotated[int, Query(ge=1, le=MEMBER_PAGE_MAX)] = MEMBER_PAGE_SIZE,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_from_session)
+) -> CircleMemberPage:
+    """
+    List circle members, ordered by role then joined_at
+    User must be a member to view. Pass next_cursor back as ?cursor=
+    to fetch the following page.
+    """
+    membership = await db.execute(
+        select(CircleMember.role)
+        .where(
+            CircleMember.circle_id == circle_id,
+            CircleMember.user_id == current_user.id
+        )
+    )
+    if membership.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a member of this circle"
+        )
+
+    members, next_cursor = await _load_member_page(db, circle_id, limit, cursor)
+    return CircleMemberPage(members=members, next_cursor=next_cursor)
+
+
 @router.put("/{circle_id}", response_model=CircleResponse)
 async def update_circle(
     circle_id: int,
@@ -269,12 +427,15 @@ async def update_circle(
     # Update fields
     circle.name = circle_data.name
     circle.description = circle_data.description
+    await bump_circle_version(db, circle_id)
 
     await db.commit()
     await db.refresh(circle)
+    await invalidate_circle_feeds(db, circle_id)  # feed pages show the circle name
 
     # Return updated circle
-    return await get_circle(circle_id, db, current_user)
+    updated, _ = await _circle_detail(db, circle_id, current_user)
+    return updated
 
 
 @router.delete("/{circle_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -301,16 +462,23 @@ async def delete_circle(
             detail="Only the circle owner can delete it"
         )
 
+    # Members whose cached feed shows this circle's posts (read before the
+    # cascade removes the memberships)
+    member_ids = (await db.scalars(
+        select(CircleMember.user_id).where(CircleMember.circle_id == circle_id)
+    )).all()
+
     # Delete circle (cascade will delete members and posts)
     await db.delete(circle)
     await db.commit()
+    feed_cache.invalidate_users(member_ids)
 
 @router.put("/{circle_id}/name", response_model=CircleResponse)
 async def update_circle_name(
     circle_id: int,
     request: dict,  # {"name": "New Circle Name"}
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_endpoint)
+    current_user: User = Depends(get_current_user_from_session)
 ) -> CircleResponse:
     """
     Update circle name (owner only)
@@ -349,8 +517,11 @@ async def update_circle_name(
 
     # 4. Update name
     circle.name = new_name
+    await bump_circle_version(db, circle_id)
     await db.commit()
     await db.refresh(circle)
+    await invalidate_circle_feeds(db, circle_id)
 
     # 5. Return updated circle
-    return await get_circle(circle_id, db, current_user)
+    updated, _ = await _circle_detail(db, circle_id, current_user)
+    return updated
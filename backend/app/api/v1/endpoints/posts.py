@@ -1,45 +1,131 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import desc, select
+from datetime import datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy import Select, desc, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoints.auth import get_current_user_from_session
+from app.core.config import settings
 from app.core.db import get_db
-from app.db.models import Circle, CircleMember, Post, User
+from app.core.feed_cache import feed_cache
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.query_log import query_budget
+from app.core.single_flight import single_flight
+from app.db.feed import fan_out_post_in_background, invalidate_circle_feeds
+from app.db.models import Circle, CircleMember, FeedItem, Post, User
 from app.schemas.social import PostCreate, PostResponse
 
 router: APIRouter = APIRouter(prefix="/posts", tags=["Posts"])
 
 
-@router.get("/feed", response_model=list[PostResponse])
+def feed_query(
+    user_id: int,
+    limit: int,
+    offset: int = 0,
+    after: tuple[datetime, int] | None = None
+) -> Select[Post, str, str | None]:
+    """
+    Build the feed statement: newest first, ties broken by id
+
+    The user's circles are resolved inside Postgres (semi-join on
+    circle_members), so membership count never turns into a Python list
+    or a giant IN (...) parameter list.
+
+    With after=(created_at, id) of the last post already seen the page starts
+    right behind it (keyset pagination), so deep pages cost the same as the
+    first one. offset is only kept for older clients.
+    """
+    member_circles = select(CircleMember.circle_id).where(CircleMember.user_id == user_id)
+    stmt = (
+        select(Post, User.username, Circle.name)
+        .join(User, Post.author_id == User.id)
+        .join(Circle, Post.circle_id == Circle.id, isouter=True)
+        .where(Post.circle_id.in_(member_circles))
+        .order_by(desc(Post.created_at), desc(Post.id))
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Post.created_at, Post.id) < tuple_(*after))
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+def materialized_feed_query(
+    user_id: int,
+    limit: int,
+    offset: int = 0,
+    after: tuple[datetime, int] | None = None
+) -> Select[Post, str, str | None]:
+    """
+    Same page as feed_query, read from the feed_items table (FEED_MODE="write")
+    A single index range scan over the user's feed rows.
+    """
+    stmt = (
+        select(Post, User.username, Circle.name)
+        .select_from(FeedItem)
+        .join(Post, FeedItem.post_id == Post.id)
+        .join(User, Post.author_id == User.id)
+        .join(Circle, Post.circle_id == Circle.id, isouter=True)
+        .where(FeedItem.user_id == user_id)
+        .order_by(desc(FeedItem.created_at), desc(FeedItem.post_id))
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(FeedItem.created_at, FeedItem.post_id) < tuple_(*after))
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+@router.get("/feed", response_model=list[PostResponse], dependencies=[Depends(query_budget(2))])
 async def get_feed(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user_from_session),
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str | None = None
 ) -> list[PostResponse]:
     """
     Get recent posts from user's circles (dashboard feed)
     Returns posts from circles where user is a member
-    """
-    # 1. Get all circles where user is a member
-    member_circles = await db.execute(
-        select(CircleMember.circle_id).where(CircleMember.user_id == current_user.id)
-    )
-    circle_ids = [row[0] for row in member_circles.fetchall()]
 
-    if not circle_ids:
-        return []  # User has no circles, return empty feed
-
-    # 2. Get posts from those circles with author AND circle info
-    posts_result = await db.execute(
-        select(Post, User.username, Circle.name)
-        .join(User, Post.author_id == User.id)
-        .join(Circle, Post.circle_id == Circle.id, isouter=True)
-        .where(Post.circle_id.in_(circle_ids))
-        .order_by(desc(Post.created_at))
-        .offset(offset)
-        .limit(limit)
-    )
+    When the page is full, the X-Next-Cursor response header carries an
+    opaque cursor; send it back as ?cursor= (instead of offset) for the
+    next page. The first pages (offset only) are served from feed_cache.
+    """
+    cacheable = cursor is None and feed_cache.cacheable(limit, offset)
+    if cacheable:
+        cached = feed_cache.get(current_user.id, limit, offset)
+        if cached is not None:
+            cached_posts, next_cursor = cached
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return cached_posts
+    epoch = feed_cache.epoch
+
+    after = None
+    if cursor:
+        try:
+            created_at, post_id = decode_cursor(cursor, 2)
+            after = (datetime.fromisoformat(created_at), int(post_id))
+        except (TypeError, ValueError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            ) from e
+
+    if settings.FEED_MODE == "write":
+        # Precomputed on write: read the user's feed rows directly
+        posts_result = await db.execute(
+            materialized_feed_query(current_user.id, limit, offset, after)
+        )
+    else:
+        # Posts from the user's circles with author AND circle info, in one statement
+        posts_result = await db.execute(
+            feed_query(current_user.id, limit, offset, after)
+        )
 
     # 3. Convert to response model with REAL author names and circle names
     feed_posts = []
@@ -59,12 +145,22 @@ async def get_feed(
             )
         )
 
+    next_cursor = None
+    if feed_posts and len(feed_posts) == limit:
+        last = feed_posts[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    if cacheable:
+        feed_cache.put(current_user.id, limit, offset, feed_posts, next_cursor, epoch)
+
     return feed_posts
 
 
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_data: PostCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user_from_session)
 ) -> PostResponse:
@@ -104,6 +200,15 @@ async def create_post(
     await db.commit()
     await db.refresh(new_post)
 
+    # Fan out to members' materialized feeds after the response is sent
+    # (the background task drops their cached pages once the rows exist)
+    if settings.FEED_MODE == "write" and new_post.circle_id:
+        background_tasks.add_task(
+            fan_out_post_in_background, new_post.id, new_post.circle_id, new_post.created_at
+        )
+    elif new_post.circle_id:
+        await invalidate_circle_feeds(db, new_post.circle_id)
+
     return PostResponse(
         id=new_post.id,
         title=new_post.title,
@@ -212,11 +317,15 @@ async def delete_post(
             detail="You don't have permission to delete this post"
         )
 
+    circle_id = post.circle_id
     await db.delete(post)
     await db.commit()
 
+    if circle_id:
+        await invalidate_circle_feeds(db, circle_id)
 
-@router.get("/circle/{circle_id}", response_model=list[PostResponse])
+
+@router.get("/circle/{circle_id}", response_model=list[PostResponse], dependencies=[Depends(query_budget(4))])
 async def get_circle_posts(
     circle_id: int,
     db: AsyncSession = Depends(get_db),
@@ -227,6 +336,9 @@ async def get_circle_posts(
     """
     Get posts from a specific circle
     User must be a member of the circle
+
+    Membership is checked for every caller; the page itself is loaded once
+    for all concurrent requests of the same page (single_flight).
     """
     # Check if user is a member
     membership = await db.execute(
@@ -242,6 +354,14 @@ async def get_circle_posts(
             detail="You are not a member of this circle"
         )
 
+    return await single_flight.do(
+        ("GET /posts/circle/{circle_id}", circle_id, limit, offset),
+        lambda: _load_circle_posts(db, circle_id, limit, offset)
+    )
+
+
+async def _load_circle_posts(db: AsyncSession, circle_id: int, limit: int, offset: int) -> list[PostResponse]:
+    """One page of a circle's posts with author and circle names (same for every member)"""
     # Get the circle name (ia o singură dată)
     circle = await db.get(Circle, circle_id)
 
@@ -250,7 +370,7 @@ async def get_circle_posts(
         select(Post, User.username)
         .join(User, Post.author_id == User.id)
         .where(Post.circle_id == circle_id)
-        .order_by(desc(Post.created_at))
+        .order_by(desc(Post.created_at), desc(Post.id))
         .offset(offset)
         .limit(limit)
     )
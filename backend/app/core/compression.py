@@ -0,0 +1,289 @@
+"""
+Response compression
+Content-negotiated zstd, brotli or gzip for API responses. brotli and
+zstd come from the `brotli` / `zstandard` dependencies and are skipped if
+either is missing; gzip (zlib) is always available.
+"""
+import zlib
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any, Protocol
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+brotli: ModuleType | None
+zstandard: ModuleType | None
+
+try:
+    import brotli  # type: ignore[import-untyped, no-redef]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+
+    def compress(self, data: bytes) -> bytes:
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        return self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        if brotli is None:
+            raise RuntimeError("br encoding needs the brotli package")
+        self._brotli = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._brotli.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._brotli.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._brotli.finish())
+
+
+class ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        if zstandard is None:
+            raise RuntimeError("zstd encoding needs the zstandard package")
+        self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._zstd.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._zstd.flush(self._flush_block))
+
+    def finish(self) -> bytes:
+        return bytes(self._zstd.flush())
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """Encoders this process can produce, in server preference order"""
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = lambda: ZstdEncoder(settings.COMPRESSION_ZSTD_LEVEL)
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(settings.COMPRESSION_BROTLI_QUALITY)
+    encoders["gzip"] = lambda: GzipEncoder(settings.COMPRESSION_GZIP_LEVEL)
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: list[str]) -> str | None:
+    """
+    Pick the content coding for an Accept-Encoding header (RFC 9110 12.5.3)
+
+    Highest client q-value wins; ties go to the earlier entry of supported.
+    "*" covers codings not listed explicitly; q=0 rejects a coding.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+_COMPRESSIBLE_TYPES = (b"text/", b"application/json", b"application/javascript", b"application/xml", b"image/svg+xml")
+
+
+class CompressionMiddleware:
+    """
+    Compresses HTTP responses the client accepts in a compressed coding
+
+    Skipped when the response:
+    - is smaller than minimum_size (single-body responses only)
+    - already has a Content-Encoding (never compressed twice)
+    - is not a text/JSON type, or is a 204/304 or HEAD response
+    - carries Cache-Control: no-transform
+    - lives under an excluded prefix; auth responses are excluded by default
+      because they mix secrets (session tokens) with reflected input (BREACH)
+
+    Cache-Control (including no-store from SecurityHeadersMiddleware) is
+    left as it is; Vary: Accept-Encoding is added so shared caches keep
+    encodings apart, and strong ETags become weak because the bytes differ
+    from the identity representation. The ETag is weakened for every
+    response to a request that negotiated a coding - also the 304s and the
+    bodies too small to compress - so a 304 always repeats the validator of
+    the 200 it stands for. Streaming responses are compressed chunk by
+    chunk, each chunk flushed so clients are not kept waiting.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        exclude_prefixes: tuple[str, ...] | None = None,
+        encoders: dict[str, Callable[[], Encoder]] | None = None
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else settings.COMPRESSION_MIN_SIZE
+        self.exclude_prefixes = (
+            exclude_prefixes if exclude_prefixes is not None
+            else tuple(settings.COMPRESSION_EXCLUDE_PREFIXES)
+        )
+        self.encoders = encoders if encoders is not None else available_encoders()
+        self._supported = list(self.encoders)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or (
+            self.exclude_prefixes and scope["path"].startswith(self.exclude_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        coding = negotiate_encoding(accept, self._supported) if accept else None
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponder(self, coding)(scope, receive, send)
+
+
+class _CompressedResponder:
+    """Per-request state: holds back the response start until the body size is known"""
+
+    def __init__(self, middleware: CompressionMiddleware, coding: str) -> None:
+        self.middleware = middleware
+        self.coding = coding
+        self.start: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start = message
+            self.passthrough = not self._compressible(message)
+            if self.passthrough:
+                if message["status"] == 304:
+                    message["headers"] = self._negotiated_headers(message.get("headers", ()))
+                await self.send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        assert self.start is not None  # nosec B101 - ASGI guarantees start before body
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # Small single-body response: not worth the CPU
+                self.passthrough = True
+                self.start["headers"] = self._negotiated_headers(self.start["headers"])
+                await self.send(self.start)
+                await self.send(message)
+                return
+
+            self.encoder = self.middleware.encoders[self.coding]()
+            headers = self._encoded_headers(self.start["headers"])
+            if not more_body:
+                payload = self.encoder.compress(body) + self.encoder.finish()
+                headers.append((b"content-length", str(len(payload)).encode()))
+                self.start["headers"] = headers
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": payload})
+                return
+
+            # Streaming: length unknown up front
+            self.start["headers"] = headers
+            await self.send(self.start)
+
+        if more_body:
+            payload = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            payload = self.encoder.compress(body) + self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+    @staticmethod
+    def _compressible(start: Message) -> bool:
+        if start["status"] in (204, 304) or start["status"] < 200:
+            return False
+        content_type = b""
+        for name, value in start.get("headers", ()):
+            if name == b"content-encoding":
+                return False
+            if name == b"cache-control" and b"no-transform" in value.lower():
+                return False
+            if name == b"content-type":
+                content_type = value.lower()
+        return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+    def _encoded_headers(self, raw_headers: Any) -> list[tuple[bytes, bytes]]:
+        """Response headers for the encoded body (without Content-Length)"""
+        headers = self._negotiated_headers(raw_headers, keep_length=False)
+        headers.append((b"content-encoding", self.coding.encode()))
+        return headers
+
+    @staticmethod
+    def _negotiated_headers(raw_headers: Any, keep_length: bool = True) -> list[tuple[bytes, bytes]]:
+        """Headers with a weak ETag and Vary: Accept-Encoding, whether or not the body is encoded"""
+        headers: list[tuple[bytes, bytes]] = []
+        vary = None
+        for name, value in raw_headers:
+            if name == b"content-length" and not keep_length:
+                continue
+            if name == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            if name == b"vary":
+                vary = value
+                continue
+            headers.append((name, value))
+
+        if vary is None:
+            vary = b"accept-encoding"
+        elif b"accept-encoding" not in vary.lower() and vary.strip() != b"*":
+            vary = vary + b", accept-encoding"
+        headers.append((b"vary", vary))
+        return headers
@@ -0,0 +1,51 @@
+"""
+Conditional GET
+Strong ETags built from cheap version data, and If-None-Match handling so
+that unchanged resources are answered with 304 before the heavy loading.
+"""
+import hashlib
+
+from fastapi import HTTPException, Response, status
+
+# Per-user data the browser may keep but must revalidate before every use.
+# Responses without their own Cache-Control get no-store from
+# SecurityHeadersMiddleware.
+REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag over the given version data (ids, counters, timestamps)"""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match evaluation (RFC 9110 13.1.2)
+
+    Uses the weak comparison, so W/"x" from a client matches "x": the
+    compression middleware weakens ETags of the responses it encodes.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_not_modified(if_none_match: str | None, etag: str, cache_control: str = REVALIDATE) -> None:
+    """Raise 304 Not Modified when the client already holds this ETag"""
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+
+
+def set_validators(response: Response, etag: str, cache_control: str = REVALIDATE) -> None:
+    """Attach the ETag and the route's cache policy to a 200 response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
@@ -26,6 +26,21 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = ""  # loaded from .env
 
+    # Database - connection pool (per worker process; see app.core.db.make_engine)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # replace connections older than this (seconds)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements; 0 behind pgbouncer
+    DB_ECHO: bool = False  # log every SQL statement (development only)
+
+    # Database - slow-query log (statement text and parameter types, never values)
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 200
+    QUERY_LOG_SAMPLE_RATE: float = 0.001  # share of normal queries logged as samples
+    QUERY_BUDGET_ENFORCED: bool = False  # raise when an endpoint exceeds query_budget() (dev/CI)
+
     # Security - JWT Tokens
     SECRET_KEY: str = ""  # loaded from .env
     ALGORITHM: str = "HS256"
@@ -35,16 +50,114 @@ class Settings(BaseSettings):
     SESSION_SECRET_KEY: str = ""  # loaded from .env
     SESSION_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
 
+    # Security - Signed session tokens (opt-in, see app.core.signed_sessions)
+    # "database": every request is authenticated by its user_sessions row (or the session cache)
+    # "signed": a short-lived signed cookie authenticates without the database;
+    #           the user_sessions row is only checked to issue a new one
+    SESSION_TOKEN_MODE: str = "database"
+    SIGNED_SESSION_TTL_SECONDS: int = 300  # also how long a logout is kept in the revocation set
+    SIGNED_SESSION_REVOCATION_SYNC_SECONDS: float = 1.0  # logout propagation delay to other workers
+
+    # Security - Session cache (per worker; TTL bounds cross-worker staleness)
+    SESSION_CACHE_ENABLED: bool = True
+    SESSION_CACHE_TTL_SECONDS: int = 60
+    SESSION_CACHE_MAX_SIZE: int = 10_000
+
+    # Security - Expired session cleanup (background task, safe on many workers)
+    SESSION_REAPER_ENABLED: bool = True
+    SESSION_REAPER_INTERVAL_SECONDS: int = 300
+    SESSION_REAPER_BATCH_SIZE: int = 500
+    SESSION_REAPER_MAX_BATCHES: int = 20
+    SESSION_REAPER_BATCH_PAUSE_SECONDS: float = 0.5
+
+    # Security - Password hashing pool
+    # Argon2 runs off the event loop in a "thread" or "process" pool. Calls beyond
+    # workers + queue size are rejected with 503 instead of piling up.
+    PASSWORD_HASH_POOL: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+
+    # Security - Argon2 costs (defaults are the argon2-cffi ones). Pick values for
+    # the deployment hardware with scripts/calibrate_argon2.py; stored hashes
+    # are rehashed with the new costs on each user's next login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
+    # Feed
+    # "read": computed from circle memberships on every request
+    # "write": served from feed_items, filled when posts are created
+    #          (run scripts/backfill_feed_items.py before switching)
+    FEED_MODE: str = "read"
+    FEED_BACKFILL_LIMIT: int = 200  # recent posts copied into a new member's feed
+
+    # Feed - page cache (per worker; writes invalidate the affected users)
+    FEED_CACHE_ENABLED: bool = True
+    FEED_CACHE_TTL_SECONDS: int = 15
+    FEED_CACHE_PAGES: int = 3  # only the first N pages of each user are cached
+    FEED_CACHE_MAX_PAGE_SIZE: int = 50
+    FEED_CACHE_MAX_ENTRIES: int = 20_000
+
+    # Read coalescing: concurrent identical GET /circles/{id} and
+    # /posts/circle/{id} loads share one set of queries (per worker)
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Rate limiting (slowapi / limits)
+    # "bounded-memory://?max_keys=N": per worker, LRU-bounded
+    # "sqlite:///dev/shm/discsecops-ratelimit.db": shared by all workers on the host
+    #   (?busy_timeout_ms=N caps the lock wait; a busy check fails open)
+    # "redis://host:6379": shared across hosts (needs the redis package)
+    RATE_LIMIT_STORAGE_URI: str = "bounded-memory://?max_keys=100000"
+    RATE_LIMIT_STRATEGY: str = "sliding-window-counter"  # O(1) per key
+
+    # Rate limiting - per-username login backoff (per worker), checked before
+    # the user lookup and Argon2 verify. After FREE_FAILURES failures each one
+    # blocks the username for BASE_DELAY * 2^n seconds, up to MAX_DELAY.
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_THROTTLE_FREE_FAILURES: int = 5
+    LOGIN_THROTTLE_BASE_DELAY_SECONDS: float = 1.0
+    LOGIN_THROTTLE_MAX_DELAY_SECONDS: float = 300.0
+    LOGIN_THROTTLE_RESET_SECONDS: float = 900.0  # forget a username after this long without failures
+    LOGIN_THROTTLE_MAX_ENTRIES: int = 100_000
+
     # CORS
     ALLOWED_ORIGINS: list[str] = [
         "http://localhost:3000",
         "https://discsecops.github.io"
     ]
 
+    # Logging (JSON lines on stdout, written by a background thread)
+    LOG_LEVEL: str = "INFO"
+    LOG_SUCCESS_SAMPLE_RATE: float = 1.0  # share of successful request logs kept
+    LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {}  # per route, e.g. {"GET /health": 0.0}
+
+    # Readiness (GET /ready serves the result of a background probe)
+    READINESS_PROBE_INTERVAL_SECONDS: float = 5
+    READINESS_PROBE_TIMEOUT_SECONDS: float = 2
+    READINESS_FAILURE_THRESHOLD: int = 2  # consecutive failed probes before 503
+    READINESS_MAX_POOL_SATURATION: float = 1.0  # checked out / (pool_size + max_overflow)
+    READINESS_MAX_LOOP_LAG_MS: float = 500
+
+    # Metrics (GET /metrics, Prometheus text format, per worker process)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""  # when set, scrapers must send "Authorization: Bearer <token>"
+
     # Environment
     ENVIRONMENT: str = "development"  # overridden in production
     FRONTEND_URL: str = "http://localhost:3000"  # used for CSP
 
+    # Security headers: path prefixes served without them (static assets)
+    SECURITY_HEADERS_EXCLUDE_PREFIXES: list[str] = []
+
+    # Response compression (zstd / br need the zstandard / brotli packages)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller single-body responses go out as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    # Secrets next to reflected input make compressed responses a BREACH oracle
+    COMPRESSION_EXCLUDE_PREFIXES: list[str] = ["/api/v1/auth"]
+
 
 # Global settings instance
 settings = Settings()
@@ -1,17 +1,120 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool, Pool
 
 from app.core.config import settings
+from app.core.query_log import QueryLog
 
-# Create an asynchronous engine to connect to the PostgreSQL database
-# The DATABASE_URL is loaded from settings, which defaults to the local dev container DB
-# or can be overridden by an environment variable (e.g., for Neon).
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+def make_engine(url: str | None = None, **overrides: Any) -> AsyncEngine:
+    """
+    Create an async engine configured from Settings
+
+    The app, the scripts and Alembic all build their engines here, so pool
+    sizing, pre-ping, recycling and the asyncpg statement cache are tuned in
+    one place. Keyword arguments override the defaults (for example
+    poolclass=NullPool for one-shot tools).
+
+    Args:
+        url: Database URL (defaults to settings.DATABASE_URL)
+        **overrides: Extra or replacement create_async_engine arguments
+    """
+    db_url = make_url(url or settings.DATABASE_URL)
+    options: dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if overrides.get("poolclass") is not NullPool:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    if db_url.drivername.endswith("+asyncpg"):
+        # SQLAlchemy keeps its own prepared statement cache on top of asyncpg's;
+        # both must follow the setting (0 for transaction-pooling proxies)
+        cache_size = settings.DB_STATEMENT_CACHE_SIZE
+        options["connect_args"] = {"statement_cache_size": cache_size}
+        if "prepared_statement_cache_size" not in db_url.query:
+            db_url = db_url.update_query_dict({"prepared_statement_cache_size": str(cache_size)})
+    options.update(overrides)
+    return create_async_engine(db_url, **options)
+
+
+class PoolMonitor:
+    """
+    Connection pool counters for monitoring
+
+    Listens to pool events of one engine. Counters are cumulative since
+    startup; checked_out / max_checked_out show current and peak usage
+    against the pool_size + max_overflow limit.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._pool: Pool = engine.sync_engine.pool
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.max_checked_out = 0
+
+        event.listen(self._pool, "connect", self._on_connect)
+        event.listen(self._pool, "checkout", self._on_checkout)
+        event.listen(self._pool, "checkin", self._on_checkin)
+        event.listen(self._pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        self.checkouts += 1
+        self.max_checked_out = max(self.max_checked_out, self.checkouts - self.checkins)
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of pool usage and counters"""
+        pool: Any = self._pool
+        limit = None
+        if hasattr(pool, "size"):
+            limit = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        return {
+            "pool": type(pool).__name__,
+            "limit": limit,
+            "checked_out": self.checkouts - self.checkins,
+            # connections open beyond pool_size right now
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else None,
+            "max_checked_out": self.max_checked_out,
+            "idle": pool.checkedin() if hasattr(pool, "checkedin") else None,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+        }
+
+
+# Application engine: one pool per worker process
+engine = make_engine()
+pool_monitor = PoolMonitor(engine)
+# Always attached: per-request query counts feed Server-Timing and the request log
+query_log = QueryLog(
+    engine,
+    slow_ms=settings.SLOW_QUERY_MS if settings.SLOW_QUERY_LOG_ENABLED else float("inf"),
+    sample_rate=settings.QUERY_LOG_SAMPLE_RATE if settings.SLOW_QUERY_LOG_ENABLED else 0.0,
+    enforce_budgets=settings.QUERY_BUDGET_ENFORCED,
+)
 
 # Create a sessionmaker for asynchronous sessions
 # expire_on_commit=False prevents objects from being expired after commit,
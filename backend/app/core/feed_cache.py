@@ -0,0 +1,151 @@
+"""
+In-process feed page cache
+Keeps the first few pages of each user's dashboard feed so repeated loads
+skip the feed query. Writes that change a feed invalidate exactly the users
+whose feed they touch (see app.db.feed.invalidate_circle_feeds).
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import settings
+
+# (user_id, limit, offset)
+FeedKey = tuple[int, int, int]
+
+
+class FeedCache:
+    """
+    TTL + LRU cache of (user, page) -> rendered feed page
+
+    Only offset pages within the first `pages` pages of at most
+    max_page_size posts are cached, so memory is bounded by
+    max_entries * max_page_size posts. Like the session cache, it is per
+    worker: the TTL bounds how long a write handled by another worker can
+    go unnoticed.
+
+    A read that started before an invalidation must not store its (possibly
+    stale) result afterwards. Callers take `epoch` before querying and pass
+    it to put(); any invalidation in between bumps the epoch and the put is
+    dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        pages: int,
+        max_page_size: int,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.pages = pages
+        self.max_page_size = max_page_size
+        self._clock = clock
+        self._entries: OrderedDict[FeedKey, tuple[float, list[Any], str | None]] = OrderedDict()
+        self._keys_by_user: dict[int, set[FeedKey]] = {}
+        self.epoch = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def cacheable(self, limit: int, offset: int) -> bool:
+        """Whether a feed request for this page may be served from the cache"""
+        return (
+            self.max_entries > 0
+            and 0 < limit <= self.max_page_size
+            and 0 <= offset < limit * self.pages
+        )
+
+    def get(self, user_id: int, limit: int, offset: int) -> tuple[list[Any], str | None] | None:
+        """Return (posts, next_cursor) for a page, or None on a miss"""
+        key = (user_id, limit, offset)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        deadline, posts, next_cursor = entry
+        if deadline <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return posts, next_cursor
+
+    def put(
+        self,
+        user_id: int,
+        limit: int,
+        offset: int,
+        posts: list[Any],
+        next_cursor: str | None,
+        epoch: int
+    ) -> None:
+        """Store a page computed while the cache was at `epoch`"""
+        if epoch != self.epoch or not self.cacheable(limit, offset):
+            return
+
+        key = (user_id, limit, offset)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (self._clock() + self.ttl_seconds, posts, next_cursor)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_users(self, user_ids: Any) -> None:
+        """Drop every cached page of the given users"""
+        self.epoch += 1
+        for user_id in user_ids:
+            keys = self._keys_by_user.get(user_id)
+            if not keys:
+                continue
+            self.invalidations += 1
+            for key in list(keys):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.epoch += 1
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _remove(self, key: FeedKey) -> None:
+        if self._entries.pop(key, None) is None:
+            return
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of size and hit ratio"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "users": len(self._keys_by_user),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+feed_cache = FeedCache(
+    max_entries=settings.FEED_CACHE_MAX_ENTRIES if settings.FEED_CACHE_ENABLED else 0,
+    ttl_seconds=settings.FEED_CACHE_TTL_SECONDS,
+    pages=settings.FEED_CACHE_PAGES,
+    max_page_size=settings.FEED_CACHE_MAX_PAGE_SIZE,
+)
@@ -1,9 +1,14 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core import rate_limit_storage  # noqa: F401 - registers bounded-memory:// and sqlite://
 from app.core.config import settings  # adjust if your settings path differs
 
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+)
 
 # Disable rate limiting in non-production environments
 if settings.ENVIRONMENT != "production":
@@ -0,0 +1,119 @@
+"""
+Per-username login throttle
+Counts failed logins per username and backs off exponentially, so a
+username under credential stuffing is rejected before the user lookup and
+the Argon2 verify instead of costing a hash per attempt. Complements the
+per-IP "5/minute" limit, which does not see attacks spread over many IPs.
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import settings
+
+
+class LoginThrottle:
+    """
+    Bounded table of username -> (failures, blocked_until, last_failure_at)
+
+    The first free_failures failures are not delayed. After that each one
+    blocks the username for base_delay * 2**n seconds, capped at max_delay.
+    While past the free budget, an admitted attempt reserves the next slot
+    right away, so a burst of parallel guesses gets one verify per slot,
+    not one each. A success clears the entry; so does reset_seconds
+    without a failure.
+
+    Once max_entries usernames are tracked the least recently failed one
+    is forgotten. Each worker process has its own table.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        free_failures: int,
+        base_delay: float,
+        max_delay: float,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_entries = max_entries
+        self.free_failures = free_failures
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[int, float, float]] = OrderedDict()
+
+        self.rejected = 0
+        self.evictions = 0
+
+    def _delay(self, failures: int) -> float:
+        over = failures - self.free_failures
+        if over < 0:
+            return 0.0
+        return min(self.base_delay * float(2 ** min(over, 32)), self.max_delay)
+
+    def _entry(self, username: str, now: float) -> tuple[int, float, float] | None:
+        entry = self._entries.get(username)
+        if entry is not None and now - entry[2] > self.reset_seconds:
+            del self._entries[username]
+            return None
+        return entry
+
+    def check(self, username: str) -> float:
+        """Seconds until username may try again; 0 admits the attempt"""
+        if self.max_entries <= 0:
+            return 0.0
+        now = self._clock()
+        entry = self._entry(username, now)
+        if entry is None:
+            return 0.0
+
+        failures, blocked_until, last_failure_at = entry
+        if blocked_until > now:
+            self.rejected += 1
+            return blocked_until - now
+        if failures >= self.free_failures:
+            self._entries[username] = (failures, now + self._delay(failures), last_failure_at)
+        return 0.0
+
+    def record_failure(self, username: str) -> None:
+        """Count a failed attempt and start its backoff"""
+        if self.max_entries <= 0:
+            return
+        now = self._clock()
+        entry = self._entry(username, now)
+        failures = (entry[0] if entry else 0) + 1
+
+        self._entries[username] = (failures, now + self._delay(failures - 1), now)
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def record_success(self, username: str) -> None:
+        self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the table size and rejections"""
+        now = self._clock()
+        return {
+            "tracked": len(self._entries),
+            "blocked": sum(1 for _, blocked_until, _ in self._entries.values() if blocked_until > now),
+            "max_entries": self.max_entries,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+        }
+
+
+login_throttle = LoginThrottle(
+    max_entries=settings.LOGIN_THROTTLE_MAX_ENTRIES if settings.LOGIN_THROTTLE_ENABLED else 0,
+    free_failures=settings.LOGIN_THROTTLE_FREE_FAILURES,
+    base_delay=settings.LOGIN_THROTTLE_BASE_DELAY_SECONDS,
+    max_delay=settings.LOGIN_THROTTLE_MAX_DELAY_SECONDS,
+    reset_seconds=settings.LOGIN_THROTTLE_RESET_SECONDS,
+)
@@ -0,0 +1,55 @@
+"""
+Keyset (cursor) pagination helpers
+Cursors are opaque to clients: a url-safe base64 encoding of the sort key
+of the last row on the previous page.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor
+
+    Args:
+        values: Sort key values (ints, strings or datetimes)
+
+    Returns:
+        URL-safe cursor string
+
+    Example:
+        cursor = encode_cursor(post.created_at, post.id)
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string sent back by the client
+        size: Expected number of sort key values
+
+    Returns:
+        List of raw sort key values (datetimes are left as ISO strings)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
@@ -0,0 +1,140 @@
+"""
+Slow-query log and per-request query accounting
+Times every statement through engine events, adds it to the current
+request's RequestDbStats and logs the slow ones (plus a random sample of the
+rest) with the route that issued them. Replaces echo=True: parameter values
+are never logged, only their types.
+"""
+import logging
+import random
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.request_context import current_route, request_db_stats
+
+logger = logging.getLogger("app.sql")
+
+MAX_STATEMENT_LENGTH = 2000
+_WHITESPACE = re.compile(r"\s+")
+
+# Transaction control, not data access: not counted against query budgets
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """An endpoint ran more statements than it declared (QUERY_BUDGET_ENFORCED only)"""
+
+
+def query_budget(limit: int) -> Callable[[], None]:
+    """
+    Route dependency declaring how many SQL statements an endpoint may run
+
+        @router.get("/my", dependencies=[Depends(query_budget(3))])
+
+    The whole request counts, including the session lookup. Exceeding the
+    budget is logged; with QUERY_BUDGET_ENFORCED it raises instead.
+    """
+    def _declare() -> None:
+        stats = request_db_stats.get()
+        if stats is not None:
+            stats.query_budget = limit
+    return _declare
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """
+    Describe bound parameters by type only
+
+    (1, "bob") -> ["int", "str"]; {"id": 1} -> {"id": "int"};
+    executemany batches -> {"rows": n, "row": <shape of the first row>}
+    """
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list) and parameters and isinstance(parameters[0], (dict, list, tuple)):
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class QueryLog:
+    """
+    Statement timer attached to one engine
+
+    Statements taking at least slow_ms are logged as "slow_query" warnings;
+    the others are logged as "query_sample" with probability sample_rate.
+    With enforce_budgets, a statement beyond the request's query budget
+    raises QueryBudgetExceeded before it is sent.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        slow_ms: float,
+        sample_rate: float,
+        enforce_budgets: bool = False
+    ) -> None:
+        self.slow_ms = slow_ms
+        self.sample_rate = sample_rate
+        self.enforce_budgets = enforce_budgets
+        self.statements = 0
+        self.slow = 0
+
+        self._engine = engine.sync_engine
+        event.listen(self._engine, "before_cursor_execute", self._before)
+        event.listen(self._engine, "after_cursor_execute", self._after)
+
+    def remove(self) -> None:
+        """Detach from the engine"""
+        event.remove(self._engine, "before_cursor_execute", self._before)
+        event.remove(self._engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if self.enforce_budgets:
+            stats = request_db_stats.get()
+            if (
+                stats is not None
+                and stats.query_budget is not None
+                and stats.queries >= stats.query_budget
+                and not statement.lstrip().upper().startswith(_SAVEPOINT_PREFIXES)
+            ):
+                raise QueryBudgetExceeded(
+                    f"{current_route()} exceeded its budget of {stats.query_budget} queries"
+                )
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        starts = conn.info.get("query_start_time")
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        self.statements += 1
+
+        stats = request_db_stats.get()
+        if stats is not None:
+            stats.db_ms += duration_ms
+            if not statement.lstrip().upper().startswith(_SAVEPOINT_PREFIXES):
+                stats.queries += 1
+
+        if duration_ms >= self.slow_ms:
+            self.slow += 1
+            self._log(logging.WARNING, "slow_query", statement, parameters, duration_ms)
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:  # nosec B311 - log sampling
+            self._log(logging.INFO, "query_sample", statement, parameters, duration_ms)
+
+    def _log(self, level: int, event_name: str, statement: str, parameters: Any, duration_ms: float) -> None:
+        logger.log(level, {
+            "event": event_name,
+            "duration_ms": round(duration_ms, 2),
+            "route": current_route(),
+            "statement": _WHITESPACE.sub(" ", statement).strip()[:MAX_STATEMENT_LENGTH],
+            "params": parameter_shape(parameters),
+        })
+
+    def stats(self) -> dict[str, Any]:
+        return {"statements": self.statements, "slow": self.slow, "slow_ms": self.slow_ms}
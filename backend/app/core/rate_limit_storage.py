@@ -0,0 +1,303 @@
+"""
+Rate limit storages
+Backends for the `limits` library (used by slowapi) that keep O(1) state
+per key and a bounded number of keys:
+
+- bounded-memory://?max_keys=N       per worker process, LRU-bounded dict
+- sqlite:///dev/shm/<file>?max_keys=N&busy_timeout_ms=M  one SQLite file
+  shared by every worker on the host (tmpfs, so it never touches disk)
+
+Both implement the sliding window counter: a key holds the counts of the
+current and the previous fixed window, and the previous one is weighted by
+how much of it still overlaps the sliding window. For several hosts use a
+Redis-compatible server with the built-in redis:// storage of `limits`.
+
+Importing this module registers the schemes with `limits`.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Callable
+from math import floor
+from typing import Any, TypeVar
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+
+T = TypeVar("T")
+
+logger = logging.getLogger("app.rate_limit")
+
+
+def _option(uri: str | None, options: dict[str, Any], name: str, default: int) -> int:
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(uri or "").query)
+    return int(options.get(name, query.get(name, [default])[0]))
+
+
+def _roll(window_start: float, previous: int, current: int, expiry: int, now: float) -> tuple[float, int, int]:
+    """Advance a (window_start, previous, current) state to the window containing now"""
+    start = floor(now / expiry) * expiry
+    if start == window_start:
+        return window_start, previous, current
+    if start - window_start == expiry:
+        return start, current, 0
+    return start, 0, 0
+
+
+def _window_info(state: tuple[float, int, int], expiry: int, now: float) -> tuple[int, float, int, float]:
+    """(previous count, previous TTL, current count, current TTL) as `limits` expects"""
+    start, previous, current = state
+    return previous, start + expiry - now, current, start + 2 * expiry - now
+
+
+def _admit(state: tuple[float, int, int], limit: int, expiry: int, amount: int, now: float) -> bool:
+    previous, previous_ttl, current, _ = _window_info(state, expiry, now)
+    return floor(previous * previous_ttl / expiry + current) + amount <= limit
+
+
+class BoundedMemoryStorage(Storage, SlidingWindowCounterSupport):
+    """
+    Per-process storage with at most max_keys keys (least recently used evicted)
+
+    The default memory:// storage of `limits` keeps a key per client and
+    window until a timer thread expires it, so memory grows with the number
+    of distinct IPs. Here a key costs one small tuple and the table never
+    exceeds max_keys; an evicted client simply starts over with an empty
+    window.
+    """
+
+    STORAGE_SCHEME = ["bounded-memory"]
+    DEFAULT_MAX_KEYS = 100_000
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options: Any) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        self.max_keys = _option(uri, options, "max_keys", self.DEFAULT_MAX_KEYS)
+        # key -> (window_start, previous, current); fixed windows: (expires_at, 0, count)
+        self._keys: OrderedDict[str, tuple[float, int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return ValueError
+
+    def _store(self, key: str, state: tuple[float, int, int]) -> None:
+        self._keys[key] = state
+        self._keys.move_to_end(key)
+        if len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+            self.evictions += 1
+
+    # Sliding window counter
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._lock:
+            state = _roll(*self._keys.get(key, (0.0, 0, 0)), expiry, now)
+            if not _admit(state, limit, expiry, amount, now):
+                self._store(key, state)
+                return False
+            self._store(key, (state[0], state[1], state[2] + amount))
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        with self._lock:
+            state = _roll(*self._keys.get(key, (0.0, 0, 0)), expiry, now)
+        return _window_info(state, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        self.clear(key)
+
+    # Fixed window (incr / get / get_expiry)
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._lock:
+            expires_at, _, count = self._keys.get(key, (0.0, 0, 0))
+            if expires_at <= now:
+                expires_at, count = now + expiry, 0
+            count += amount
+            self._store(key, (expires_at, 0, count))
+            return count
+
+    def get(self, key: str) -> int:
+        expires_at, _, count = self._keys.get(key, (0.0, 0, 0))
+        return count if expires_at > time.time() else 0
+
+    def get_expiry(self, key: str) -> float:
+        return self._keys.get(key, (time.time(), 0, 0))[0]
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> int | None:
+        with self._lock:
+            count = len(self._keys)
+            self._keys.clear()
+        return count
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+
+
+class SqliteStorage(Storage, SlidingWindowCounterSupport):
+    """
+    Host-wide storage: one SQLite database shared by all worker processes
+
+    Put the file on tmpfs (/dev/shm) so it lives in shared memory. Every
+    check is one short write transaction (BEGIN IMMEDIATE), which serializes
+    workers on the file lock. slowapi checks limits synchronously on the
+    event loop, so waiting for that lock stalls the worker: the wait is
+    capped at busy_timeout_ms, and a check that cannot get the lock in time
+    fails open (the request is admitted and counted in busy_skips). The
+    table is pruned back to max_keys rows, least recently used first, after
+    every PRUNE_EVERY writes.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+    DEFAULT_MAX_KEYS = 100_000
+    DEFAULT_BUSY_TIMEOUT_MS = 5
+    PRUNE_EVERY = 1000
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options: Any) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+        parsed = urllib.parse.urlparse(uri or "sqlite:///dev/shm/discsecops-ratelimit.db")
+        self.path = parsed.path or "/dev/shm/discsecops-ratelimit.db"
+        self.max_keys = _option(uri, options, "max_keys", self.DEFAULT_MAX_KEYS)
+        self.busy_timeout = _option(uri, options, "busy_timeout_ms", self.DEFAULT_BUSY_TIMEOUT_MS) / 1000
+        self.busy_skips = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._writes = 0
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not cross fork(): uvicorn workers open their own
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # counters are disposable
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                " key TEXT PRIMARY KEY, window_start REAL NOT NULL,"
+                " previous INTEGER NOT NULL, current INTEGER NOT NULL, touched REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_rate_limits_touched ON rate_limits (touched)")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _load(self, conn: sqlite3.Connection, key: str) -> tuple[float, int, int]:
+        row = conn.execute(
+            "SELECT window_start, previous, current FROM rate_limits WHERE key = ?", (key,)
+        ).fetchone()
+        return (row[0], row[1], row[2]) if row else (0.0, 0, 0)
+
+    def _save(self, conn: sqlite3.Connection, key: str, state: tuple[float, int, int], now: float) -> None:
+        conn.execute(
+            "INSERT INTO rate_limits (key, window_start, previous, current, touched) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET window_start = excluded.window_start,"
+            " previous = excluded.previous, current = excluded.current, touched = excluded.touched",
+            (key, *state, now),
+        )
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            conn.execute(
+                "DELETE FROM rate_limits WHERE key IN ("
+                " SELECT key FROM rate_limits ORDER BY touched DESC LIMIT -1 OFFSET ?)",
+                (self.max_keys,),
+            )
+
+    def _transact(
+        self,
+        key: str,
+        step: Callable[[tuple[float, int, int], float], tuple[tuple[float, int, int], T]],
+        on_busy: T
+    ) -> T:
+        """Read, change and write one key in a single write transaction; on_busy if the lock is taken"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError:
+                # Another worker held the write lock past busy_timeout: fail open
+                self.busy_skips += 1
+                if self.busy_skips % self.PRUNE_EVERY == 1:
+                    logger.warning({"event": "rate_limit_storage_busy", "path": self.path, "busy_skips": self.busy_skips})
+                return on_busy
+            try:
+                state, result = step(self._load(conn, key), now)
+                self._save(conn, key, state, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    # Sliding window counter
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+
+        def step(stored: tuple[float, int, int], now: float) -> tuple[tuple[float, int, int], bool]:
+            state = _roll(*stored, expiry, now)
+            if not _admit(state, limit, expiry, amount, now):
+                return state, False
+            return (state[0], state[1], state[2] + amount), True
+
+        return self._transact(key, step, on_busy=True)
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        with self._lock:
+            state = _roll(*self._load(self._connection(), key), expiry, now)
+        return _window_info(state, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        self.clear(key)
+
+    # Fixed window: stored as (expires_at, 0, count)
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        def step(stored: tuple[float, int, int], now: float) -> tuple[tuple[float, int, int], int]:
+            expires_at, _, count = stored
+            if expires_at <= now:
+                expires_at, count = now + expiry, 0
+            return (expires_at, 0, count + amount), count + amount
+
+        return self._transact(key, step, on_busy=0)
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            expires_at, _, count = self._load(self._connection(), key)
+        return count if expires_at > time.time() else 0
+
+    def get_expiry(self, key: str) -> float:
+        with self._lock:
+            expires_at = self._load(self._connection(), key)[0]
+        return expires_at or time.time()
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection().execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        with self._lock:
+            return self._connection().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
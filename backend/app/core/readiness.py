@@ -0,0 +1,160 @@
+"""
+Readiness probe
+A background task checks the database (SELECT 1) on an interval and
+measures event-loop lag; GET /ready only reads the cached result and the
+live pool counters, so probes cost no database round trip.
+"""
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.db import engine, pool_monitor
+
+logger = logging.getLogger("app.readiness")
+
+
+def engine_probe(db_engine: AsyncEngine) -> Callable[[], Awaitable[None]]:
+    """SELECT 1 on a pooled connection"""
+    async def probe() -> None:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    return probe
+
+
+class ReadinessMonitor:
+    """
+    Cached database health, pool saturation and event-loop lag
+
+    Not ready when:
+    - no probe has succeeded yet (starting), the last failure_threshold
+      probes failed, or the last result is older than 3 intervals (the
+      probe task itself is stuck)
+    - pool saturation (checked out / pool_size + max_overflow) reaches
+      max_pool_saturation
+    - the event loop woke up more than max_loop_lag_ms late
+
+    The probe runs with its own timeout, so an exhausted pool or a hung
+    server counts as a failure instead of blocking the loop.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[None]],
+        pool_stats: Callable[[], dict[str, Any]],
+        interval: float,
+        timeout: float,
+        failure_threshold: int,
+        max_pool_saturation: float,
+        max_loop_lag_ms: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._probe = probe
+        self._pool_stats = pool_stats
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.max_pool_saturation = max_pool_saturation
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self._clock = clock
+
+        self.last_probe_at: float | None = None
+        self.last_success_at: float | None = None
+        self.last_probe_ms = 0.0
+        self.last_error: str | None = None
+        self.consecutive_failures = 0
+        self.loop_lag_ms = 0.0
+
+    async def probe_once(self) -> bool:
+        """Run one database probe and record the result"""
+        start = self._clock()
+        try:
+            await asyncio.wait_for(self._probe(), timeout=self.timeout)
+        except Exception as e:
+            self.consecutive_failures += 1
+            self.last_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            ok = False
+            if self.consecutive_failures == self.failure_threshold:
+                logger.warning({"event": "readiness_db_down", "error": self.last_error})
+        else:
+            if self.consecutive_failures >= self.failure_threshold:
+                logger.info({"event": "readiness_db_up"})
+            self.consecutive_failures = 0
+            self.last_error = None
+            self.last_success_at = self._clock()
+            ok = True
+        self.last_probe_at = self._clock()
+        self.last_probe_ms = (self.last_probe_at - start) * 1000
+        return ok
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Probe loop started from the app lifespan; returns once stop is set"""
+        while True:
+            await self.probe_once()
+
+            # Loop lag: how late the timeout fires compared to when it was due
+            due = self._clock() + self.interval
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.interval)
+                return
+            except TimeoutError:
+                pass
+            self.loop_lag_ms = max(self._clock() - due, 0.0) * 1000
+
+    def state(self) -> dict[str, Any]:
+        """
+        Cached readiness verdict with the reasons behind it
+
+        Reasons are fixed codes; the probe's exception text stays in
+        last_error and the readiness_db_down log line.
+        """
+        now = self._clock()
+        pool = self._pool_stats()
+        limit = pool.get("limit")
+        saturation = pool["checked_out"] / limit if limit else 0.0
+
+        reasons = []
+        if self.last_success_at is None:
+            reasons.append("starting" if self.last_probe_at is None else "database_unreachable")
+        elif self.consecutive_failures >= self.failure_threshold:
+            reasons.append("database_unreachable")
+        if self.last_probe_at is not None and now - self.last_probe_at > 3 * self.interval:
+            reasons.append("probe_stale")
+        if saturation >= self.max_pool_saturation:
+            reasons.append("pool_saturated")
+        if self.loop_lag_ms > self.max_loop_lag_ms:
+            reasons.append("event_loop_lag")
+
+        return {
+            "ready": not reasons,
+            "reasons": reasons,
+            "database": {
+                "ok": self.last_success_at is not None and self.consecutive_failures < self.failure_threshold,
+                "probe_ms": round(self.last_probe_ms, 2),
+                "probe_age_s": round(now - self.last_probe_at, 2) if self.last_probe_at is not None else None,
+                "consecutive_failures": self.consecutive_failures,
+            },
+            "pool": {
+                "checked_out": pool["checked_out"],
+                "limit": limit,
+                "saturation": round(saturation, 3),
+            },
+            "event_loop_lag_ms": round(self.loop_lag_ms, 2),
+        }
+
+
+# Global monitor for the application engine (probe loop started from the app lifespan)
+readiness_monitor = ReadinessMonitor(
+    probe=engine_probe(engine),
+    pool_stats=pool_monitor.stats,
+    interval=settings.READINESS_PROBE_INTERVAL_SECONDS,
+    timeout=settings.READINESS_PROBE_TIMEOUT_SECONDS,
+    failure_threshold=settings.READINESS_FAILURE_THRESHOLD,
+    max_pool_saturation=settings.READINESS_MAX_POOL_SATURATION,
+    max_loop_lag_ms=settings.READINESS_MAX_LOOP_LAG_MS,
+)
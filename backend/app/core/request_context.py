@@ -0,0 +1,59 @@
+"""
+Request context
+Per-request state shared with code that has no access to the Request
+object (database event hooks, loggers).
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import Scope
+
+# Id of the request being handled (X-Request-ID), added to every log record
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# ASGI scope of the request being handled (set by the logging middleware).
+# Routing fills in scope["route"] later, so read it lazily.
+request_scope: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+
+@dataclass
+class RequestDbStats:
+    """SQL statements run for one request (filled by app.core.query_log)"""
+    queries: int = 0
+    db_ms: float = 0.0
+    query_budget: int | None = None  # declared by the endpoint via query_budget()
+
+    def server_timing(self) -> str:
+        """Server-Timing header value"""
+        return f'db;dur={self.db_ms:.2f};desc="{self.queries} queries"'
+
+    @property
+    def over_budget(self) -> bool:
+        return self.query_budget is not None and self.queries > self.query_budget
+
+
+request_db_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, e.g. /api/v1/circles/{circle_id}
+
+    The route only knows its path relative to the router it was included
+    in, so the include prefix is taken from the concrete request path.
+    Falls back to the raw path when no route matched.
+    """
+    path = str(scope.get("path", ""))
+    template = getattr(scope.get("route"), "path", None)
+    if not template:
+        return path
+    prefix = path.rsplit("/", template.count("/"))[0]
+    return prefix + str(template)
+
+
+def current_route() -> str | None:
+    """'METHOD /template' of the current request, or None outside a request"""
+    scope = request_scope.get()
+    if scope is None:
+        return None
+    return f"{scope.get('method', '')} {route_template(scope)}".strip()
@@ -0,0 +1,227 @@
+"""
+Request logging
+JSON log records shipped through a QueueHandler/QueueListener (the request
+task only enqueues; a background thread writes to stdout) and a pure-ASGI
+middleware that times each request, assigns it a request id and emits one
+http_request log line.
+"""
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import (
+    http_request_db_queries_total,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    method_label,
+    route_label,
+)
+from app.core.request_context import (
+    RequestDbStats,
+    request_db_stats,
+    request_id,
+    request_scope,
+    route_template,
+)
+
+logger = logging.getLogger("app.request")
+
+# Incoming X-Request-ID values are reused only if they look like an id
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{8,64}$")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record
+    Dict messages (the logger.info({"event": ...}) style used across the
+    app) are merged into the object; anything else becomes "message".
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        rid = getattr(record, "request_id", None)
+        if rid:
+            entry["request_id"] = rid
+        if isinstance(record.msg, dict):
+            entry.update(record.msg)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request id (runs in the caller's thread, before queueing)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def configure_logging(level: str = "INFO") -> QueueListener:
+    """
+    Route all logging through a queue to a background writer thread
+
+    Records are formatted to JSON by the QueueHandler in the calling thread
+    (so context variables such as the request id are still available) and
+    written to stdout by the listener. Safe to call more than once.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(JsonFormatter())
+    queue_handler.addFilter(RequestIdFilter())
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+    _queue_handler = queue_handler
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _sample_rate(route: str) -> float:
+    return settings.LOG_ROUTE_SAMPLE_RATES.get(route, settings.LOG_SUCCESS_SAMPLE_RATE)
+
+
+class RequestLoggingMiddleware:
+    """
+    Pure-ASGI request timing and logging
+
+    - request id: reuses a well-formed X-Request-ID header or generates one,
+      and returns it in the X-Request-ID response header
+    - Server-Timing: SQL statement count / DB time (see app.core.query_log)
+      and time to first response byte
+    - one http_request log line per request; successful requests are sampled
+      per route (LOG_ROUTE_SAMPLE_RATES, default LOG_SUCCESS_SAMPLE_RATE),
+      errors are always logged
+    - Prometheus request metrics (app.core.metrics), never sampled
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        rid = self._request_id(scope)
+        db_stats = RequestDbStats()
+        status_code = 500
+        http_requests_in_flight.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                headers = message.setdefault("headers", [])
+                headers.append((b"x-request-id", rid.encode()))
+                headers.append((
+                    b"server-timing",
+                    f"{db_stats.server_timing()}, app;dur={elapsed_ms:.2f}".encode()
+                ))
+            await send(message)
+
+        id_token = request_id.set(rid)
+        scope_token = request_scope.set(scope)  # lets the slow-query log name the route
+        stats_token = request_db_stats.set(db_stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            http_requests_in_flight.dec()
+            self._observe(scope, status_code, duration_ms, db_stats)
+            self._log(scope, status_code, duration_ms, db_stats)
+            request_db_stats.reset(stats_token)
+            request_scope.reset(scope_token)
+            request_id.reset(id_token)
+
+    @staticmethod
+    def _request_id(scope: Scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                candidate: str = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(candidate):
+                    return candidate
+                break
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def _observe(scope: Scope, status_code: int, duration_ms: float, db_stats: RequestDbStats) -> None:
+        method, route = method_label(scope["method"]), route_label(scope)
+        http_requests_total.inc(method, route, str(status_code))
+        http_request_duration_seconds.observe(duration_ms / 1000, method, route)
+        if db_stats.queries:
+            http_request_db_queries_total.inc(method, route, amount=db_stats.queries)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, duration_ms: float, db_stats: RequestDbStats) -> None:
+        route = f"{scope['method']} {route_template(scope)}"
+        if db_stats.over_budget:
+            logger.warning({
+                "event": "query_budget_exceeded",
+                "route": route,
+                "db_queries": db_stats.queries,
+                "query_budget": db_stats.query_budget
+            })
+
+        if status_code < 400:
+            rate = _sample_rate(route)
+            if rate <= 0 or (rate < 1 and random.random() >= rate):  # nosec B311 - log sampling
+                return
+
+        client = scope.get("client")
+        logger.log(logging.INFO if status_code < 500 else logging.ERROR, {
+            "event": "http_request",
+            "method": scope["method"],
+            "url": scope["path"],
+            "route": route,
+            "status_code": status_code,
+            "duration_ms": round(duration_ms, 2),
+            "db_queries": db_stats.queries,
+            "db_ms": round(db_stats.db_ms, 2),
+            "ip": client[0] if client else "unknown"
+        })
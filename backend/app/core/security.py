@@ -2,18 +2,33 @@
 Security utilities for authentication
 Handles password hashing, JWT tokens, and session management
 """
+import asyncio
+import hashlib
 import secrets
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
 from app.core.config import settings
+from app.core.metrics import password_hash_duration_seconds
 
-# Password hasher using Argon2 (more secure than bcrypt)
-pwd_context = PasswordHash((Argon2Hasher(),))
+# Password hasher using Argon2 (more secure than bcrypt). Costs come from the
+# settings (see scripts/calibrate_argon2.py); hashes made with other costs
+# still verify and are rehashed on the next login.
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+        parallelism=settings.ARGON2_PARALLELISM,
+    ),
+))
 
 
 # ============================================================================
@@ -34,6 +49,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify a password and rehash it if its Argon2 costs differ from the settings
+
+    Returns:
+        (valid, new_hash) - new_hash is None unless the password is valid and
+        the stored hash should be replaced (costs raised or lowered)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password using Argon2
@@ -50,6 +76,197 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def measure_argon2_ms(time_cost: int, memory_cost: int, parallelism: int, rounds: int = 5) -> float:
+    """Median wall-clock milliseconds of one Argon2 verify with these costs"""
+    hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed = hasher.hash("calibration-password")
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hasher.verify("calibration-password", hashed)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def calibrate_argon2(
+    target_ms: float,
+    max_memory_kib: int,
+    parallelism: int,
+    min_memory_kib: int = 19 * 1024,
+    measure: Callable[[int, int, int], float] = measure_argon2_ms
+) -> dict[str, Any]:
+    """
+    Pick Argon2 costs whose verify takes about target_ms on this machine
+
+    Memory is what makes Argon2 expensive to attack, so it is maxed out
+    first: start at max_memory_kib with time_cost=1 and halve the memory
+    (not below min_memory_kib) until one pass fits the target. The
+    remaining budget then goes to extra passes, which scale linearly.
+
+    Returns:
+        {"time_cost", "memory_cost", "parallelism", "verify_ms"}
+    """
+    memory_cost = max_memory_kib
+    elapsed = measure(1, memory_cost, parallelism)
+    while elapsed > target_ms and memory_cost // 2 >= min_memory_kib:
+        memory_cost //= 2
+        elapsed = measure(1, memory_cost, parallelism)
+
+    # Linear estimate, then step to the largest time_cost that still fits (the
+    # first pass also pays for filling the memory, so later passes are cheaper)
+    time_cost = max(1, int(target_ms // elapsed))
+    elapsed = measure(time_cost, memory_cost, parallelism)
+    while elapsed > target_ms and time_cost > 1:
+        time_cost -= 1
+        elapsed = measure(time_cost, memory_cost, parallelism)
+    while elapsed <= target_ms:
+        longer = measure(time_cost + 1, memory_cost, parallelism)
+        if longer > target_ms:
+            break
+        time_cost, elapsed = time_cost + 1, longer
+
+    return {
+        "time_cost": time_cost,
+        "memory_cost": memory_cost,
+        "parallelism": parallelism,
+        "verify_ms": round(elapsed, 1),
+    }
+
+
+# ============================================================================
+# ASYNC PASSWORD HASHING (worker pool)
+# ============================================================================
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing pool is saturated (served as 503)"""
+
+
+class PasswordHashPool:
+    """
+    Bounded worker pool for Argon2 hashing and verification
+
+    Argon2 is deliberately slow, so running it inline blocks the event loop
+    for every other request on the worker. Calls are sent to a thread or
+    process pool instead; once workers + queue_size calls are pending, new
+    calls fail fast with PasswordHasherBusyError.
+    """
+
+    def __init__(self, kind: str, workers: int, queue_size: int) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash pool: {kind!r}")
+        self.kind = kind
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self._executor: Executor | None = None
+
+        # Metrics (only touched from the event loop thread)
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0  # successful calls only; they alone feed the latency stats
+        self.failed = 0  # raised or cancelled while pending
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="argon2"
+                )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) in the pool, or raise PasswordHasherBusyError if full"""
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Password hashing pool is saturated")
+
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        elapsed = time.perf_counter() - start
+        password_hash_duration_seconds.observe(elapsed)
+        self.completed += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of queue depth and hash latency"""
+        return {
+            "pool": self.kind,
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "queue_depth": self.pending,
+            "max_queue_depth": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_latency_ms": (
+                round(self.total_seconds / self.completed * 1000, 2) if self.completed else 0.0
+            ),
+            "max_latency_ms": round(self.max_seconds * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers (called from the app lifespan)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    settings.PASSWORD_HASH_POOL,
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_QUEUE_SIZE,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the hashing pool without blocking the event loop
+
+    Raises:
+        PasswordHasherBusyError: If the pool queue is full
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    verify_and_update_password in the hashing pool (rehashing costs a second Argon2 run)
+
+    Raises:
+        PasswordHasherBusyError: If the pool queue is full
+    """
+    return await password_hash_pool.run(verify_and_update_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in the hashing pool without blocking the event loop
+
+    Raises:
+        PasswordHasherBusyError: If the pool queue is full
+    """
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 # ============================================================================
 # JWT TOKEN MANAGEMENT
 # ============================================================================
@@ -124,6 +341,19 @@ def create_session_token() -> str:
     return secrets.token_hex(32)
 
 
+def hash_session_token(token: str) -> bytes:
+    """
+    SHA-256 digest of a session token, as stored in user_sessions.token_hash
+
+    Tokens are 256-bit random values, so an unsalted fast hash is enough: a
+    leaked table cannot be turned back into usable cookies.
+
+    Returns:
+        32-byte digest
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
 def create_session_expiry(hours: int = 24) -> datetime:
     """
     Create session expiration datetime
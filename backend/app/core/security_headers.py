@@ -1,13 +1,106 @@
 from typing import Any
 
-from starlette.types import Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
+# (name, value) pairs, lower-case names as ASGI expects
+HeaderBlock = tuple[tuple[bytes, bytes], ...]
+
+
+def build_security_headers(environment: str, frontend_url: str) -> HeaderBlock:
+    """
+    Security header block for one environment, computed once at startup
+    """
+    # Content Security Policy
+    csp = (
+        f"default-src 'self'; "                         # Allow resources same origin
+        f"script-src 'self'; "                          # Allow scripts from same origin
+        f"style-src 'self' 'unsafe-inline'; "           # Allow inline styles (for simplicity, but could be tightened)
+        f"img-src 'self' data:; "                       # Allow images from same origin
+        f"connect-src 'self' {frontend_url}; "          # Allow API calls to frontend
+        f"frame-ancestors 'none';"                      # Disallow framing
+    )
+
+    headers = [
+        # Basic security headers
+        (b"x-frame-options", b"DENY"),                              # No <iframe> embedding
+        (b"x-content-type-options", b"nosniff"),                    # No content or MIME-sniffing
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),   # No private data in referrer
+        (b"permissions-policy", b"geolocation=()"),                 # No geolocation access
+
+        # Cache control (default; routes with their own policy keep it)
+        (b"cache-control", b"no-store"),
+
+        (b"content-security-policy", csp.encode()),
+    ]
+
+    # HSTS only in production
+    if environment == "production":
+        headers.append(
+            (b"strict-transport-security", b"max-age=63072000; includeSubDomains; preload")
+        )
+
+    return tuple(headers)
+
+
+class _SecuredSend:
+    """
+    send() wrapper that adds the header block to the response start
+
+    A slotted object built per request instead of a closure: no cell
+    variables and no new function object for every request.
+    """
+
+    __slots__ = ("send", "full_block", "keep_cache_block")
+
+    def __init__(self, send: Send, full_block: HeaderBlock, keep_cache_block: HeaderBlock) -> None:
+        self.send = send
+        self.full_block = full_block
+        self.keep_cache_block = keep_cache_block
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers: Any = message.setdefault("headers", [])
+            block = self.full_block
+            for name, _ in headers:
+                if name == b"cache-control":
+                    block = self.keep_cache_block
+                    break
+            if isinstance(headers, list):
+                headers.extend(block)
+            else:
+                message["headers"] = [*headers, *block]
+        await self.send(message)
+
 
 class SecurityHeadersMiddleware:
-    def __init__(self, app: Any) -> None:
+    """
+    Adds the security header block to every HTTP response
+
+    The block is built once when the middleware is created and appended to
+    the response headers in a single extend. A Cache-Control set by the route
+    (e.g. revalidation for ETag-backed endpoints) wins over the no-store
+    default. Paths under exclude_prefixes (static assets) are passed through
+    untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        headers: HeaderBlock | None = None,
+        exclude_prefixes: tuple[str, ...] | None = None
+    ) -> None:
         self.app = app
+        self.headers = headers if headers is not None else build_security_headers(
+            settings.ENVIRONMENT, settings.FRONTEND_URL
+        )
+        self.exclude_prefixes = (
+            exclude_prefixes if exclude_prefixes is not None
+            else tuple(settings.SECURITY_HEADERS_EXCLUDE_PREFIXES)
+        )
+        # Same block minus Cache-Control, for responses that bring their own
+        self.headers_keep_cache = tuple(h for h in self.headers if h[0] != b"cache-control")
 
     async def __call__(
         self,
@@ -15,37 +108,10 @@ class SecurityHeadersMiddleware:
         receive: Receive,
         send: Send,
     ) -> None:
+        if scope["type"] != "http" or (
+            self.exclude_prefixes and scope["path"].startswith(self.exclude_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        async def send_wrapper(message: dict[str, Any]) -> None:
-            if message.get("type") == "http.response.start":
-                headers = message.setdefault("headers", [])
-
-                # Basic security headers
-                headers.append((b"x-frame-options", b"DENY"))                               # No <iframe> embedding
-                headers.append((b"x-content-type-options", b"nosniff"))                     # No content or MIME-sniffing
-                headers.append((b"referrer-policy", b"strict-origin-when-cross-origin"))    # No private data in referrer
-                headers.append((b"permissions-policy", b"geolocation=()"))                  # No geolocation access
-
-                # Cache control
-                headers.append((b"cache-control", b"no-store"))
-
-                # Content Security Policy
-                csp = (
-                    f"default-src 'self'; "                         # Allow resources same origin
-                    f"script-src 'self'; "                          # Allow scripts from same origin
-                    f"style-src 'self' 'unsafe-inline'; "           # Allow inline styles (for simplicity, but could be tightened)
-                    f"img-src 'self' data:; "                       # Allow images from same origin
-                    f"connect-src 'self' {settings.FRONTEND_URL}; " # Allow API calls to frontend
-                    f"frame-ancestors 'none';"                      # Disallow framing
-                )
-                headers.append((b"content-security-policy", csp.encode()))
-
-                # HSTS only in production
-                if settings.ENVIRONMENT == "production":
-                    headers.append(
-                        (b"strict-transport-security", b"max-age=63072000; includeSubDomains; preload")
-                    )
-
-            await send(message)
-
-        await self.app(scope, receive, send_wrapper)
+        await self.app(scope, receive, _SecuredSend(send, self.headers, self.headers_keep_cache))
@@ -0,0 +1,123 @@
+"""
+In-process session cache
+Maps a session token to a snapshot of the authenticated user so that warm
+requests authenticate without any database round trip.
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from app.core.config import settings
+from app.db.models import User
+
+# User columns kept in the snapshot (never the password hash)
+USER_SNAPSHOT_FIELDS = (
+    "id", "username", "email", "full_name", "is_active", "created_at", "updated_at"
+)
+
+
+class SessionCache:
+    """
+    TTL + LRU cache of session token -> user snapshot
+
+    Entries expire after ttl_seconds or when the session itself expires,
+    whichever comes first. Once max_size entries are stored, the least
+    recently used one is evicted. Each worker process has its own cache, so
+    the TTL bounds how long a logout on another worker can go unnoticed.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._tokens_by_user: dict[int, set[str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> User | None:
+        """Return a fresh (detached) User for token, or None on a miss"""
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        deadline, snapshot = entry
+        if deadline <= self._clock():
+            self._remove(token)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return User(**snapshot)
+
+    def put(self, token: str, user: User, session_expires_at: datetime) -> None:
+        """Cache user for token until the TTL or the session expiry"""
+        remaining = (session_expires_at - datetime.now()).total_seconds()
+        if remaining <= 0 or self.max_size <= 0:
+            return
+
+        snapshot = {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+        deadline = self._clock() + min(self.ttl_seconds, remaining)
+
+        if token in self._entries:
+            self._remove(token)
+        self._entries[token] = (deadline, snapshot)
+        self._tokens_by_user.setdefault(user.id, set()).add(token)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, token: str) -> None:
+        """Drop a single session (logout)"""
+        self._remove(token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached session of a user (deactivation, profile change)"""
+        for token in list(self._tokens_by_user.get(user_id, ())):
+            self._remove(token)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_id = entry[1]["id"]
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of size and hit ratio"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_MAX_SIZE if settings.SESSION_CACHE_ENABLED else 0,
+    ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,115 @@
+"""
+Background cleanup of expired user sessions
+Login inserts a user_sessions row every time and only logout deletes one,
+so expired rows are purged here in small, rate-limited batches.
+"""
+import asyncio
+import logging
+import random
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.db.models import SessionRevocation, UserSession
+
+logger = logging.getLogger("app.session_reaper")
+
+
+async def purge_expired_sessions(db: AsyncSession, batch_size: int) -> int:
+    """
+    Delete one batch of expired sessions
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED, so several workers running
+    the reaper at once delete disjoint batches instead of blocking each other.
+
+    Args:
+        db: Database session
+        batch_size: Maximum number of rows to delete
+
+    Returns:
+        Number of deleted rows
+    """
+    expired_ids = (
+        select(UserSession.id)
+        .where(UserSession.expires_at <= datetime.now())
+        .order_by(UserSession.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(UserSession)
+        .where(UserSession.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def purge_expired_revocations(db: AsyncSession) -> int:
+    """
+    Delete session revocations no signed token can outlive any more
+
+    The table only holds the logouts of the last SIGNED_SESSION_TTL_SECONDS,
+    so one statement is enough.
+    """
+    result = await db.execute(
+        delete(SessionRevocation)
+        .where(SessionRevocation.expires_at <= datetime.now())
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def reap_expired_sessions_once() -> int:
+    """
+    Run one reaper pass: delete batches until none are full or the per-pass cap
+    is hit, then drop expired session revocations
+
+    Returns:
+        Total number of deleted sessions
+    """
+    total = 0
+    for _ in range(settings.SESSION_REAPER_MAX_BATCHES):
+        async with AsyncSessionLocal() as db:
+            deleted = await purge_expired_sessions(db, settings.SESSION_REAPER_BATCH_SIZE)
+        total += deleted
+        if deleted < settings.SESSION_REAPER_BATCH_SIZE:
+            break
+        # Rate limit: give other queries room between batches
+        await asyncio.sleep(settings.SESSION_REAPER_BATCH_PAUSE_SECONDS)
+
+    async with AsyncSessionLocal() as db:
+        await purge_expired_revocations(db)
+    return total
+
+
+async def run_session_reaper(stop: asyncio.Event) -> None:
+    """
+    Reaper loop started from the app lifespan; returns once stop is set
+
+    The first pass and every interval are jittered so workers started
+    together do not all hit the table at the same moment.
+    """
+    interval = settings.SESSION_REAPER_INTERVAL_SECONDS
+    delay = random.uniform(0, interval)  # nosec B311 - scheduling jitter, not security
+
+    while True:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=delay)
+            return
+        except TimeoutError:
+            pass
+
+        try:
+            deleted = await reap_expired_sessions_once()
+            if deleted:
+                logger.info({"event": "sessions_reaped", "deleted": deleted})
+        except Exception as e:
+            logger.warning({"event": "session_reaper_error", "error": str(e)})
+
+        delay = interval * random.uniform(0.9, 1.1)  # nosec B311
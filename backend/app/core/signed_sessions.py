@@ -0,0 +1,180 @@
+"""
+Signed session tokens (SESSION_TOKEN_MODE="signed")
+Next to the opaque session_token cookie, login sets a short-lived signed
+token (HS256 JWT with SECRET_KEY) carrying the session id and a snapshot of
+the user, so requests authenticate without touching the database. Once it
+expires, the user_sessions row - still the source of truth - is checked
+again and a new token is issued.
+
+The token is signed, not encrypted: anyone holding the cookie can read it,
+so the snapshot leaves out email and full_name (TOKEN_USER_FIELDS).
+
+Logout cannot recall a signed token, so the session id is revoked: recorded
+in session_revocations until the last token for it has expired, and
+mirrored in memory by every worker (synced every
+SIGNED_SESSION_REVOCATION_SYNC_SECONDS).
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+import jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.core.security import create_access_token, decode_token
+from app.db.models import SessionRevocation, User
+
+logger = logging.getLogger("app.signed_sessions")
+
+ACCESS_COOKIE = "session_access"
+TOKEN_TYPE = "session"
+
+# User columns embedded in the token: no PII, the JWT payload is only base64
+TOKEN_USER_FIELDS = ("id", "username", "is_active", "created_at", "updated_at")
+
+
+def signed_sessions_enabled() -> bool:
+    return settings.SESSION_TOKEN_MODE == "signed"
+
+
+def _encode(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def issue_session_token(user: User, session_id: int, session_expires_at: datetime) -> tuple[str, int]:
+    """
+    Sign a token for a user session
+
+    The embedded is_active is trusted until the token expires, so a
+    deactivated account keeps access for up to SIGNED_SESSION_TTL_SECONDS
+    unless its sessions are revoked (app.db.users.deactivate_user does:
+    at once on this worker, after the next revocation sync on the others).
+    Lower the TTL to shorten that window at the cost of more session lookups.
+
+    Returns:
+        (token, max_age in seconds) - never outlives the session itself
+    """
+    now = datetime.now()
+    lifetime = min(timedelta(seconds=settings.SIGNED_SESSION_TTL_SECONDS), session_expires_at - now)
+    claims = {
+        "typ": TOKEN_TYPE,
+        "sub": str(user.id),
+        "sid": session_id,
+        "usr": {field: _encode(getattr(user, field)) for field in TOKEN_USER_FIELDS},
+    }
+    return create_access_token(claims, expires_delta=lifetime), max(int(lifetime.total_seconds()), 0)
+
+
+def read_session_token(token: str | None) -> User | None:
+    """
+    Detached User from a valid, unrevoked token, or None (caller falls back to the database)
+
+    Only TOKEN_USER_FIELDS are set; email and full_name are None.
+    """
+    if not token:
+        return None
+    try:
+        claims = decode_token(token)
+    except jwt.PyJWTError:
+        return None
+    if claims.get("typ") != TOKEN_TYPE or session_revocations.is_revoked(claims["sid"]):
+        return None
+
+    snapshot = dict(claims["usr"])
+    for field in ("created_at", "updated_at"):
+        if snapshot.get(field) is not None:
+            snapshot[field] = datetime.fromisoformat(snapshot[field])
+    return User(**snapshot)
+
+
+def session_id_from_token(token: str | None) -> int | None:
+    """Session id of a token, signature checked but expiry ignored (logout)"""
+    if not token:
+        return None
+    try:
+        claims = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM], options={"verify_exp": False}
+        )
+    except jwt.PyJWTError:
+        return None
+    return claims.get("sid") if claims.get("typ") == TOKEN_TYPE else None
+
+
+class SessionRevocations:
+    """
+    In-memory mirror of session_revocations: session id -> expiry
+
+    Entries only live as long as a token could (SIGNED_SESSION_TTL_SECONDS),
+    so the set holds at most the logouts of the last TTL - a few KB where a
+    Bloom filter would save nothing and add false positives. A logout on
+    this worker is applied at once; other workers see it after their next
+    sync.
+    """
+
+    def __init__(self, ttl_seconds: float, sync_interval: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.sync_interval = sync_interval
+        self._revoked: dict[int, datetime] = {}
+        self.last_sync_at: datetime | None = None
+        self.sync_errors = 0
+
+    def is_revoked(self, session_id: int) -> bool:
+        expires_at = self._revoked.get(session_id)
+        return expires_at is not None and expires_at > datetime.now()
+
+    def revoke(self, db: AsyncSession, session_id: int) -> None:
+        """Revoke locally and add the row (committed by the caller)"""
+        expires_at = datetime.now() + timedelta(seconds=self.ttl_seconds)
+        self._revoked[session_id] = expires_at
+        db.add(SessionRevocation(session_id=session_id, expires_at=expires_at))
+
+    async def sync(self, db: AsyncSession) -> int:
+        """Replace the mirror with the live rows; returns their number"""
+        now = datetime.now()
+        rows = await db.execute(
+            select(SessionRevocation.session_id, SessionRevocation.expires_at)
+            .where(SessionRevocation.expires_at > now)
+        )
+        revoked = {session_id: expires_at for session_id, expires_at in rows.all()}
+        # Keep local revocations whose row is not committed / visible yet
+        for session_id, expires_at in self._revoked.items():
+            if expires_at > now:
+                revoked.setdefault(session_id, expires_at)
+        self._revoked = revoked
+        self.last_sync_at = now
+        return len(revoked)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Sync loop started from the app lifespan; returns once stop is set"""
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.sync(db)
+            except Exception as e:
+                self.sync_errors += 1
+                logger.warning({"event": "session_revocation_sync_error", "error": str(e)})
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.sync_interval)
+                return
+            except TimeoutError:
+                pass
+
+    def clear(self) -> None:
+        self._revoked.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "revoked": len(self._revoked),
+            "sync_errors": self.sync_errors,
+            "last_sync_at": self.last_sync_at.isoformat() if self.last_sync_at else None,
+        }
+
+
+session_revocations = SessionRevocations(
+    ttl_seconds=settings.SIGNED_SESSION_TTL_SECONDS,
+    sync_interval=settings.SIGNED_SESSION_REVOCATION_SYNC_SECONDS,
+)
@@ -0,0 +1,83 @@
+"""
+Single-flight request coalescing
+Concurrent identical loads share one in-flight computation: the first
+caller (the leader) runs it, everyone arriving while it is running awaits
+the same result instead of sending the same queries again.
+"""
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    In-flight map of key -> future, per worker process
+
+    Nothing is cached: the entry is removed as soon as the leader finishes,
+    so a caller never gets a result that was computed before it arrived
+    unless the computation was still running. Keys must capture everything
+    the result depends on (route, parameters, authorization scope); the
+    result must not contain per-caller data, which callers add themselves
+    after their own permission checks.
+
+    Errors raised by the leader are re-raised to every follower. If the
+    leader itself is cancelled (client went away), followers do not inherit
+    the cancellation: the next one in line runs the load again.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Run load() for key, or join the run already in flight"""
+        if not self.enabled:
+            return await load()
+
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.followers += 1
+            try:
+                # shield: a follower going away must not cancel the leader's result
+                return await asyncio.shield(future)  # type: ignore[no-any-return]
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not future.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The leader was cancelled, not us: take over
+
+        self.leaders += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an error without followers is not logged as
+            # "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": len(self._inflight), "leaders": self.leaders, "followers": self.followers}
+
+
+# Global single-flight group for the hot read endpoints
+single_flight = SingleFlight(enabled=settings.SINGLE_FLIGHT_ENABLED)
@@ -0,0 +1,19 @@
+"""
+Circle versioning
+Every change visible in a circle response bumps circles.version inside the
+writer's transaction, so ETags derived from it change exactly when the
+response does.
+"""
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Circle
+
+
+async def bump_circle_version(db: AsyncSession, circle_id: int) -> None:
+    """Increment the circle's version (atomic in SQL; concurrent writers never lose a bump)"""
+    await db.execute(
+        update(Circle)
+        .where(Circle.id == circle_id)
+        .values(version=Circle.version + 1)
+    )
@@ -0,0 +1,122 @@
+"""
+Materialized feed maintenance (fan-out on write)
+Keeps feed_items in sync with posts and circle memberships. Every write is
+a single set-based statement, so cost does not grow with Python round trips.
+"""
+import logging
+from datetime import datetime
+
+from sqlalchemy import delete, desc, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import AsyncSessionLocal
+from app.core.feed_cache import feed_cache
+from app.db.models import CircleMember, FeedItem, Post
+
+logger = logging.getLogger("app.feed")
+
+
+def _rowcount(result: object) -> int:
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def fan_out_post(db: AsyncSession, post_id: int, circle_id: int, created_at: datetime) -> int:
+    """
+    Add a post to the feed of every member of its circle
+
+    Returns:
+        Number of feed rows inserted
+    """
+    members = select(
+        CircleMember.user_id,
+        literal(post_id),
+        literal(circle_id),
+        literal(created_at),
+    ).where(CircleMember.circle_id == circle_id)
+
+    result = await db.execute(
+        insert(FeedItem)
+        .from_select(["user_id", "post_id", "circle_id", "created_at"], members)
+        .on_conflict_do_nothing()
+    )
+    await db.commit()
+    return _rowcount(result)
+
+
+async def invalidate_circle_feeds(db: AsyncSession, circle_id: int) -> None:
+    """
+    Drop the cached feed pages of every member of a circle
+    Call after committing a change to the circle's posts or before deleting
+    the circle (afterwards its memberships are gone).
+    """
+    if feed_cache.max_entries <= 0:
+        return
+    member_ids = await db.scalars(
+        select(CircleMember.user_id).where(CircleMember.circle_id == circle_id)
+    )
+    feed_cache.invalidate_users(member_ids.all())
+
+
+async def fan_out_post_in_background(post_id: int, circle_id: int, created_at: datetime) -> None:
+    """
+    BackgroundTasks entry point for fan_out_post
+    Runs after the response is sent, in its own session. Failures are logged
+    rather than raised: the feed is eventually consistent and a backfill
+    repairs it.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            inserted = await fan_out_post(db, post_id, circle_id, created_at)
+            await invalidate_circle_feeds(db, circle_id)
+        logger.debug({"event": "feed_fan_out", "post_id": post_id, "rows": inserted})
+    except Exception as e:
+        logger.error({"event": "feed_fan_out_failed", "post_id": post_id, "error": str(e)})
+
+
+async def backfill_member(db: AsyncSession, user_id: int, circle_id: int, limit: int) -> int:
+    """
+    Copy the most recent posts of a circle into a new member's feed
+    (does not commit; runs in the caller's transaction)
+    """
+    recent_posts = (
+        select(literal(user_id), Post.id, Post.circle_id, Post.created_at)
+        .where(Post.circle_id == circle_id)
+        .order_by(desc(Post.created_at), desc(Post.id))
+        .limit(limit)
+    )
+    result = await db.execute(
+        insert(FeedItem)
+        .from_select(["user_id", "post_id", "circle_id", "created_at"], recent_posts)
+        .on_conflict_do_nothing()
+    )
+    return _rowcount(result)
+
+
+async def prune_member(db: AsyncSession, user_id: int, circle_id: int) -> int:
+    """
+    Remove a circle's posts from a former member's feed
+    (does not commit; runs in the caller's transaction)
+    """
+    result = await db.execute(
+        delete(FeedItem).where(FeedItem.user_id == user_id, FeedItem.circle_id == circle_id)
+    )
+    return _rowcount(result)
+
+
+async def backfill_all(db: AsyncSession) -> int:
+    """
+    Rebuild missing feed rows for every membership (used before switching
+    FEED_MODE to "write"); existing rows are left untouched
+    """
+    rows = (
+        select(CircleMember.user_id, Post.id, Post.circle_id, Post.created_at)
+        .join(Post, Post.circle_id == CircleMember.circle_id)
+    )
+    result = await db.execute(
+        insert(FeedItem)
+        .from_select(["user_id", "post_id", "circle_id", "created_at"], rows)
+        .on_conflict_do_nothing()
+    )
+    await db.commit()
+    return _rowcount(result)
@@ -4,7 +4,7 @@ User model for authentication (Async SQLAlchemy 2.0)
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, LargeBinary, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -66,8 +66,11 @@ class Circle(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
-    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on every change visible in CircleResponse (details, members, roles);
+    # the ETag of GET /circles/{id} and /circles/my is derived from it
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
 
     # relationships
     owner: Mapped["User"] = relationship(back_populates="owned_circles", foreign_keys=[owner_id])
@@ -80,6 +83,10 @@ class CircleMember(Base):
     Association table for Circle members
     """
     __tablename__ = "circle_members"
+    # The primary key is (circle_id, user_id); this serves "circles of a user"
+    __table_args__ = (
+        Index("ix_circle_members_user_id_circle_id", "user_id", "circle_id"),
+    )
 
     circle_id: Mapped[int] = mapped_column(ForeignKey("circles.id"), primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
@@ -110,6 +117,42 @@ class Post(Base):
     author: Mapped["User"] = relationship(back_populates="posts")
     circle: Mapped["Circle | None"] = relationship(back_populates="posts")
 
+
+# Feed / circle posts: filter by circle, newest first, id as tie-breaker
+Index(
+    "ix_posts_circle_id_created_at_id",
+    Post.circle_id,
+    Post.created_at.desc(),
+    Post.id.desc(),
+)
+
+class FeedItem(Base):
+    """
+    Materialized feed entry: post_id shows up in user_id's feed
+    Filled on write (fan-out) when settings.FEED_MODE == "write"
+    """
+    __tablename__ = "feed_items"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    post_id: Mapped[int] = mapped_column(
+        ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    circle_id: Mapped[int] = mapped_column(
+        ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# Feed read: one index range scan per user, newest first
+Index(
+    "ix_feed_items_user_id_created_at_post_id",
+    FeedItem.user_id,
+    FeedItem.created_at.desc(),
+    FeedItem.post_id.desc(),
+)
+
 # Session model for session-based authentication (alternative to JWT)
 class UserSession(Base):
     """
@@ -119,14 +162,33 @@ class UserSession(Base):
     __tablename__ = "user_sessions"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    session_token: Mapped[str] = mapped_column(
-        String(255), unique=True, index=True, nullable=False
+    # SHA-256 of the session cookie value (app.core.security.hash_session_token);
+    # the bearer token itself is never stored
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, index=True, nullable=False
     )
     user_id: Mapped[int] = mapped_column(nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     def __repr__(self) -> str:
         return f"<UserSession(id={self.id}, user_id={self.user_id})>"
+
+
+class SessionRevocation(Base):
+    """
+    Logged-out sessions whose signed session tokens may still be unexpired
+    Only written when SESSION_TOKEN_MODE="signed"; every worker mirrors the
+    live rows in memory (see app.core.signed_sessions).
+    """
+    __tablename__ = "session_revocations"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    session_id: Mapped[int] = mapped_column(nullable=False)
+    # Last moment a token issued for the session can still be valid
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<SessionRevocation(session_id={self.session_id})>"
@@ -0,0 +1,32 @@
+"""
+User account state
+Changes that affect authentication also drop what lets the user skip the
+database: cached sessions and, in signed session mode, outstanding signed
+tokens (revoked by session id). The session cache is per worker, so other
+workers notice within SESSION_CACHE_TTL_SECONDS; revocations reach them at
+their next sync.
+"""
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.session_cache import session_cache
+from app.core.signed_sessions import session_revocations, signed_sessions_enabled
+from app.db.models import User, UserSession
+
+
+async def deactivate_user(db: AsyncSession, user_id: int) -> None:
+    """
+    Mark a user inactive and stop serving their sessions
+
+    Commits first, so a concurrent request cannot cache the still-active
+    row again after the invalidation.
+    """
+    await db.execute(update(User).where(User.id == user_id).values(is_active=False))
+    if signed_sessions_enabled():
+        session_ids = (await db.execute(
+            select(UserSession.id).where(UserSession.user_id == user_id)
+        )).scalars().all()
+        for session_id in session_ids:
+            session_revocations.revoke(db, session_id)
+    await db.commit()
+    session_cache.invalidate_user(user_id)
@@ -1,12 +1,13 @@
 """
 Main FastAPI application (ASYNC with PostgreSQL)
 Initializes the API with authentication endpoints, CORS, security headers,
-logging middleware and rate limiting.
+compression, logging middleware, rate limiting and Prometheus metrics.
 """
 
+import asyncio
 import logging
-import time
-from collections.abc import AsyncGenerator, Awaitable, Callable
+import secrets
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -16,15 +17,32 @@ from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from app.api.v1.endpoints import auth, circle_members, circles, posts, users
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import engine, pool_monitor, query_log
+from app.core.feed_cache import feed_cache
 from app.core.limiter import limiter
+from app.core.login_throttle import login_throttle
+from app.core.metrics import (
+    CONTENT_TYPE,
+    MetricFamily,
+    metrics,
+    rate_limit_rejections_total,
+    route_label,
+)
+from app.core.readiness import readiness_monitor
+from app.core.request_logging import RequestLoggingMiddleware, configure_logging, stop_logging
+from app.core.security import PasswordHasherBusyError, password_hash_pool
 from app.core.security_headers import SecurityHeadersMiddleware
+from app.core.session_cache import session_cache
+from app.core.session_reaper import run_session_reaper
+from app.core.signed_sessions import session_revocations, signed_sessions_enabled
+from app.core.single_flight import single_flight
 
 # -----------------------------
 # LOGGING CONFIG
 # -----------------------------
-logging.basicConfig(level=logging.INFO)
+configure_logging(settings.LOG_LEVEL)
 logger = logging.getLogger("app")
 
 
@@ -33,8 +51,26 @@ logger = logging.getLogger("app")
 # -----------------------------
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    stop_background = asyncio.Event()
+    reaper_task = None
+    if settings.SESSION_REAPER_ENABLED:
+        reaper_task = asyncio.create_task(run_session_reaper(stop_background))
+    readiness_task = asyncio.create_task(readiness_monitor.run(stop_background))
+    revocation_task = None
+    if signed_sessions_enabled():
+        revocation_task = asyncio.create_task(session_revocations.run(stop_background))
+
     yield
+
+    stop_background.set()
+    if reaper_task is not None:
+        await reaper_task
+    if revocation_task is not None:
+        await revocation_task
+    await readiness_task
+    password_hash_pool.shutdown()
     await engine.dispose()
+    stop_logging()
 
 
 # -----------------------------
@@ -56,12 +92,12 @@ app.state.limiter = limiter
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     client_ip = request.client.host if request.client else "unknown"
+    rate_limit_rejections_total.inc(route_label(request.scope))
     logger.warning({
         "event": "rate_limit_exceeded",
         "ip": client_ip,
         "path": request.url.path
     })
-    print(f"⚠️  RATE LIMIT: {client_ip} - {request.url.path} - Too many requests")
     return JSONResponse(
         status_code=429,
         content={"detail": "Too many requests. Try again later."}
@@ -69,34 +105,24 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONRe
 
 
 # -----------------------------
-# LOGGING MIDDLEWARE
+# PASSWORD HASHING OVERLOAD HANDLER
 # -----------------------------
-
-@app.middleware("http")
-async def log_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-    start_time = time.time()
-
-    response = await call_next(request)
-
-    duration = (time.time() - start_time) * 1000
-    client_ip = request.client.host if request.client else "unknown"
-
-    logger.info({
-        "event": "http_request",
-        "method": request.method,
-        "url": request.url.path,
-        "status_code": response.status_code,
-        "duration_ms": round(duration, 2),
-        "ip": client_ip
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError) -> JSONResponse:
+    logger.warning({
+        "event": "password_hash_pool_full",
+        "path": request.url.path,
+        **password_hash_pool.stats()
     })
-
-    print(f"📡 {request.method} {request.url.path} - {response.status_code} - {round(duration, 2)}ms - {client_ip}")
-
-    return response
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy. Try again shortly."},
+        headers={"Retry-After": "1"}
+    )
 
 
 # -----------------------------
-# CORS + SECURITY HEADERS
+# CORS + SECURITY HEADERS + COMPRESSION + REQUEST LOGGING
 # -----------------------------
 app.add_middleware(
     CORSMiddleware,
@@ -104,10 +130,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Sees the final headers (Cache-Control, Content-Type) before deciding to compress
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# Outermost: times and logs everything below it
+app.add_middleware(RequestLoggingMiddleware)
+
 
 # -----------------------------
 # ROUTERS
@@ -137,6 +171,21 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "database": "PostgreSQL"}
 
 
+@app.get("/ready")
+async def readiness_check() -> JSONResponse:
+    """
+    Readiness for load balancers / orchestrators: 503 takes this worker out
+    of rotation. Serves the background probe's cached result (no DB query).
+    The body only carries fixed reason codes; probe, pool and loop-lag
+    details are on the token-protected /metrics.
+    """
+    state = readiness_monitor.state()
+    return JSONResponse(
+        {"ready": state["ready"], "reasons": state["reasons"]},
+        status_code=200 if state["ready"] else 503
+    )
+
+
 @app.get("/api/health")
 async def api_health() -> dict[str, str]:
     return {"status": "healthy", "api_version": settings.VERSION}
@@ -145,3 +194,67 @@ async def api_health() -> dict[str, str]:
 @app.get(f"{settings.API_V1_STR}/health")
 async def api_v1_health() -> dict[str, str]:
     return {"status": "healthy", "api_version": settings.VERSION, "api": "v1"}
+
+
+# -----------------------------
+# METRICS (Prometheus text format)
+# -----------------------------
+@metrics.collector
+def component_metrics() -> list[MetricFamily]:
+    """Pool, cache and hashing state, read from each component's stats() at scrape time"""
+    pool = pool_monitor.stats()
+    sessions = session_cache.stats()
+    feeds = feed_cache.stats()
+    hashing = password_hash_pool.stats()
+    queries = query_log.stats()
+    coalescing = single_flight.stats()
+    throttle = login_throttle.stats()
+    revocations = session_revocations.stats()
+    readiness = readiness_monitor.state()
+
+    def gauge(name: str, documentation: str, value: float | None) -> MetricFamily:
+        return MetricFamily(name, "gauge", documentation, [({}, value)] if value is not None else [])
+
+    def counter(name: str, documentation: str, value: float) -> MetricFamily:
+        return MetricFamily(name, "counter", documentation, [({}, value)])
+
+    return [
+        gauge("db_pool_checked_out", "Connections currently checked out", pool["checked_out"]),
+        gauge("db_pool_overflow", "Connections open beyond pool_size", pool["overflow"]),
+        gauge("db_pool_idle", "Idle connections in the pool", pool["idle"]),
+        gauge("db_pool_limit", "pool_size + max_overflow", pool["limit"]),
+        counter("db_pool_connects_total", "New database connections opened", pool["connects"]),
+        counter("db_pool_invalidations_total", "Connections invalidated", pool["invalidations"]),
+        counter("db_queries_total", "SQL statements run (requests and background tasks)", queries["statements"]),
+        counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS", queries["slow"]),
+        counter("session_cache_hits_total", "Session lookups served from the cache", sessions["hits"]),
+        counter("session_cache_misses_total", "Session lookups that went to the database", sessions["misses"]),
+        gauge("session_cache_hit_ratio", "Session cache hits / lookups since start", sessions["hit_ratio"]),
+        gauge("session_cache_entries", "Cached sessions", sessions["size"]),
+        counter("feed_cache_hits_total", "Feed pages served from the cache", feeds["hits"]),
+        counter("feed_cache_misses_total", "Cacheable feed pages that were queried", feeds["misses"]),
+        gauge("password_hash_queue_depth", "Argon2 calls running or waiting for a worker", hashing["queue_depth"]),
+        counter("password_hash_rejected_total", "Argon2 calls rejected because the pool was full", hashing["rejected"]),
+        counter("password_hash_failed_total", "Argon2 calls that raised or were cancelled", hashing["failed"]),
+        gauge("signed_session_revocations", "Revoked sessions mirrored in memory", revocations["revoked"]),
+        counter("login_throttle_rejected_total", "Logins rejected by the per-username backoff", throttle["rejected"]),
+        gauge("login_throttle_blocked_usernames", "Usernames currently in backoff", throttle["blocked"]),
+        counter("single_flight_shared_total", "Loads served from another request's in-flight query", coalescing["followers"]),
+        gauge("app_ready", "1 when /ready answers 200", 1 if readiness["ready"] else 0),
+        gauge("db_probe_consecutive_failures", "Readiness probes failed in a row",
+              readiness["database"]["consecutive_failures"]),
+        gauge("db_probe_duration_seconds", "Duration of the last readiness probe",
+              readiness["database"]["probe_ms"] / 1000),
+        gauge("event_loop_lag_seconds", "Event-loop wake-up delay at the last readiness tick",
+              readiness["event_loop_lag_ms"] / 1000),
+    ]
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint(request: Request) -> Response:
+        if settings.METRICS_TOKEN:
+            expected = f"Bearer {settings.METRICS_TOKEN}"
+            if not secrets.compare_digest(request.headers.get("authorization", ""), expected):
+                return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return Response(metrics.render(), media_type=CONTENT_TYPE)
@@ -113,11 +113,19 @@ class CircleResponse(CircleBase):
     owner_name: str | None = Field(None, description="Username of owner")
     members: list[CircleMemberResponse] | None = Field(None, description="Circle members")
     member_count: int | None = Field(None, description="Total number of members")
+    members_next_cursor: str | None = Field(None, description="Cursor for the next members page, if any")
+    current_user_role: CircleRole | None = Field(None, description="Role of the requesting user")
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class CircleMemberPage(BaseModel):
+    """Schema for one page of circle members (keyset pagination)"""
+    members: list[CircleMemberResponse]
+    next_cursor: str | None = Field(None, description="Pass back as ?cursor= for the next page")
+
+
 # ======================================================
 # CIRCLE MEMBER MANAGEMENT SCHEMAS
 # ======================================================
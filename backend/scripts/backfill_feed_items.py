@@ -0,0 +1,23 @@
+# backend/scripts/backfill_feed_items.py
+"""
+Fill feed_items from existing posts and memberships.
+Run once before switching FEED_MODE to "write"; safe to re-run.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.db import AsyncSessionLocal
+from app.db.feed import backfill_all
+
+
+async def main() -> None:
+    print("🔄 Backfilling feed_items...")
+    async with AsyncSessionLocal() as session:
+        inserted = await backfill_all(session)
+    print(f"✅ Inserted {inserted} feed rows")
+
+if __name__ == "__main__":
+    asyncio.run(main())
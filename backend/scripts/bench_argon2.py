@@ -0,0 +1,71 @@
+# backend/scripts/bench_argon2.py
+"""
+Benchmark: Argon2 verify latency and throughput per core for a grid of costs.
+
+Latency is wall-clock for one verify; CPU time includes every lane
+(parallelism > 1 runs lanes on several threads), so hashes/s/core is what
+one core of the hashing pool can sustain, and therefore how many logins per
+second a worker can absorb before PasswordHashPool starts shedding load.
+
+    uv run python scripts/bench_argon2.py --rounds 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.core.config import settings
+
+GRID = [
+    # (time_cost, memory KiB) - RFC 9106 / OWASP style points plus the current settings
+    (1, 19 * 1024),
+    (2, 19 * 1024),
+    (1, 46 * 1024),
+    (1, 64 * 1024),
+    (3, 64 * 1024),
+    (4, 64 * 1024),
+    (1, 128 * 1024),
+]
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, rounds: int) -> tuple[float, float]:
+    """(median wall ms, median CPU ms) of one verify"""
+    hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed = hasher.hash("benchmark-password")
+    wall, cpu = [], []
+    for _ in range(rounds):
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        hasher.verify("benchmark-password", hashed)
+        wall.append((time.perf_counter() - start_wall) * 1000)
+        cpu.append((time.process_time() - start_cpu) * 1000)
+    return statistics.median(wall), statistics.median(cpu)
+
+
+def run(rounds: int, parallelism: int) -> None:
+    grid = list(GRID)
+    current = (settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST_KIB)
+    if current not in grid:
+        grid.append(current)
+
+    print(f"{os.cpu_count()} CPUs, parallelism={parallelism}, {rounds} rounds per setting")
+    print(f"{'time':>4} {'memory MiB':>10} {'verify ms':>10} {'CPU ms':>8} {'hashes/s/core':>14}")
+    for time_cost, memory_cost in grid:
+        wall_ms, cpu_ms = measure(time_cost, memory_cost, parallelism, rounds)
+        marker = "  <- current" if (time_cost, memory_cost) == current else ""
+        print(
+            f"{time_cost:>4} {memory_cost / 1024:>10.0f} {wall_ms:>10.1f} {cpu_ms:>8.1f} "
+            f"{1000 / cpu_ms:>14.1f}{marker}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    args = parser.parse_args()
+    run(args.rounds, args.parallelism)
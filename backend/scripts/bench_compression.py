@@ -0,0 +1,93 @@
+# backend/scripts/bench_compression.py
+"""
+Benchmark: bytes on the wire and CPU per response for each content coding.
+
+Renders realistic feed / circle payloads with the real response schemas (no
+database needed) and runs them through the encoders CompressionMiddleware
+uses, at the configured levels.
+
+    uv run python scripts/bench_compression.py --repeat 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from pydantic import TypeAdapter
+
+from app.core.compression import available_encoders
+from app.schemas.social import CircleMemberResponse, CircleResponse, CircleRole, PostResponse
+
+WORDS = (
+    "circle security release deploy review meeting notes pipeline scan alert "
+    "update weekly frontend backend database patch token session audit"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def feed_payload(posts: int, rng: random.Random) -> bytes:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    items = [
+        PostResponse(
+            id=100_000 - i, title=_text(rng, 6), content=_text(rng, rng.randint(20, 120)),
+            author_id=rng.randint(1, 500), author_name=f"user{rng.randint(1, 500)}",
+            circle_id=rng.randint(1, 40), circle_name=f"Circle {rng.randint(1, 40)}",
+            created_at=now - timedelta(minutes=i), updated_at=None,
+        )
+        for i in range(posts)
+    ]
+    return TypeAdapter(list[PostResponse]).dump_json(items)
+
+
+def circle_payload(members: int, rng: random.Random) -> bytes:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    circle = CircleResponse(
+        id=1, name="Platform Security", description=_text(rng, 30), owner_id=1,
+        owner_name="user1", created_at=now, member_count=members,
+        members_next_cursor=None, current_user_role=CircleRole.MEMBER,
+        members=[
+            CircleMemberResponse(
+                circle_id=1, user_id=i, username=f"user{i}",
+                role=CircleRole.OWNER if i == 1 else CircleRole.MEMBER,
+                joined_at=now - timedelta(hours=i),
+            )
+            for i in range(1, members + 1)
+        ],
+    )
+    return circle.model_dump_json().encode()
+
+
+def run(repeat: int) -> None:
+    rng = random.Random(42)  # nosec B311 - deterministic sample data
+    payloads = {
+        "feed x20": feed_payload(20, rng),
+        "feed x200": feed_payload(200, rng),
+        "circle x50 members": circle_payload(50, rng),
+        "circle x200 members": circle_payload(200, rng),
+    }
+    encoders = available_encoders()
+
+    print(f"{'payload':<22} {'coding':<9} {'bytes':>9} {'ratio':>7} {'cpu us':>9}")
+    for name, body in payloads.items():
+        print(f"{name:<22} {'identity':<9} {len(body):>9} {1:>7.2f} {'-':>9}")
+        for coding, make_encoder in encoders.items():
+            start = time.process_time()
+            for _ in range(repeat):
+                encoder = make_encoder()
+                size = len(encoder.compress(body) + encoder.finish())
+            cpu_us = (time.process_time() - start) / repeat * 1_000_000
+            print(f"{'':<22} {coding:<9} {size:>9} {len(body) / size:>7.2f} {cpu_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.repeat)
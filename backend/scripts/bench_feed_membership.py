@@ -0,0 +1,110 @@
+# backend/scripts/bench_feed_membership.py
+"""
+Benchmark: feed latency by circle membership count, IN-list vs semi-join.
+
+Seeds circles and posts inside a transaction in the DATABASE_URL database,
+then for a growing number of memberships compares:
+  in-list:   SELECT circle ids, then WHERE circle_id IN (<every id>)
+  semi-join: the single statement GET /posts/feed runs (feed_query)
+Everything is rolled back at the end.
+
+    uv run python scripts/bench_feed_membership.py --max-circles 10000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import desc, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.api.v1.endpoints.posts import feed_query
+from app.core.db import make_engine
+from app.db.models import Circle, CircleMember, Post, User
+
+
+async def _old_feed(conn: AsyncConnection, user_id: int, limit: int) -> None:
+    """The previous two-step implementation, kept here for comparison"""
+    circle_ids = (await conn.execute(
+        select(CircleMember.circle_id).where(CircleMember.user_id == user_id)
+    )).scalars().all()
+    (await conn.execute(
+        select(Post, User.username, Circle.name)
+        .join(User, Post.author_id == User.id)
+        .join(Circle, Post.circle_id == Circle.id, isouter=True)
+        .where(Post.circle_id.in_(circle_ids))
+        .order_by(desc(Post.created_at), desc(Post.id))
+        .limit(limit)
+    )).all()
+
+
+async def _new_feed(conn: AsyncConnection, user_id: int, limit: int) -> None:
+    (await conn.execute(feed_query(user_id, limit))).all()
+
+
+async def _median_ms(fn: Callable[[], Awaitable[None]], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def run(max_circles: int, posts_per_circle: int, limit: int, repeat: int) -> None:
+    engine = make_engine()
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            user_id: int = (await conn.execute(text(
+                "INSERT INTO users (username, email, hashed_password, is_active) "
+                "VALUES ('bench_member', 'bench_member@example.com', 'x', true) RETURNING id"
+            ))).scalar_one()
+
+            # Twice as many circles as the user will join, so the filter matters
+            await conn.execute(text(
+                "INSERT INTO circles (name, owner_id) "
+                "SELECT 'bench_m_' || g, :uid FROM generate_series(1, :n) AS g"
+            ), {"uid": user_id, "n": max_circles * 2})
+            await conn.execute(text(
+                "INSERT INTO posts (title, content, author_id, circle_id, created_at) "
+                "SELECT 'bench', 'content', :uid, c.id, now() - (g * c.id % 100000) * interval '1 second' "
+                "FROM circles c CROSS JOIN generate_series(1, :per) AS g "
+                "WHERE c.name LIKE 'bench_m_%'"
+            ), {"uid": user_id, "per": posts_per_circle})
+            await conn.execute(text("ANALYZE circles, posts"))
+
+            print(f"{'circles':>8} {'in-list ms':>12} {'semi-join ms':>14}")
+            joined = 0
+            count = 1
+            while count <= max_circles:
+                await conn.execute(text(
+                    "INSERT INTO circle_members (circle_id, user_id, role) "
+                    "SELECT id, :uid, 'member' FROM circles WHERE name LIKE 'bench_m_%' "
+                    "ORDER BY id OFFSET :skip LIMIT :take"
+                ), {"uid": user_id, "skip": joined * 2, "take": count - joined})
+                joined = count
+                await conn.execute(text("ANALYZE circle_members"))
+
+                old_ms = await _median_ms(lambda: _old_feed(conn, user_id, limit), repeat)
+                new_ms = await _median_ms(lambda: _new_feed(conn, user_id, limit), repeat)
+                print(f"{count:>8} {old_ms:>12.2f} {new_ms:>14.2f}")
+                count *= 10
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-circles", type=int, default=10_000)
+    parser.add_argument("--posts-per-circle", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.max_circles, args.posts_per_circle, args.limit, args.repeat))
@@ -0,0 +1,104 @@
+# backend/scripts/bench_feed_pagination.py
+"""
+Benchmark: feed page latency by depth, OFFSET vs keyset cursor.
+
+Seeds a throwaway user/circle with N posts in the DATABASE_URL database,
+times the exact statement GET /posts/feed runs at increasing page depths,
+then deletes the seeded rows.
+
+    uv run python scripts/bench_feed_pagination.py --posts 200000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import Executable, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.endpoints.posts import feed_query
+from app.core.db import make_engine
+from app.db.models import Circle, CircleMember, Post, User
+
+
+async def _time_query(session: AsyncSession, stmt: Executable, repeat: int) -> float:
+    """Median wall time of stmt in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        (await session.execute(stmt)).all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def run(posts: int, limit: int, repeat: int) -> None:
+    engine = make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as session:
+        user = User(username="bench_feed", email="bench_feed@example.com", hashed_password="x")
+        session.add(user)
+        await session.flush()
+        circle = Circle(name="bench_feed_circle", owner_id=user.id)
+        session.add(circle)
+        await session.flush()
+        session.add(CircleMember(circle_id=circle.id, user_id=user.id, role="owner"))
+
+        print(f"Seeding {posts} posts...")
+        await session.execute(
+            text(
+                "INSERT INTO posts (title, content, author_id, circle_id, created_at) "
+                "SELECT 'bench ' || g, 'content', :uid, :cid, now() - g * interval '1 second' "
+                "FROM generate_series(1, :n) AS g"
+            ),
+            {"uid": user.id, "cid": circle.id, "n": posts},
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE posts"))
+
+        try:
+            print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+            depth = 0
+            while depth < posts:
+                offset_ms = await _time_query(
+                    session, feed_query(user.id, limit, offset=depth), repeat
+                )
+
+                after = None
+                if depth:
+                    # Key of the last post on the previous page (not timed)
+                    row = (await session.execute(
+                        select(Post.created_at, Post.id)
+                        .where(Post.circle_id == circle.id)
+                        .order_by(Post.created_at.desc(), Post.id.desc())
+                        .offset(depth - 1)
+                        .limit(1)
+                    )).one()
+                    after = (row.created_at, row.id)
+                cursor_ms = await _time_query(
+                    session, feed_query(user.id, limit, after=after), repeat
+                )
+
+                print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+                depth = depth * 10 if depth else limit * 5
+        finally:
+            await session.execute(delete(Post).where(Post.circle_id == circle.id))
+            await session.execute(delete(CircleMember).where(CircleMember.circle_id == circle.id))
+            await session.execute(delete(Circle).where(Circle.id == circle.id))
+            await session.execute(delete(User).where(User.id == user.id))
+            await session.commit()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.posts, args.limit, args.repeat))
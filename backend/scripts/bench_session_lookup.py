@@ -0,0 +1,125 @@
+# backend/scripts/bench_session_lookup.py
+"""
+Benchmark: session lookup latency and index size, raw varchar token vs SHA-256 bytea.
+
+Builds two throwaway tables in the DATABASE_URL database with N sessions
+each - the old layout (unique varchar(255) holding token_urlsafe(32)) and
+the current one (unique bytea holding its 32-byte digest) - and times the
+indexed probe the session lookup runs, for existing and unknown tokens.
+The tables are dropped afterwards.
+
+    uv run python scripts/bench_session_lookup.py --sessions 10000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import secrets
+import statistics
+import sys
+import time
+from typing import Any
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.db import make_engine
+from app.core.security import hash_session_token
+
+RAW = "bench_sessions_raw"
+HASHED = "bench_sessions_hashed"
+
+# 43-character URL-safe tokens, the shape of secrets.token_urlsafe(32)
+SEED_RAW = f"""
+INSERT INTO {RAW} (token, user_id, expires_at)
+SELECT rtrim(translate(encode(sha256(convert_to(g::text || random()::text, 'UTF8')), 'base64'), '+/', '-_'), '='),
+       g % 100000, now() + interval '1 day'
+FROM generate_series(1, :n) AS g
+"""
+SEED_HASHED = f"""
+INSERT INTO {HASHED} (token_hash, user_id, expires_at)
+SELECT sha256(convert_to(token, 'UTF8')), user_id, expires_at FROM {RAW}
+"""
+
+
+async def _time_lookups(conn: AsyncConnection, sql: str, keys: list[Any]) -> tuple[float, float]:
+    """(median ms, p99 ms) of one lookup per key"""
+    stmt = text(sql)
+    samples = []
+    for key in keys:
+        start = time.perf_counter()
+        (await conn.execute(stmt, {"key": key})).first()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+
+async def run(sessions: int, lookups: int) -> None:
+    engine = make_engine()
+    async with engine.connect() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {RAW}, {HASHED}"))
+        await conn.execute(text(
+            f"CREATE UNLOGGED TABLE {RAW} (id serial PRIMARY KEY, token varchar(255) NOT NULL, "
+            "user_id integer NOT NULL, expires_at timestamp NOT NULL)"
+        ))
+        await conn.execute(text(
+            f"CREATE UNLOGGED TABLE {HASHED} (id serial PRIMARY KEY, token_hash bytea NOT NULL, "
+            "user_id integer NOT NULL, expires_at timestamp NOT NULL)"
+        ))
+        await conn.commit()
+
+        try:
+            print(f"Seeding {sessions} sessions per layout...")
+            start = time.perf_counter()
+            await conn.execute(text(SEED_RAW), {"n": sessions})
+            await conn.execute(text(SEED_HASHED))
+            await conn.execute(text(f"CREATE UNIQUE INDEX ix_{RAW}_token ON {RAW} (token)"))
+            await conn.execute(text(f"CREATE UNIQUE INDEX ix_{HASHED}_token_hash ON {HASHED} (token_hash)"))
+            await conn.commit()
+            await conn.execute(text(f"ANALYZE {RAW}"))
+            await conn.execute(text(f"ANALYZE {HASHED}"))
+            print(f"  {time.perf_counter() - start:.0f} s")
+
+            rng = random.Random(7)  # nosec B311 - benchmark sampling
+            ids = [rng.randint(1, sessions) for _ in range(lookups)]
+            rows = await conn.execute(text(f"SELECT token FROM {RAW} WHERE id = ANY(:ids)"), {"ids": ids})
+            tokens = [row[0] for row in rows]
+            unknown = [secrets.token_urlsafe(32) for _ in range(lookups)]
+
+            shared_buffers: str = (await conn.execute(text("SHOW shared_buffers"))).scalar_one()
+            print(f"{lookups} lookups per case, shared_buffers={shared_buffers}")
+            print(f"{'layout':<22} {'index MB':>9} {'table MB':>9} {'hit p50':>8} {'hit p99':>8} {'miss p50':>9}")
+            cases: list[tuple[str, str, str, str, list[Any], list[Any]]] = [
+                (f"varchar token ({RAW})", RAW, f"ix_{RAW}_token",
+                 f"SELECT user_id, expires_at FROM {RAW} WHERE token = :key", tokens, unknown),
+                (f"bytea sha256 ({HASHED})", HASHED, f"ix_{HASHED}_token_hash",
+                 f"SELECT user_id, expires_at FROM {HASHED} WHERE token_hash = :key",
+                 [hash_session_token(t) for t in tokens], [hash_session_token(t) for t in unknown]),
+            ]
+            for name, table, index, sql, hits, misses in cases:
+                # Warm up the plan and the upper index levels
+                await _time_lookups(conn, sql, hits[:200])
+                hit_p50, hit_p99 = await _time_lookups(conn, sql, hits)
+                miss_p50, _ = await _time_lookups(conn, sql, misses)
+                index_mb = (await conn.execute(text(f"SELECT pg_relation_size('{index}')"))).scalar_one() / 2**20
+                table_mb = (await conn.execute(text(f"SELECT pg_relation_size('{table}')"))).scalar_one() / 2**20
+                print(
+                    f"{name.split(' (')[0]:<22} {index_mb:>9.0f} {table_mb:>9.0f} "
+                    f"{hit_p50:>8.3f} {hit_p99:>8.3f} {miss_p50:>9.3f}"
+                )
+            print("(latencies in ms, including the asyncpg round trip)")
+        finally:
+            await conn.rollback()
+            await conn.execute(text(f"DROP TABLE IF EXISTS {RAW}, {HASHED}"))
+            await conn.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10_000_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions, args.lookups))
@@ -0,0 +1,50 @@
+# backend/scripts/calibrate_argon2.py
+"""
+Calibrate Argon2 costs so one password verify takes about --target-ms here.
+
+Run it on the deployment hardware (same CPU and core count as the API
+workers) and put the printed values in the environment. Existing hashes keep
+working and are rehashed with the new costs when each user next logs in.
+
+    uv run python scripts/calibrate_argon2.py --target-ms 250 --max-memory-mib 64
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.config import settings
+from app.core.security import calibrate_argon2, measure_argon2_ms
+
+
+def run(target_ms: float, max_memory_mib: int, parallelism: int) -> None:
+    current = measure_argon2_ms(
+        settings.ARGON2_TIME_COST, settings.ARGON2_MEMORY_COST_KIB, settings.ARGON2_PARALLELISM
+    )
+    print(
+        f"current: time_cost={settings.ARGON2_TIME_COST} memory={settings.ARGON2_MEMORY_COST_KIB} KiB "
+        f"parallelism={settings.ARGON2_PARALLELISM} -> {current:.1f} ms"
+    )
+
+    chosen = calibrate_argon2(target_ms, max_memory_mib * 1024, parallelism)
+    print(
+        f"chosen:  time_cost={chosen['time_cost']} memory={chosen['memory_cost']} KiB "
+        f"parallelism={chosen['parallelism']} -> {chosen['verify_ms']:.1f} ms (target {target_ms:.0f} ms)"
+    )
+    if chosen["verify_ms"] > target_ms:
+        print("warning: the smallest allowed memory cost with one pass is still over the target")
+
+    print()
+    print(f"ARGON2_TIME_COST={chosen['time_cost']}")
+    print(f"ARGON2_MEMORY_COST_KIB={chosen['memory_cost']}")
+    print(f"ARGON2_PARALLELISM={chosen['parallelism']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--max-memory-mib", type=int, default=64)
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    args = parser.parse_args()
+    run(args.target_ms, args.max_memory_mib, args.parallelism)
@@ -0,0 +1,110 @@
+# backend/scripts/explain_hot_queries.py
+"""
+Print EXPLAIN ANALYZE plans for the feed, circle-posts and my-circles queries.
+
+Seeds users, circles, memberships and posts inside a transaction in the
+DATABASE_URL database, explains the statements the endpoints run, then
+rolls everything back. Run it before and after a migration to compare plans.
+
+    uv run python scripts/explain_hot_queries.py --posts 200000
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import desc, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import ClauseElement
+
+from app.api.v1.endpoints.posts import feed_query
+from app.core.db import make_engine
+from app.db.models import Circle, CircleMember, Post, User
+
+SEED_SQL = [
+    "INSERT INTO users (username, email, hashed_password, is_active) "
+    "SELECT 'explain_u' || g, 'explain_u' || g || '@example.com', 'x', true "
+    "FROM generate_series(1, :users) AS g",
+
+    "INSERT INTO circles (name, owner_id) "
+    "SELECT 'explain_c' || g, (SELECT min(id) FROM users WHERE username LIKE 'explain_u%') + g % :users "
+    "FROM generate_series(1, :circles) AS g",
+
+    # Every user joins memberships_per_user pseudo-random circles
+    "INSERT INTO circle_members (circle_id, user_id, role) "
+    "SELECT DISTINCT c.id, u.id, 'member' FROM "
+    "(SELECT id, row_number() OVER (ORDER BY id) AS n FROM users WHERE username LIKE 'explain_u%') u "
+    "CROSS JOIN generate_series(1, :per_user) AS k "
+    "JOIN (SELECT id, row_number() OVER (ORDER BY id) AS n FROM circles WHERE name LIKE 'explain_c%') c "
+    "ON c.n = 1 + (u.n * 7919 + k * 104729) % :circles",
+
+    # Spread posts round-robin over memberships (author is always a member)
+    "INSERT INTO posts (title, content, author_id, circle_id, created_at) "
+    "SELECT 'explain ' || g, 'content', m.user_id, m.circle_id, now() - g * interval '1 second' "
+    "FROM generate_series(1, :posts) AS g "
+    "JOIN (SELECT user_id, circle_id, row_number() OVER (ORDER BY circle_id, user_id) - 1 AS n "
+    "FROM circle_members) m ON m.n = g % (SELECT count(*) FROM circle_members)",
+]
+
+
+async def explain(conn: AsyncConnection, title: str, stmt: ClauseElement) -> None:
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    plan = await conn.execute(text(f"EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY ON) {sql}"))
+    print(f"\n=== {title} ===")
+    for (line,) in plan:
+        print(line)
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = make_engine()
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            params = {
+                "users": args.users, "circles": args.circles,
+                "per_user": args.memberships_per_user, "posts": args.posts,
+            }
+            for sql in SEED_SQL:
+                await conn.execute(text(sql), params)
+            await conn.execute(text("ANALYZE users, circles, circle_members, posts"))
+
+            user_id = (await conn.execute(
+                select(CircleMember.user_id).join(User, User.id == CircleMember.user_id)
+                .where(User.username.like("explain_u%")).limit(1)
+            )).scalar_one()
+            circle_ids = (await conn.execute(
+                select(CircleMember.circle_id).where(CircleMember.user_id == user_id)
+            )).scalars().all()
+
+            await explain(conn, "get_feed: posts page", feed_query(user_id, 20))
+            await explain(conn, "get_circle_posts", (
+                select(Post, User.username)
+                .join(User, Post.author_id == User.id)
+                .where(Post.circle_id == circle_ids[0])
+                .order_by(desc(Post.created_at), desc(Post.id))
+                .limit(50)
+            ))
+            await explain(conn, "get_my_circles: circles", (
+                select(Circle)
+                .join(CircleMember, Circle.id == CircleMember.circle_id)
+                .where(CircleMember.user_id == user_id)
+                .order_by(Circle.created_at.desc())
+            ))
+            await explain(conn, "circles owned by user", (
+                select(Circle.id).where(Circle.owner_id == user_id)
+            ))
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--circles", type=int, default=2_000)
+    parser.add_argument("--memberships-per-user", type=int, default=10)
+    parser.add_argument("--posts", type=int, default=200_000)
+    asyncio.run(run(parser.parse_args()))
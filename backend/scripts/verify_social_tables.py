@@ -3,7 +3,7 @@ import asyncio
 
 from sqlalchemy import text
 
-from app.db.database import get_db
+from app.core.db import get_db
 
 
 async def verify_tables() -> None:
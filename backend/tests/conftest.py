@@ -13,7 +13,7 @@ import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import select, text
+from sqlalchemy import event, select, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -23,7 +23,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 # Import your app components
-from app.core.db import get_db
+from app.core.db import get_db, make_engine
 from app.core.security import get_password_hash
 from app.db.models import Base, Circle, CircleMember, Post, User
 from app.main import app
@@ -85,7 +85,7 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 async def async_engine()-> AsyncGenerator[AsyncEngine, None]:
     """Creates the SQLAlchemy async engine once per test run."""
     # NullPool is great for tests to prevent connection state issues
-    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    engine = make_engine(TEST_DATABASE_URL, poolclass=NullPool)
 
     # Create tables once per test session
     async with engine.begin() as conn:
@@ -125,6 +125,22 @@ async def db_session(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
             except Exception as teardown_err:
                 print(f"Failed to cleanly rollback DB: {teardown_err}")
 
+@pytest.fixture
+def query_counter(async_engine: AsyncEngine) -> Generator[list[str], None, None]:
+    """
+    Records every SELECT statement sent to the test database.
+    Call .clear() right before the request under test, then assert on len().
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _record)
+
 # ==========================================
 # 3. FASTAPI TEST CLIENT (For API Tests)
 # ==========================================
@@ -8,6 +8,17 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession  #, async_sessionmaker, create_async_engine
 
+from app.api.v1.endpoints import auth as auth_endpoints
+from app.core.login_throttle import login_throttle
+from app.core.readiness import readiness_monitor
+from app.core.security import decode_token, password_hash_pool
+from app.core.signed_sessions import (
+    ACCESS_COOKIE,
+    SessionRevocations,
+    session_id_from_token,
+    session_revocations,
+)
+
 # from sqlalchemy.pool import StaticPool
 
 # from app.core.db import get_db
@@ -83,6 +94,7 @@ async def test_health_check_health(client: AsyncClient) -> None:
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+    assert "pool" not in data
 
 
 @pytest.mark.asyncio
@@ -94,6 +106,30 @@ async def test_health_check_api(client: AsyncClient) -> None:
     assert data["status"] == "healthy"
 
 
+@pytest.mark.asyncio
+async def test_ready_serves_cached_probe(client: AsyncClient, monkeypatch, query_counter: list[str]) -> None:
+    """Test /ready: 200 after a successful probe, 503 once probes keep failing"""
+    await readiness_monitor.probe_once()
+
+    query_counter.clear()
+    response = await client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+    assert query_counter == []  # the endpoint itself never queries
+
+    async def refused() -> None:
+        raise ConnectionRefusedError("database down")
+
+    monkeypatch.setattr(readiness_monitor, "_probe", refused)
+    monkeypatch.setattr(readiness_monitor, "consecutive_failures", 0)
+    for _ in range(readiness_monitor.failure_threshold):
+        await readiness_monitor.probe_once()
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+    assert response.json() == {"ready": False, "reasons": ["database_unreachable"]}
+
+
 # ============================================================================
 # REGISTRATION TESTS (Username-based)
 # ============================================================================
@@ -236,6 +272,59 @@ async def test_login_wrong_password(client: AsyncClient) -> None:
     assert "invalid username or password" in response.json()["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_login_sheds_load_when_hash_pool_full(client: AsyncClient, monkeypatch) -> None:
+    """Test that login returns 503 instead of queueing when the hash pool is saturated"""
+    await client.post("/api/v1/auth/register", json={
+        "email": "busypool@example.com",
+        "username": "busypool",
+        "password": "CorrectPass123!"
+    })
+
+    monkeypatch.setattr(password_hash_pool, "capacity", 0)
+    response = await client.post("/api/v1/auth/login", json={
+        "username": "busypool",
+        "password": "CorrectPass123!"
+    })
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_login_throttled_per_username_before_verify(client: AsyncClient, monkeypatch) -> None:
+    """Test that a username in backoff gets 429 without an Argon2 verify"""
+    await client.post("/api/v1/auth/register", json={
+        "email": "stuffed@example.com",
+        "username": "stuffed",
+        "password": "CorrectPass123!"
+    })
+    login_throttle.clear()
+
+    verifies = 0
+    real_verify = auth_endpoints.verify_and_update_password_async
+
+    async def counting_verify(plain: str, hashed: str) -> tuple[bool, str | None]:
+        nonlocal verifies
+        verifies += 1
+        return await real_verify(plain, hashed)
+
+    monkeypatch.setattr(auth_endpoints, "verify_and_update_password_async", counting_verify)
+
+    bad = {"username": "stuffed", "password": "WrongPass123!"}
+    for _ in range(login_throttle.free_failures + 1):
+        assert (await client.post("/api/v1/auth/login", json=bad)).status_code == 401
+
+    response = await client.post("/api/v1/auth/login", json={**bad, "password": "CorrectPass123!"})
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+    assert verifies == login_throttle.free_failures + 1
+
+    login_throttle.clear()
+    response = await client.post("/api/v1/auth/login", json={**bad, "password": "CorrectPass123!"})
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_login_nonexistent_user(client: AsyncClient) -> None:
     """Test login with non-existent username"""
@@ -273,6 +362,30 @@ async def test_login_inactive_user(client: AsyncClient, db_session: AsyncSession
     assert "inactive" in response.json()["detail"].lower()
 
 
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_argon2_costs(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test that a hash made with old Argon2 costs is replaced on a successful login"""
+    from pwdlib.hashers.argon2 import Argon2Hasher
+
+    from app.core.config import settings
+    from app.db.models import User
+
+    old_hash = Argon2Hasher(time_cost=1, memory_cost=8 * 1024).hash("Pass123!")
+    user = User(email="oldhash@example.com", username="oldhash", hashed_password=old_hash, is_active=True)
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post("/api/v1/auth/login", json={"username": "oldhash", "password": "Pass123!"})
+    assert response.status_code == 200
+
+    await db_session.refresh(user)
+    assert user.hashed_password != old_hash
+    assert f"m={settings.ARGON2_MEMORY_COST_KIB},t={settings.ARGON2_TIME_COST}" in user.hashed_password
+
+    response = await client.post("/api/v1/auth/login", json={"username": "oldhash", "password": "Pass123!"})
+    assert response.status_code == 200
+
 # ============================================================================
 # SESSION LOGIN TESTS
 # ============================================================================
@@ -343,6 +456,242 @@ async def test_logout_success(client: AsyncClient) -> None:
     assert "logged out" in data["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_cached_session_skips_database(client: AsyncClient, query_counter: list[str]) -> None:
+    """Test that a warm session cache authenticates without DB round trips"""
+    await client.post("/api/v1/auth/register", json={
+        "email": "cached@example.com",
+        "username": "cacheduser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "cacheduser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+
+    query_counter.clear()
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 200
+    assert response.json()["username"] == "cacheduser"
+    assert query_counter == []
+
+    # Logout must invalidate the cached entry
+    await client.post("/api/v1/auth/logout", cookies={"session_token": session_token})
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_reloads_cached_sessions(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test that invalidate_user makes the auth dependency reload the user from the database"""
+    from sqlalchemy import update
+
+    from app.core.session_cache import session_cache
+    from app.db.models import User
+
+    await client.post("/api/v1/auth/register", json={
+        "email": "stale@example.com",
+        "username": "staleuser",
+        "password": "SecurePass123!",
+        "full_name": "Old Name"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "staleuser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+    user_id = login_response.json()["user"]["id"]
+
+    await db_session.execute(update(User).where(User.id == user_id).values(full_name="New Name"))
+    await db_session.commit()
+
+    # Served from the cached snapshot until the user's entries are dropped
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.json()["full_name"] == "Old Name"
+
+    session_cache.invalidate_user(user_id)
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "New Name"
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_loses_cached_session(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test that deactivate_user stops a cached session at once and the database path rejects it too"""
+    from app.core.session_cache import session_cache
+    from app.db.users import deactivate_user
+
+    await client.post("/api/v1/auth/register", json={
+        "email": "deactivated@example.com",
+        "username": "deactivateduser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "deactivateduser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+    user_id = login_response.json()["user"]["id"]
+
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 200
+
+    await deactivate_user(db_session, user_id)
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 403
+
+    session_cache.clear()
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_signed_tokens_revoked(client: AsyncClient, db_session: AsyncSession, monkeypatch) -> None:
+    """Test that deactivate_user revokes outstanding signed tokens in signed session mode"""
+    from app.core.config import settings
+    from app.db.users import deactivate_user
+
+    monkeypatch.setattr(settings, "SESSION_TOKEN_MODE", "signed")
+    session_revocations.clear()
+    await client.post("/api/v1/auth/register", json={
+        "email": "signedoff@example.com",
+        "username": "signedoffuser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "signedoffuser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+    access_token = login_response.cookies[ACCESS_COOKIE]
+    client.cookies.clear()
+
+    await deactivate_user(db_session, login_response.json()["user"]["id"])
+    response = await client.get("/api/v1/auth/me", cookies={ACCESS_COOKIE: access_token})
+    assert response.status_code == 401
+    response = await client.get(
+        "/api/v1/auth/me", cookies={ACCESS_COOKIE: access_token, "session_token": session_token}
+    )
+    assert response.status_code == 403
+    session_revocations.clear()
+
+
+@pytest.mark.asyncio
+async def test_login_stores_only_token_digest(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test that user_sessions holds the SHA-256 of the session token, not the token"""
+    from sqlalchemy import select
+
+    from app.core.security import hash_session_token
+    from app.db.models import UserSession
+
+    await client.post("/api/v1/auth/register", json={
+        "email": "digest@example.com",
+        "username": "digestuser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "digestuser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+
+    stored = (await db_session.execute(
+        select(UserSession.token_hash).where(UserSession.token_hash == hash_session_token(session_token))
+    )).scalar_one()
+    assert len(stored) == 32
+    assert session_token.encode() not in stored
+
+
+@pytest.mark.asyncio
+async def test_signed_session_mode(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch, query_counter: list[str]
+) -> None:
+    """Test that signed tokens authenticate without the DB, are reissued from the session and revoked on logout"""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "SESSION_TOKEN_MODE", "signed")
+    session_revocations.clear()
+    await client.post("/api/v1/auth/register", json={
+        "email": "signed@example.com",
+        "username": "signeduser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "signeduser",
+        "password": "SecurePass123!"
+    })
+    session_token = login_response.json()["session_token"]
+    access_token = login_response.cookies[ACCESS_COOKIE]
+    client.cookies.clear()
+
+    claims = decode_token(access_token)
+    assert "email" not in claims["usr"] and "full_name" not in claims["usr"]
+
+    # Authentication needs no query; /me loads the profile fields the token leaves out
+    query_counter.clear()
+    response = await client.get("/api/v1/auth/me", cookies={ACCESS_COOKIE: access_token})
+    assert response.status_code == 200
+    assert response.json()["username"] == "signeduser"
+    assert response.json()["email"] == "signed@example.com"
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    response = await client.get(
+        "/api/v1/auth/me", cookies={ACCESS_COOKIE: access_token}, headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+    assert query_counter == []
+
+    # No (or an expired) signed token: the session row is checked and a new token issued
+    response = await client.get("/api/v1/auth/me", cookies={"session_token": session_token})
+    assert response.status_code == 200
+    assert ACCESS_COOKIE in response.cookies
+    assert len(query_counter) == 1
+    client.cookies.clear()
+
+    response = await client.get("/api/v1/auth/me", cookies={ACCESS_COOKIE: "not-a-token"})
+    assert response.status_code == 401
+
+    # Logout revokes the session on this worker at once and on others after a sync
+    await client.post("/api/v1/auth/logout", cookies={"session_token": session_token, ACCESS_COOKIE: access_token})
+    client.cookies.clear()
+    response = await client.get("/api/v1/auth/me", cookies={ACCESS_COOKIE: access_token})
+    assert response.status_code == 401
+
+    session_id = session_id_from_token(access_token)
+    other_worker = SessionRevocations(ttl_seconds=300, sync_interval=1)
+    assert not other_worker.is_revoked(session_id)
+    await other_worker.sync(db_session)
+    assert other_worker.is_revoked(session_id)
+
+
+@pytest.mark.asyncio
+async def test_me_conditional_get(client: AsyncClient) -> None:
+    """Test that /me answers a matching If-None-Match with 304"""
+    await client.post("/api/v1/auth/register", json={
+        "email": "etag@example.com",
+        "username": "etaguser",
+        "password": "SecurePass123!"
+    })
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "etaguser",
+        "password": "SecurePass123!"
+    })
+    cookies = {"session_token": login_response.json()["session_token"]}
+
+    response = await client.get("/api/v1/auth/me", cookies=cookies)
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = await client.get("/api/v1/auth/me", cookies=cookies, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    response = await client.get("/api/v1/auth/me", cookies=cookies, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
 # ============================================================================
 # JWT TOKEN VALIDATION TESTS
 # ============================================================================
@@ -133,6 +133,8 @@ async def test_get_my_circles(client: AsyncClient, test_owner: User, test_circle
     assert circle_data[0]["description"] == "Circle for integration tests"
     assert circle_data[0]["owner_id"] == test_owner.id
     assert len(circle_data[0]["members"]) == 3
+    assert circle_data[0]["member_count"] == 3
+    assert circle_data[0]["current_user_role"] == "owner"
 
     assert len(circle_data) == 1
 
@@ -178,11 +180,129 @@ async def test_get_circle(client: AsyncClient, test_owner: User, test_circle: Ci
     - Should return 403 if user is not a member
     - Should return 404 if circle does not exist
     """
-    # TODO: Test access as owner
-    # TODO: Test access as member
-    # TODO: Test access as non-member (expect 403)
-    # TODO: Test invalid circle ID (expect 404)
-    pass
+    # Test access as owner
+    client.cookies.set("session_token", test_owner.session_token)
+    response = await client.get(f"/api/v1/circles/{test_circle.id}")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["owner_name"] == "owner"
+    assert result["member_count"] == 3
+    assert result["current_user_role"] == "owner"
+    assert result["members_next_cursor"] is None
+    # Owner is listed first
+    assert [m["role"] for m in result["members"]] == ["owner", "member", "member"]
+
+    # Test invalid circle ID (expect 404)
+    response = await client.get("/api/v1/circles/99999")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_circle_conditional(
+    client: AsyncClient, test_owner: User, test_non_owner: User, test_circle: Circle, query_counter: list[str]
+):
+    """
+    GET /circles/{circle_id} and /circles/my with If-None-Match
+    - 200 carries an ETag and a revalidation cache policy
+    - A matching ETag (weak or strong form) gets 304 without loading members,
+      with the same validator as the 200 (weak once a coding is negotiated)
+    - Membership changes bump the circle version and the ETag
+    """
+    client.cookies.set("session_token", test_owner.session_token)
+    response = await client.get(f"/api/v1/circles/{test_circle.id}")
+    etag = response.headers["etag"]
+    assert etag.startswith("W/")  # httpx accepts gzip
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    query_counter.clear()
+    response = await client.get(f"/api/v1/circles/{test_circle.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert len(query_counter) == 1  # circle + role only; member page skipped
+
+    identity = {"Accept-Encoding": "identity"}
+    response = await client.get(f"/api/v1/circles/{test_circle.id}", headers=identity)
+    strong_etag = response.headers["etag"]
+    assert strong_etag == etag.removeprefix("W/")
+    response = await client.get(f"/api/v1/circles/{test_circle.id}", headers={**identity, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == strong_etag
+
+    my_response = await client.get("/api/v1/circles/my")
+    my_etag = my_response.headers["etag"]
+    response = await client.get("/api/v1/circles/my", headers={"If-None-Match": my_etag})
+    assert response.status_code == 304
+
+    response = await client.post(f"/api/v1/circles/{test_circle.id}/members", json={"user_id": test_non_owner.id})
+    assert response.status_code == 201
+
+    response = await client.get(f"/api/v1/circles/{test_circle.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["member_count"] == 4
+    response = await client.get("/api/v1/circles/my", headers={"If-None-Match": my_etag})
+    assert response.status_code == 200
+
+    # Routes without their own policy keep no-store
+    response = await client.get(f"/api/v1/circles/{test_circle.id}/members")
+    assert response.headers["cache-control"] == "no-store"
+
+
+@pytest.mark.asyncio
+async def test_get_circle_forbidden_for_non_member(client: AsyncClient, test_non_owner: User, test_circle: Circle):
+    """GET /circles/{circle_id} returns 403 for non-members"""
+    client.cookies.set("session_token", test_non_owner.session_token)
+    response = await client.get(f"/api/v1/circles/{test_circle.id}")
+    assert response.status_code == 403
+
+    response = await client.get(f"/api/v1/circles/{test_circle.id}/members")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_get_circle_members_pagination(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_owner: User,
+    test_circle: Circle,
+    test_members: list[User]
+):
+    """
+    GET /circles/{circle_id}/members
+    - Pages are ordered by role, then joined_at
+    - next_cursor walks the whole member list without duplicates
+    """
+    # Promote one member so role ordering is visible across pages
+    member = await db_session.get(CircleMember, (test_circle.id, test_members[1].id))
+    member.role = CircleRole.MODERATOR
+    await db_session.commit()
+
+    client.cookies.set("session_token", test_owner.session_token)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(f"/api/v1/circles/{test_circle.id}/members", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["members"]) <= 1
+        seen.extend(page["members"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert [m["role"] for m in seen] == ["owner", "moderator", "member"]
+    assert [m["user_id"] for m in seen] == [test_owner.id, test_members[1].id, test_members[0].id]
+
+    # Garbage cursors are rejected
+    response = await client.get(
+        f"/api/v1/circles/{test_circle.id}/members", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
 
 
 @pytest.mark.asyncio
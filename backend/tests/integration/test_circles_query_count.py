@@ -0,0 +1,149 @@
+# backend/tests/integration/test_circles_query_count.py
+"""
+Query-count regression tests for Circle endpoints.
+Pins the number of SELECTs per request so N+1 patterns cannot creep back in.
+"""
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.query_log import QueryLog
+from app.core.session_cache import session_cache
+from app.db.models import Circle, CircleMember, User
+from app.schemas.social import CircleRole
+
+# Session lookup (1, or 0 when cached) + circles with owners (1) + members with usernames (1)
+MY_CIRCLES_QUERY_BUDGET = 3
+
+# Session lookup (1, or 0 when cached) + circle version/role (1) + circle/owner/count (1)
+# + first member page (1)
+CIRCLE_DETAIL_QUERY_BUDGET = 4
+
+
+@pytest_asyncio.fixture
+async def logged_in_owner(create_test_user, client: AsyncClient) -> User:
+    """Create a user to own the circles and log in"""
+    user = await create_test_user("qc_owner", "password123")
+
+    login_response = await client.post("/api/v1/auth/login", json={
+        "username": "qc_owner",
+        "password": "password123"
+    })
+    assert login_response.status_code == 200
+    client.cookies.set("session_token", login_response.json()["session_token"])
+    return user
+
+
+async def _add_circle(db_session: AsyncSession, owner: User, name: str, members: list[User]) -> Circle:
+    circle = Circle(name=name, description="Query count circle", owner_id=owner.id)
+    db_session.add(circle)
+    await db_session.flush()
+
+    db_session.add(CircleMember(circle_id=circle.id, user_id=owner.id, role=CircleRole.OWNER))
+    for member in members:
+        db_session.add(CircleMember(circle_id=circle.id, user_id=member.id, role=CircleRole.MEMBER))
+
+    await db_session.commit()
+    return circle
+
+
+@pytest.mark.asyncio
+async def test_get_my_circles_query_count_is_constant(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    logged_in_owner: User,
+    create_test_user,
+    query_counter: list[str],
+):
+    """
+    GET /circles/my
+    - Number of queries must not grow with circles or members
+    """
+    # Hashing is slow, so share a handful of users across circles
+    members = [await create_test_user(f"qc_member{i}", "password123") for i in range(4)]
+
+    await _add_circle(db_session, logged_in_owner, "QC Circle 0", members[:1])
+
+    query_counter.clear()
+    response = await client.get("/api/v1/circles/my")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    small_count = len(query_counter)
+
+    for i in range(1, 6):
+        await _add_circle(db_session, logged_in_owner, f"QC Circle {i}", members)
+
+    query_counter.clear()
+    response = await client.get("/api/v1/circles/my")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 6
+    assert all(circle["owner_name"] == "qc_owner" for circle in data)
+    assert sorted(c["member_count"] for c in data) == [2, 5, 5, 5, 5, 5]
+    assert {m["username"] for c in data for m in c["members"]} == {
+        "qc_owner", *(m.username for m in members)
+    }
+
+    assert len(query_counter) == small_count
+    assert len(query_counter) <= MY_CIRCLES_QUERY_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_get_circle_query_count_is_constant(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    logged_in_owner: User,
+    create_test_user,
+    query_counter: list[str],
+):
+    """
+    GET /circles/{circle_id}
+    - Number of queries must not grow with the member count
+    """
+    members = [await create_test_user(f"qc_member{i}", "password123") for i in range(4)]
+    small = await _add_circle(db_session, logged_in_owner, "QC Small", members[:1])
+    large = await _add_circle(db_session, logged_in_owner, "QC Large", members)
+
+    query_counter.clear()
+    response = await client.get(f"/api/v1/circles/{small.id}")
+    assert response.status_code == 200
+    assert response.json()["member_count"] == 2
+    small_count = len(query_counter)
+
+    query_counter.clear()
+    response = await client.get(f"/api/v1/circles/{large.id}")
+    assert response.status_code == 200
+    assert response.json()["member_count"] == 5
+
+    assert len(query_counter) == small_count
+    assert len(query_counter) <= CIRCLE_DETAIL_QUERY_BUDGET
+
+
+@pytest.mark.asyncio
+async def test_get_circle_within_budget_on_cold_session_cache(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    async_engine: AsyncEngine,
+    logged_in_owner: User,
+    create_test_user,
+    query_counter: list[str],
+):
+    """
+    GET /circles/{circle_id} right after the session cache was emptied
+    - The session lookup counts against the budget; with enforcement on the request still succeeds
+    """
+    members = [await create_test_user(f"qc_member{i}", "password123") for i in range(2)]
+    circle = await _add_circle(db_session, logged_in_owner, "QC Cold", members)
+
+    session_cache.clear()
+    query_log = QueryLog(async_engine, slow_ms=float("inf"), sample_rate=0, enforce_budgets=True)
+    query_counter.clear()
+    try:
+        response = await client.get(f"/api/v1/circles/{circle.id}")
+    finally:
+        query_log.remove()
+
+    assert response.status_code == 200
+    assert response.json()["member_count"] == 3
+    assert len(query_counter) == CIRCLE_DETAIL_QUERY_BUDGET
@@ -0,0 +1,143 @@
+# backend/tests/integration/test_feed_items.py
+"""
+Integration tests for the materialized (fan-out-on-write) feed.
+"""
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.feed_cache import feed_cache
+from app.db import feed
+from app.db.models import Circle, CircleMember, FeedItem, Post, User
+from app.schemas.social import CircleRole
+
+
+async def _login(client: AsyncClient, username: str) -> str:
+    response = await client.post("/api/v1/auth/login", json={
+        "username": username,
+        "password": "password123"
+    })
+    assert response.status_code == 200
+    return response.json()["session_token"]
+
+
+@pytest.fixture
+def write_mode(monkeypatch, db_session: AsyncSession) -> None:
+    """Switch to FEED_MODE=write and run background fan-out on the test session"""
+    @asynccontextmanager
+    async def _test_session():
+        yield db_session
+
+    monkeypatch.setattr(settings, "FEED_MODE", "write")
+    monkeypatch.setattr(feed, "AsyncSessionLocal", _test_session)
+
+
+@pytest_asyncio.fixture
+async def feed_circle(db_session: AsyncSession, create_test_user, client: AsyncClient) -> dict:
+    """Circle with an owner and one member, both logged in"""
+    owner = await create_test_user("feed_owner", "password123")
+    member = await create_test_user("feed_member", "password123")
+    outsider = await create_test_user("feed_outsider", "password123")
+
+    circle = Circle(name="Feed Circle", owner_id=owner.id)
+    db_session.add(circle)
+    await db_session.flush()
+    db_session.add(CircleMember(circle_id=circle.id, user_id=owner.id, role=CircleRole.OWNER))
+    db_session.add(CircleMember(circle_id=circle.id, user_id=member.id, role=CircleRole.MEMBER))
+    await db_session.commit()
+
+    return {
+        "circle": circle,
+        "owner": owner,
+        "member": member,
+        "outsider": outsider,
+        "owner_token": await _login(client, "feed_owner"),
+        "member_token": await _login(client, "feed_member"),
+        "outsider_token": await _login(client, "feed_outsider"),
+    }
+
+
+async def _feed_titles(client: AsyncClient, token: str) -> list[str]:
+    client.cookies.set("session_token", token)
+    response = await client.get("/api/v1/posts/feed")
+    assert response.status_code == 200
+    return [p["title"] for p in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_create_post_fans_out_to_members(client: AsyncClient, write_mode, feed_circle: dict, db_session: AsyncSession):
+    """POST /posts/ writes one feed row per circle member"""
+    client.cookies.set("session_token", feed_circle["owner_token"])
+    response = await client.post("/api/v1/posts/", json={
+        "title": "Fan out", "content": "Hello", "circle_id": feed_circle["circle"].id
+    })
+    assert response.status_code == 201
+
+    rows = await db_session.execute(
+        select(FeedItem.user_id).where(FeedItem.post_id == response.json()["id"])
+    )
+    assert set(rows.scalars().all()) == {feed_circle["owner"].id, feed_circle["member"].id}
+
+    assert await _feed_titles(client, feed_circle["member_token"]) == ["Fan out"]
+    assert await _feed_titles(client, feed_circle["outsider_token"]) == []
+
+
+@pytest.mark.asyncio
+async def test_membership_changes_update_feed(client: AsyncClient, write_mode, feed_circle: dict, db_session: AsyncSession):
+    """Adding a member backfills recent posts; removing a member prunes them"""
+    circle = feed_circle["circle"]
+    db_session.add(Post(title="Existing", content="Old post", author_id=feed_circle["owner"].id, circle_id=circle.id))
+    await db_session.commit()
+
+    client.cookies.set("session_token", feed_circle["owner_token"])
+    response = await client.post(
+        f"/api/v1/circles/{circle.id}/members", json={"user_id": feed_circle["outsider"].id}
+    )
+    assert response.status_code == 201
+    assert await _feed_titles(client, feed_circle["outsider_token"]) == ["Existing"]
+
+    client.cookies.set("session_token", feed_circle["owner_token"])
+    response = await client.delete(f"/api/v1/circles/{circle.id}/members/{feed_circle['outsider'].id}")
+    assert response.status_code == 200
+    assert await _feed_titles(client, feed_circle["outsider_token"]) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_post_prunes_feed(client: AsyncClient, write_mode, feed_circle: dict, db_session: AsyncSession):
+    """DELETE /posts/{id} removes the post from every materialized feed"""
+    client.cookies.set("session_token", feed_circle["owner_token"])
+    response = await client.post("/api/v1/posts/", json={
+        "title": "Short lived", "content": "Bye", "circle_id": feed_circle["circle"].id
+    })
+    post_id = response.json()["id"]
+
+    response = await client.delete(f"/api/v1/posts/{post_id}")
+    assert response.status_code == 204
+
+    rows = await db_session.execute(select(FeedItem).where(FeedItem.post_id == post_id))
+    assert rows.scalars().all() == []
+    assert await _feed_titles(client, feed_circle["member_token"]) == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_all_matches_read_time_feed(client: AsyncClient, feed_circle: dict, db_session: AsyncSession, monkeypatch):
+    """backfill_all produces the same feed as the read-time query"""
+    owner: User = feed_circle["owner"]
+    db_session.add_all([
+        Post(title=f"Post {i}", content="Content", author_id=owner.id, circle_id=feed_circle["circle"].id)
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    read_time = await _feed_titles(client, feed_circle["member_token"])
+
+    await feed.backfill_all(db_session)
+    monkeypatch.setattr(settings, "FEED_MODE", "write")
+    feed_cache.clear()
+    assert await _feed_titles(client, feed_circle["member_token"]) == read_time
+    assert len(read_time) == 3
@@ -0,0 +1,74 @@
+# backend/tests/integration/test_metrics.py
+"""
+Integration tests for GET /metrics and the in-process registry
+(app/core/metrics.py).
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.metrics import MetricsRegistry
+
+
+def _sample(body: str, prefix: str) -> float:
+    """Value of the first sample line starting with prefix"""
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} not in /metrics")
+
+
+def test_histogram_exposition_format():
+    """Buckets are cumulative and end with +Inf, _sum and _count"""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, "/a")
+    latency.observe(0.5, "/a")
+    latency.observe(5, "/a")
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.55' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_label_values_escaped():
+    """Quotes and backslashes cannot break the text format"""
+    registry = MetricsRegistry()
+    registry.counter("hits_total", "Hits", ("route",)).inc('/x"\\')
+    assert 'hits_total{route="/x\\"\\\\"} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics_use_route_templates(client: AsyncClient):
+    """Requests are labelled by route template; unknown paths share one label"""
+    await client.get("/api/v1/circles/12345")  # 401, but the route matched
+    await client.get("/no/such/path/98765")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    assert _sample(body, 'http_requests_total{method="GET",route="/api/v1/circles/{circle_id}",status="401"}') >= 1
+    assert _sample(body, 'http_request_duration_seconds_count{method="GET",route="/api/v1/circles/{circle_id}"}') >= 1
+    assert _sample(body, 'http_requests_total{method="GET",route="unmatched",status="404"}') >= 1
+    assert "12345" not in body and "98765" not in body
+
+    # The scrape itself is in flight while rendering
+    assert _sample(body, "http_requests_in_flight") >= 1
+    for family in ("db_pool_checked_out", "db_queries_total", "session_cache_hit_ratio", "password_hash_queue_depth"):
+        assert f"# TYPE {family} " in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_token(client: AsyncClient, monkeypatch):
+    """With METRICS_TOKEN set, scrapes need the bearer token"""
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+    assert (await client.get("/metrics")).status_code == 401
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
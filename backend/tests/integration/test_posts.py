@@ -106,6 +106,61 @@ async def test_get_feed_with_posts(client: AsyncClient, test_author: User, test_
     assert "Post 2" in titles
 
 
+@pytest.mark.asyncio
+async def test_get_feed_cursor_pagination(client: AsyncClient, test_author: User, test_circle_with_members: Circle, db_session: AsyncSession):
+    """GET /posts/feed pages through posts with the X-Next-Cursor header"""
+    posts = [
+        Post(title=f"Feed Post {i}", content="Content", author_id=test_author.id, circle_id=test_circle_with_members.id)
+        for i in range(5)
+    ]
+    db_session.add_all(posts)
+    await db_session.commit()
+
+    client.cookies.set("session_token", test_author.session_token)
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/v1/posts/feed", params=params)
+        assert response.status_code == 200
+        seen.extend(p["id"] for p in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    # Same created_at within one transaction: ties are broken by id, newest first
+    assert seen == sorted((p.id for p in posts), reverse=True)
+
+    response = await client.get("/api/v1/posts/feed", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_invalidated_by_writes(client: AsyncClient, test_author: User, test_circle_with_members: Circle, db_session: AsyncSession):
+    """GET /posts/feed is cached until a post in one of the user's circles changes"""
+    client.cookies.set("session_token", test_author.session_token)
+    assert (await client.get("/api/v1/posts/feed")).json() == []
+
+    # Written behind the API's back: the cached page is still served
+    db_session.add(Post(title="Direct", content="Content", author_id=test_author.id, circle_id=test_circle_with_members.id))
+    await db_session.commit()
+    assert (await client.get("/api/v1/posts/feed")).json() == []
+
+    response = await client.post("/api/v1/posts/", json={
+        "title": "Via API", "content": "Content", "circle_id": test_circle_with_members.id
+    })
+    assert response.status_code == 201
+    post_id = response.json()["id"]
+    titles = [p["title"] for p in (await client.get("/api/v1/posts/feed")).json()]
+    assert titles == ["Via API", "Direct"]
+
+    response = await client.delete(f"/api/v1/posts/{post_id}")
+    assert response.status_code == 204
+    titles = [p["title"] for p in (await client.get("/api/v1/posts/feed")).json()]
+    assert titles == ["Direct"]
+
+
 @pytest.mark.asyncio
 async def test_create_post_in_circle(client: AsyncClient, test_author: User, test_non_member: User, test_circle_with_members: Circle):
     """POST /posts/ creates post successfully in a circle"""
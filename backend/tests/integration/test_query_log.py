@@ -0,0 +1,116 @@
+# backend/tests/integration/test_query_log.py
+"""
+Integration tests for the slow-query log and per-request query accounting
+(app/core/query_log.py).
+"""
+import logging
+import re
+from collections.abc import Generator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.query_log import QueryBudgetExceeded, QueryLog, parameter_shape
+from app.core.request_context import RequestDbStats, request_db_stats, route_template
+
+
+@pytest.fixture
+def log_every_query(async_engine: AsyncEngine) -> Generator[QueryLog, None, None]:
+    """QueryLog on the test engine that treats every statement as slow"""
+    query_log = QueryLog(async_engine, slow_ms=0, sample_rate=0)
+    yield query_log
+    query_log.remove()
+
+
+def test_parameter_shape_hides_values():
+    """Only parameter types are described"""
+    assert parameter_shape((1, "secret", None)) == ["int", "str", "NoneType"]
+    assert parameter_shape({"id": 1, "name": "secret"}) == {"id": "int", "name": "str"}
+    assert parameter_shape([(1, "a"), (2, "b")]) == {"rows": 2, "row": ["int", "str"]}
+
+
+def test_route_template_adds_include_prefix():
+    """Router-relative route paths are completed with the include prefix"""
+    class Route:
+        path = "/circles/{circle_id}/members/{user_id}"
+
+    scope = {"path": "/api/v1/circles/5/members/7", "route": Route()}
+    assert route_template(scope) == "/api/v1/circles/{circle_id}/members/{user_id}"
+    assert route_template({"path": "/missing"}) == "/missing"
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_logged_with_route_not_values(client: AsyncClient, create_test_user, log_every_query: QueryLog, caplog):
+    """Slow statements carry the route template and parameter types, never the values"""
+    await create_test_user("query_log_user", "password123")
+    caplog.clear()
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        response = await client.post("/api/v1/auth/login", json={
+            "username": "query_log_user",
+            "password": "password123"
+        })
+    assert response.status_code == 200
+
+    entries = [r.msg for r in caplog.records if isinstance(r.msg, dict) and r.msg.get("event") == "slow_query"]
+    assert entries
+    assert all(entry["route"] == "POST /api/v1/auth/login" for entry in entries)
+    assert any("str" in entry["params"] for entry in entries)
+    assert "query_log_user" not in caplog.text
+    assert "password123" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_fast_queries_sampled(client: AsyncClient, async_engine: AsyncEngine, caplog):
+    """Below the threshold, statements are only logged as samples"""
+    query_log = QueryLog(async_engine, slow_ms=60_000, sample_rate=1.0)
+    try:
+        with caplog.at_level(logging.INFO, logger="app.sql"):
+            response = await client.get("/api/v1/posts/feed")
+    finally:
+        query_log.remove()
+    assert response.status_code == 401
+
+    events = {r.msg["event"] for r in caplog.records if isinstance(r.msg, dict) and r.name == "app.sql"}
+    assert query_log.slow == 0
+    assert events <= {"query_sample"}
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_request_queries(client: AsyncClient, create_test_user, async_engine: AsyncEngine):
+    """Each response carries the request's statement count and DB time"""
+    await create_test_user("timing_user", "password123")
+    response = await client.post("/api/v1/auth/login", json={
+        "username": "timing_user",
+        "password": "password123"
+    })
+    client.cookies.set("session_token", response.json()["session_token"])
+
+    query_log = QueryLog(async_engine, slow_ms=float("inf"), sample_rate=0)
+    try:
+        response = await client.get("/api/v1/circles/my")
+    finally:
+        query_log.remove()
+    assert response.status_code == 200
+
+    timing = response.headers["server-timing"]
+    match = re.match(r'db;dur=[\d.]+;desc="(\d+) queries", app;dur=[\d.]+$', timing)
+    assert match
+    # Cached session, so only the circles and members queries remain
+    assert 1 <= int(match.group(1)) <= 3
+
+
+@pytest.mark.asyncio
+async def test_query_budget_enforced(async_engine: AsyncEngine, db_session: AsyncSession):
+    """With enforcement on, the statement beyond the budget is refused"""
+    query_log = QueryLog(async_engine, slow_ms=float("inf"), sample_rate=0, enforce_budgets=True)
+    token = request_db_stats.set(RequestDbStats(query_budget=1))
+    try:
+        await db_session.execute(text("SELECT 1"))
+        with pytest.raises(QueryBudgetExceeded):
+            await db_session.execute(text("SELECT 2"))
+    finally:
+        request_db_stats.reset(token)
+        query_log.remove()
@@ -0,0 +1,70 @@
+# backend/tests/integration/test_request_logging.py
+"""
+Integration tests for the request logging middleware and JSON log format
+(app/core/request_logging.py).
+"""
+import json
+import logging
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.request_logging import JsonFormatter
+
+
+def _request_logs(caplog) -> list[dict]:
+    return [
+        r.msg for r in caplog.records
+        if isinstance(r.msg, dict) and r.msg.get("event") == "http_request"
+    ]
+
+
+def test_json_formatter_merges_dict_messages():
+    """Dict messages become top-level JSON fields next to the request id"""
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, {"event": "x", "n": 1}, None, None)
+    record.request_id = "abc123def"
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["event"] == "x"
+    assert entry["n"] == 1
+    assert entry["request_id"] == "abc123def"
+    assert entry["level"] == "INFO"
+
+
+@pytest.mark.asyncio
+async def test_request_id_generated_or_reused(client: AsyncClient):
+    """A well-formed X-Request-ID is echoed back; otherwise a new one is generated"""
+    response = await client.get("/health", headers={"X-Request-ID": "trace-12345678"})
+    assert response.headers["x-request-id"] == "trace-12345678"
+
+    response = await client.get("/health", headers={"X-Request-ID": "bad id\n"})
+    assert response.headers["x-request-id"] != "bad id\n"
+    assert len(response.headers["x-request-id"]) == 32
+
+
+@pytest.mark.asyncio
+async def test_request_log_line(client: AsyncClient, caplog):
+    """Each request logs one http_request line with the route template"""
+    with caplog.at_level(logging.INFO, logger="app.request"):
+        response = await client.get("/api/v1/posts/123")
+    assert response.status_code == 401
+
+    [entry] = _request_logs(caplog)
+    assert entry["route"] == "GET /api/v1/posts/{post_id}"
+    assert entry["url"] == "/api/v1/posts/123"
+    assert entry["status_code"] == 401
+
+
+@pytest.mark.asyncio
+async def test_success_logs_sampled_per_route(client: AsyncClient, caplog, monkeypatch):
+    """Routes sampled at 0 drop successful request logs but keep errors"""
+    monkeypatch.setattr(settings, "LOG_ROUTE_SAMPLE_RATES", {"GET /health": 0.0})
+
+    with caplog.at_level(logging.INFO, logger="app.request"):
+        assert (await client.get("/health")).status_code == 200
+        assert (await client.get("/api/health")).status_code == 200
+        assert (await client.get("/does-not-exist")).status_code == 404
+
+    urls = [entry["url"] for entry in _request_logs(caplog)]
+    assert urls == ["/api/health", "/does-not-exist"]
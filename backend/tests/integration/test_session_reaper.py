@@ -0,0 +1,57 @@
+# backend/tests/integration/test_session_reaper.py
+"""
+Integration tests for the expired session reaper.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import hash_session_token
+from app.core.session_reaper import purge_expired_revocations, purge_expired_sessions
+from app.db.models import SessionRevocation, UserSession
+
+
+def _session(token: str, expires_in: timedelta) -> UserSession:
+    now = datetime.now()
+    return UserSession(
+        token_hash=hash_session_token(token),
+        user_id=1,
+        created_at=now - timedelta(days=2),
+        expires_at=now + expires_in,
+    )
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_sessions_in_batches(db_session: AsyncSession):
+    """Expired sessions are deleted at most batch_size at a time; live ones are kept"""
+    db_session.add_all([_session(f"expired-{i}", timedelta(hours=-1 - i)) for i in range(5)])
+    db_session.add(_session("live", timedelta(hours=1)))
+    await db_session.commit()
+
+    assert await purge_expired_sessions(db_session, batch_size=2) == 2
+    assert await purge_expired_sessions(db_session, batch_size=2) == 2
+    assert await purge_expired_sessions(db_session, batch_size=2) == 1
+    assert await purge_expired_sessions(db_session, batch_size=2) == 0
+
+    remaining = await db_session.execute(select(UserSession.token_hash))
+    assert remaining.scalars().all() == [hash_session_token("live")]
+
+    count = await db_session.scalar(select(func.count()).select_from(UserSession))
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_revocations(db_session: AsyncSession):
+    """Revocations no signed token can outlive are deleted; live ones are kept"""
+    now = datetime.now()
+    db_session.add_all([
+        SessionRevocation(session_id=1, expires_at=now - timedelta(minutes=1)),
+        SessionRevocation(session_id=2, expires_at=now + timedelta(minutes=4)),
+    ])
+    await db_session.commit()
+
+    assert await purge_expired_revocations(db_session) == 1
+    remaining = await db_session.execute(select(SessionRevocation.session_id))
+    assert remaining.scalars().all() == [2]
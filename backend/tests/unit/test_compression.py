@@ -0,0 +1,176 @@
+"""
+Unit tests for backend/app/core/compression.py
+Tests content negotiation and the compression middleware (plain ASGI, no app)
+"""
+import asyncio
+import gzip
+import json
+from typing import Any
+
+import pytest
+
+from app.core.compression import CompressionMiddleware, GzipEncoder, negotiate_encoding
+from app.core.security_headers import SecurityHeadersMiddleware
+
+PAYLOAD = json.dumps([{"id": i, "title": f"Post {i}", "content": "Lorem ipsum " * 5} for i in range(50)]).encode()
+
+
+def make_endpoint(body: bytes = PAYLOAD, headers: list | None = None, chunks: int = 1):
+    async def endpoint(scope: Any, receive: Any, send: Any) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers if headers is not None else [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        size = -(-len(body) // chunks)
+        for i in range(chunks):
+            await send({
+                "type": "http.response.body",
+                "body": body[i * size:(i + 1) * size],
+                "more_body": i < chunks - 1,
+            })
+    return endpoint
+
+
+def request(app: Any, accept_encoding: str | None = "gzip", path: str = "/api/v1/posts/feed") -> tuple[dict, bytes, int]:
+    """Run one GET through app; returns (headers, body, number of body messages)"""
+    messages: list[dict] = []
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    scope = {"type": "http", "method": "GET", "path": path, "headers": headers}
+    asyncio.run(app(scope, receive, send))
+
+    bodies = [m for m in messages if m["type"] == "http.response.body"]
+    return dict(messages[0]["headers"]), b"".join(m["body"] for m in bodies), len(bodies)
+
+
+def gzip_only(app: Any, **kwargs: Any) -> CompressionMiddleware:
+    return CompressionMiddleware(app, minimum_size=500, encoders={"gzip": lambda: GzipEncoder(6)}, **kwargs)
+
+
+class TestNegotiateEncoding:
+    """Test Accept-Encoding negotiation"""
+
+    @pytest.mark.parametrize(("header", "expected"), [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0.8, gzip;q=0.8", "br"),
+        ("*", "zstd"),
+        ("*;q=0.5, zstd;q=0", "br"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("deflate", None),
+    ])
+    def test_negotiation(self, header, expected):
+        assert negotiate_encoding(header, ["zstd", "br", "gzip"]) == expected
+
+
+class TestCompressionMiddleware:
+    """Test when and how responses are compressed"""
+
+    def test_large_response_compressed(self):
+        """Test that a large JSON body is gzipped with matching length and Vary"""
+        headers, body, _ = request(gzip_only(make_endpoint()))
+
+        assert headers[b"content-encoding"] == b"gzip"
+        assert headers[b"vary"] == b"accept-encoding"
+        assert int(headers[b"content-length"]) == len(body)
+        assert gzip.decompress(body) == PAYLOAD
+
+    def test_small_or_unaccepted_response_untouched(self):
+        """Test the size threshold and clients without Accept-Encoding"""
+        headers, body, _ = request(gzip_only(make_endpoint(body=b'{"ok": true}')))
+        assert b"content-encoding" not in headers
+        assert body == b'{"ok": true}'
+
+        headers, body, _ = request(gzip_only(make_endpoint()), accept_encoding=None)
+        assert b"content-encoding" not in headers
+        assert body == PAYLOAD
+
+    def test_never_double_compressed(self):
+        """Test that an already encoded body passes through"""
+        encoded = gzip.compress(PAYLOAD)
+        endpoint = make_endpoint(body=encoded, headers=[
+            (b"content-type", b"application/json"), (b"content-encoding", b"gzip")
+        ])
+        headers, body, _ = request(gzip_only(endpoint))
+        assert body == encoded
+
+    def test_no_transform_and_binary_types_skipped(self):
+        """Test Cache-Control: no-transform and non-text content types"""
+        endpoint = make_endpoint(headers=[
+            (b"content-type", b"application/json"), (b"cache-control", b"no-store, no-transform")
+        ])
+        assert b"content-encoding" not in request(gzip_only(endpoint))[0]
+
+        endpoint = make_endpoint(headers=[(b"content-type", b"image/png")])
+        assert b"content-encoding" not in request(gzip_only(endpoint))[0]
+
+    def test_no_store_kept_and_etag_weakened(self):
+        """Test that security headers survive and strong ETags become weak"""
+        endpoint = make_endpoint(headers=[
+            (b"content-type", b"application/json"), (b"etag", b'"abc"'), (b"vary", b"origin")
+        ])
+        app = gzip_only(SecurityHeadersMiddleware(endpoint))
+        headers, _, _ = request(app)
+
+        assert headers[b"cache-control"] == b"no-store"
+        assert headers[b"etag"] == b'W/"abc"'
+        assert headers[b"vary"] == b"origin, accept-encoding"
+
+    def test_not_modified_and_small_responses_get_the_same_weak_etag(self):
+        """Test that 304s and uncompressed small bodies repeat the validator of a compressed 200"""
+        async def not_modified(scope: Any, receive: Any, send: Any) -> None:
+            await send({"type": "http.response.start", "status": 304, "headers": [(b"etag", b'"abc"')]})
+            await send({"type": "http.response.body", "body": b""})
+
+        headers, _, _ = request(gzip_only(not_modified))
+        assert headers[b"etag"] == b'W/"abc"'
+        assert headers[b"vary"] == b"accept-encoding"
+
+        small = make_endpoint(body=b'{"ok": true}', headers=[
+            (b"content-type", b"application/json"), (b"content-length", b"12"), (b"etag", b'"abc"')
+        ])
+        headers, body, _ = request(gzip_only(small))
+        assert b"content-encoding" not in headers
+        assert headers[b"etag"] == b'W/"abc"'
+        assert headers[b"content-length"] == b"12"
+
+        # No coding negotiated: the strong ETag is left alone
+        headers, _, _ = request(gzip_only(not_modified), accept_encoding="identity")
+        assert headers[b"etag"] == b'"abc"'
+
+    def test_streaming_response(self):
+        """Test that streamed bodies are compressed chunk by chunk"""
+        headers, body, messages = request(gzip_only(make_endpoint(chunks=4)))
+
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        assert messages == 4
+        assert gzip.decompress(body) == PAYLOAD
+
+    def test_excluded_prefix(self):
+        """Test that auth responses are never compressed"""
+        app = gzip_only(make_endpoint(), exclude_prefixes=("/api/v1/auth",))
+        assert b"content-encoding" not in request(app, path="/api/v1/auth/login")[0]
+
+    @pytest.mark.parametrize("coding", ["br", "zstd"])
+    def test_optional_codings_round_trip(self, coding):
+        """Test brotli / zstd output when the optional packages are installed"""
+        module = pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[coding])
+        headers, body, _ = request(CompressionMiddleware(make_endpoint(chunks=3), minimum_size=500), accept_encoding=coding)
+
+        assert headers[b"content-encoding"] == coding.encode()
+        if coding == "br":
+            assert module.decompress(body) == PAYLOAD
+        else:
+            assert module.ZstdDecompressor().decompressobj().decompress(body) == PAYLOAD
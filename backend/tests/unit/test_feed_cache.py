@@ -0,0 +1,109 @@
+"""
+Unit tests for backend/app/core/feed_cache.py
+Tests page eligibility, TTL expiry, LRU eviction, per-user invalidation and counters (without database)
+"""
+from app.core.feed_cache import FeedCache
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(**overrides) -> FeedCache:
+    options = {"max_entries": 10, "ttl_seconds": 15, "pages": 3, "max_page_size": 50}
+    options.update(overrides)
+    return FeedCache(**options)
+
+
+class TestFeedCache:
+    """Test the (user, page) -> feed page cache"""
+
+    def test_hit_returns_page_and_cursor(self):
+        """Test that a stored page is returned with its next cursor"""
+        cache = make_cache()
+        cache.put(1, 20, 0, ["post"], "cursor", cache.epoch)
+
+        assert cache.get(1, 20, 0) == (["post"], "cursor")
+        assert cache.get(1, 20, 20) is None
+        assert cache.get(2, 20, 0) is None
+
+    def test_only_first_pages_are_cacheable(self):
+        """Test that deep pages, oversized pages and a disabled cache are skipped"""
+        cache = make_cache(pages=2, max_page_size=50)
+        assert cache.cacheable(20, 0)
+        assert cache.cacheable(20, 20)
+        assert not cache.cacheable(20, 40)
+        assert not cache.cacheable(51, 0)
+        assert not cache.cacheable(0, 0)
+        assert not make_cache(max_entries=0).cacheable(20, 0)
+
+        cache.put(1, 20, 40, ["deep"], None, cache.epoch)
+        assert cache.stats()["size"] == 0
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once the TTL has passed"""
+        clock = FakeClock()
+        cache = make_cache(ttl_seconds=15, clock=clock)
+        cache.put(1, 20, 0, ["post"], None, cache.epoch)
+
+        clock.now += 14
+        assert cache.get(1, 20, 0) is not None
+        clock.now += 2
+        assert cache.get(1, 20, 0) is None
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used page is evicted when full"""
+        cache = make_cache(max_entries=2)
+        cache.put(1, 20, 0, ["a"], None, cache.epoch)
+        cache.put(2, 20, 0, ["b"], None, cache.epoch)
+        cache.get(1, 20, 0)  # 2 is now the oldest
+        cache.put(3, 20, 0, ["c"], None, cache.epoch)
+
+        assert cache.get(2, 20, 0) is None
+        assert cache.get(1, 20, 0) is not None
+        assert cache.get(3, 20, 0) is not None
+        assert cache.evictions == 1
+
+    def test_invalidate_users_drops_only_their_pages(self):
+        """Test that invalidation removes every page of the given users and nothing else"""
+        cache = make_cache()
+        cache.put(1, 20, 0, ["a"], None, cache.epoch)
+        cache.put(1, 20, 20, ["a2"], None, cache.epoch)
+        cache.put(2, 20, 0, ["b"], None, cache.epoch)
+
+        cache.invalidate_users([1, 99])
+
+        assert cache.get(1, 20, 0) is None
+        assert cache.get(1, 20, 20) is None
+        assert cache.get(2, 20, 0) == (["b"], None)
+        assert cache.invalidations == 1
+        assert cache.stats()["users"] == 1
+
+    def test_put_after_invalidation_is_dropped(self):
+        """Test that a page computed before an invalidation is not stored"""
+        cache = make_cache()
+        epoch = cache.epoch  # read starts
+        cache.invalidate_users([1])  # concurrent write commits
+        cache.put(1, 20, 0, ["stale"], None, epoch)
+
+        assert cache.get(1, 20, 0) is None
+
+    def test_stats(self):
+        """Test that stats reports size, counters and hit ratio"""
+        cache = make_cache()
+        cache.get(1, 20, 0)
+        cache.put(1, 20, 0, ["a"], None, cache.epoch)
+        cache.get(1, 20, 0)
+
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
@@ -0,0 +1,90 @@
+"""
+Unit tests for backend/app/core/login_throttle.py
+Tests the per-username failure backoff with a fake clock
+"""
+from app.core.login_throttle import LoginThrottle
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_throttle(clock: FakeClock, max_entries: int = 100) -> LoginThrottle:
+    return LoginThrottle(
+        max_entries=max_entries,
+        free_failures=3,
+        base_delay=1.0,
+        max_delay=8.0,
+        reset_seconds=60.0,
+        clock=clock,
+    )
+
+
+class TestLoginThrottle:
+    """Test the backoff schedule and the table bounds"""
+
+    def test_free_failures_not_delayed(self):
+        """Test that the first free_failures failures do not block"""
+        throttle = make_throttle(FakeClock())
+        for _ in range(3):
+            assert throttle.check("alice") == 0
+            throttle.record_failure("alice")
+        assert throttle.check("alice") == 0
+
+    def test_backoff_doubles_and_caps(self):
+        """Test the delay after each failure beyond the free budget"""
+        clock = FakeClock()
+        throttle = make_throttle(clock)
+        for _ in range(3):
+            throttle.record_failure("alice")
+
+        delays = []
+        for _ in range(6):
+            throttle.record_failure("alice")
+            delays.append(throttle.check("alice"))
+            clock.now += delays[-1]
+        assert delays == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+        assert throttle.rejected == 6
+
+    def test_admitted_attempt_reserves_slot(self):
+        """Test that parallel guesses past the free budget get one attempt per slot"""
+        throttle = make_throttle(FakeClock())
+        for _ in range(3):
+            throttle.record_failure("alice")
+
+        assert throttle.check("alice") == 0
+        assert throttle.check("alice") == 1.0
+        assert throttle.check("bob") == 0  # other usernames unaffected
+
+    def test_success_and_quiet_period_reset(self):
+        """Test that a success or reset_seconds without failures clears the count"""
+        clock = FakeClock()
+        throttle = make_throttle(clock)
+        for _ in range(5):
+            throttle.record_failure("alice")
+        throttle.record_success("alice")
+        assert throttle.check("alice") == 0
+
+        for _ in range(5):
+            throttle.record_failure("bob")
+        clock.now += 61
+        assert throttle.check("bob") == 0
+        assert throttle.stats()["tracked"] == 0
+
+    def test_bounded_and_disabled(self):
+        """Test LRU eviction and that max_entries=0 disables the throttle"""
+        throttle = make_throttle(FakeClock(), max_entries=2)
+        for username in ("a", "b", "c"):
+            throttle.record_failure(username)
+        stats = throttle.stats()
+        assert stats["tracked"] == 2
+        assert stats["evictions"] == 1
+
+        disabled = make_throttle(FakeClock(), max_entries=0)
+        for _ in range(10):
+            disabled.record_failure("alice")
+        assert disabled.check("alice") == 0
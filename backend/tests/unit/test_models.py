@@ -294,24 +294,29 @@ class TestUserSessionModel:
         column_names = [col.key for col in mapper.columns]
 
         required_columns = [
-            "id", "session_token", "user_id", "created_at",
+            "id", "token_hash", "user_id", "created_at",
             "expires_at", "ip_address", "user_agent"
         ]
         for col in required_columns:
             assert col in column_names, f"Missing column: {col}"
 
-    def test_session_token_is_unique(self):
-        """Test that session_token has unique constraint"""
+    def test_token_hash_is_unique(self):
+        """Test that token_hash has unique constraint"""
         mapper = inspect(UserSession)
-        token_col = mapper.columns["session_token"]
+        token_col = mapper.columns["token_hash"]
         assert token_col.unique is True
 
-    def test_session_token_has_index(self):
-        """Test that session_token is indexed"""
+    def test_token_hash_has_index(self):
+        """Test that token_hash is indexed"""
         mapper = inspect(UserSession)
-        token_col = mapper.columns["session_token"]
+        token_col = mapper.columns["token_hash"]
         assert token_col.index is True
 
+    def test_raw_token_not_stored(self):
+        """Test that only the digest is stored, never the raw bearer token"""
+        mapper = inspect(UserSession)
+        assert "session_token" not in [col.key for col in mapper.columns]
+
     def test_user_session_repr(self):
         """Test UserSession __repr__ method"""
         # Create a mock session object
@@ -338,7 +343,7 @@ class TestUserSessionModel:
         """Test that core session fields are not nullable"""
         mapper = inspect(UserSession)
 
-        required_fields = ["session_token", "user_id", "created_at", "expires_at"]
+        required_fields = ["token_hash", "user_id", "created_at", "expires_at"]
         for field_name in required_fields:
             col = mapper.columns[field_name]
             assert col.nullable is False, f"{field_name} should not be nullable"
@@ -443,11 +448,11 @@ class TestModelConstraints:
         role_col = mapper.columns["role"]
         assert role_col.type.length == 20
 
-    def test_session_token_max_length(self):
-        """Test UserSession token has max length constraint"""
+    def test_token_hash_length(self):
+        """Test UserSession token digest is a fixed 32 bytes (SHA-256)"""
         mapper = inspect(UserSession)
-        token_col = mapper.columns["session_token"]
-        assert token_col.type.length == 255
+        token_col = mapper.columns["token_hash"]
+        assert token_col.type.length == 32
 
 
 class TestModelInheritance:
@@ -0,0 +1,123 @@
+"""
+Unit tests for backend/app/core/rate_limit_storage.py
+Tests the sliding window counter storages through the `limits` strategies
+"""
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+
+from app.core import rate_limit_storage
+from app.core.rate_limit_storage import BoundedMemoryStorage, SqliteStorage
+
+
+class FakeTime:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake = FakeTime(60_000.0)  # start of a minute window
+    monkeypatch.setattr(rate_limit_storage.time, "time", fake)
+    return fake
+
+
+@pytest.fixture(params=["bounded-memory", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "sqlite":
+        return storage_from_string(f"sqlite://{tmp_path}/limits.db")
+    return storage_from_string("bounded-memory://")
+
+
+class TestSlidingWindowStorages:
+    """Test the sliding window counter on both storages"""
+
+    def test_limit_enforced_within_window(self, storage, clock):
+        """Test that the sixth hit of 5/minute is rejected"""
+        limiter = SlidingWindowCounterRateLimiter(storage)
+        item = parse("5/minute")
+
+        assert [limiter.hit(item, "1.2.3.4") for _ in range(6)] == [True] * 5 + [False]
+        assert limiter.hit(item, "5.6.7.8") is True  # other keys unaffected
+
+    def test_previous_window_weighted(self, storage, clock):
+        """Test that the previous window counts in proportion to its overlap"""
+        limiter = SlidingWindowCounterRateLimiter(storage)
+        item = parse("10/minute")
+        for _ in range(10):
+            limiter.hit(item, "ip")
+
+        # 30s into the next window half of the previous 10 still count
+        clock.now += 90
+        assert [limiter.hit(item, "ip") for _ in range(6)] == [True] * 5 + [False]
+
+        # Two windows later nothing is left
+        clock.now += 120
+        assert limiter.get_window_stats(item, "ip").remaining == 10
+
+    def test_fixed_window_supported(self, storage, clock):
+        """Test incr/get for the fixed-window strategy"""
+        limiter = FixedWindowRateLimiter(storage)
+        item = parse("2/minute")
+        assert [limiter.hit(item, "ip") for _ in range(3)] == [True, True, False]
+        clock.now += 61
+        assert limiter.hit(item, "ip") is True
+
+
+class TestKeyBounds:
+    """Test that key tables stay bounded"""
+
+    def test_memory_lru_eviction(self, clock):
+        """Test that the least recently used key is evicted first"""
+        storage = BoundedMemoryStorage("bounded-memory://?max_keys=2")
+        limiter = SlidingWindowCounterRateLimiter(storage)
+        item = parse("1/minute")
+
+        limiter.hit(item, "a")
+        limiter.hit(item, "b")
+        limiter.hit(item, "a")  # rejected, but refreshes a
+        limiter.hit(item, "c")  # evicts b
+
+        assert len(storage._keys) == 2
+        assert storage.evictions == 1
+        assert limiter.hit(item, "b") is True
+        assert limiter.hit(item, "c") is False
+
+    def test_sqlite_shared_and_pruned(self, tmp_path, clock, monkeypatch):
+        """Test that two storages on one file (two workers) share counts, and pruning"""
+        monkeypatch.setattr(SqliteStorage, "PRUNE_EVERY", 10)
+        uri = f"sqlite://{tmp_path}/shared.db?max_keys=5"
+        worker_a = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+        worker_b = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+        item = parse("2/minute")
+
+        assert worker_a.hit(item, "ip") is True
+        assert worker_b.hit(item, "ip") is True
+        assert worker_a.hit(item, "ip") is False
+
+        for i in range(20):
+            clock.now += 0.001
+            worker_b.hit(item, f"client-{i}")
+        rows = worker_b.storage._connection().execute("SELECT count(*) FROM rate_limits").fetchone()[0]
+        assert rows <= 5 + SqliteStorage.PRUNE_EVERY
+
+    def test_sqlite_fails_open_when_locked(self, tmp_path, clock):
+        """Test that a check gives up after busy_timeout_ms and admits instead of blocking the loop"""
+        uri = f"sqlite://{tmp_path}/busy.db?busy_timeout_ms=1"
+        worker_a = storage_from_string(uri)
+        worker_b = FixedWindowRateLimiter(storage_from_string(uri))
+        item = parse("1/minute")
+        assert worker_b.hit(item, "ip") is True
+
+        holder = worker_a._connection()
+        holder.execute("BEGIN IMMEDIATE")
+        try:
+            assert worker_b.hit(item, "ip") is True
+            assert worker_b.storage.busy_skips == 1
+        finally:
+            holder.execute("ROLLBACK")
+        assert worker_b.hit(item, "ip") is False
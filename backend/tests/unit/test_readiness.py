@@ -0,0 +1,110 @@
+"""
+Unit tests for backend/app/core/readiness.py
+Tests the cached readiness verdict with a fake probe, pool and clock
+"""
+import asyncio
+
+from app.core.readiness import ReadinessMonitor
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_monitor(probe_ok: list[bool], checked_out: int = 0, clock: FakeClock | None = None) -> ReadinessMonitor:
+    async def probe() -> None:
+        if not probe_ok[0]:
+            raise ConnectionRefusedError("connection refused")
+
+    return ReadinessMonitor(
+        probe=probe,
+        pool_stats=lambda: {"checked_out": checked_out, "limit": 15},
+        interval=5,
+        timeout=1,
+        failure_threshold=2,
+        max_pool_saturation=1.0,
+        max_loop_lag_ms=500,
+        clock=clock or FakeClock(),
+    )
+
+
+class TestReadinessMonitor:
+    """Test when the worker reports ready"""
+
+    def test_not_ready_until_first_probe(self):
+        """Test that a fresh worker is not put into rotation"""
+        state = make_monitor([True]).state()
+        assert state["ready"] is False
+        assert state["reasons"] == ["starting"]
+
+    def test_ready_after_successful_probe(self):
+        """Test the happy path and the reported pool saturation"""
+        monitor = make_monitor([True], checked_out=3)
+        asyncio.run(monitor.probe_once())
+
+        state = monitor.state()
+        assert state["ready"] is True
+        assert state["database"]["ok"] is True
+        assert state["pool"]["saturation"] == 0.2
+
+    def test_failures_flip_after_threshold(self):
+        """Test that one failed probe is tolerated and the threshold is not"""
+        probe_ok = [True]
+        monitor = make_monitor(probe_ok)
+        asyncio.run(monitor.probe_once())
+
+        probe_ok[0] = False
+        asyncio.run(monitor.probe_once())
+        assert monitor.state()["ready"] is True
+
+        asyncio.run(monitor.probe_once())
+        state = monitor.state()
+        assert state["reasons"] == ["database_unreachable"]
+        assert "error" not in state["database"]
+        assert "connection refused" in monitor.last_error
+
+        probe_ok[0] = True
+        asyncio.run(monitor.probe_once())
+        assert monitor.state()["ready"] is True
+
+    def test_hung_probe_times_out(self):
+        """Test that a probe stuck on the pool counts as a failure"""
+        async def hang() -> None:
+            await asyncio.sleep(10)
+
+        monitor = make_monitor([True])
+        monitor._probe = hang
+        monitor.timeout = 0.01
+        assert asyncio.run(monitor.probe_once()) is False
+        assert monitor.last_error == "TimeoutError"
+
+    def test_saturated_pool_stale_probe_and_loop_lag(self):
+        """Test the non-database reasons"""
+        clock = FakeClock()
+        monitor = make_monitor([True], checked_out=15, clock=clock)
+        asyncio.run(monitor.probe_once())
+        assert monitor.state()["reasons"] == ["pool_saturated"]
+
+        monitor = make_monitor([True], clock=clock)
+        asyncio.run(monitor.probe_once())
+        clock.now += 16
+        monitor.loop_lag_ms = 800
+        assert monitor.state()["reasons"] == ["probe_stale", "event_loop_lag"]
+
+    def test_run_stops_on_event(self):
+        """Test that the probe loop probes at once and exits when stopped"""
+        monitor = make_monitor([True], clock=FakeClock())
+
+        async def main() -> None:
+            stop = asyncio.Event()
+            task = asyncio.create_task(monitor.run(stop))
+            await asyncio.sleep(0.01)
+            stop.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        asyncio.run(main())
+        assert monitor.last_success_at is not None
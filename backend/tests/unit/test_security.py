@@ -2,20 +2,30 @@
 Unit tests for backend/app/core/security.py
 Tests password hashing, JWT tokens, and session management
 """
+import asyncio
 import re
+import time
 from datetime import UTC, datetime, timedelta
 
 import jwt
 import pytest
+from pwdlib.hashers.argon2 import Argon2Hasher
 
 from app.core.config import settings
 from app.core.security import (
+    PasswordHasherBusyError,
+    PasswordHashPool,
+    calibrate_argon2,
     create_access_token,
     create_session_expiry,
     create_session_token,
     decode_token,
     get_password_hash,
+    get_password_hash_async,
+    hash_session_token,
+    verify_and_update_password,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -94,6 +104,104 @@ class TestPasswordFunctions:
         assert verify_password(password.strip(), hashed) is False
 
 
+class TestArgon2Costs:
+    """Test rehash-on-verify and cost calibration"""
+
+    def test_verify_and_update_rehashes_other_costs(self):
+        """Test that hashes with weaker or stronger costs are replaced, current ones are not"""
+        password = "RehashPassword123!"
+        current = get_password_hash(password)
+        assert verify_and_update_password(password, current) == (True, None)
+
+        for time_cost in (1, settings.ARGON2_TIME_COST + 1):
+            old = Argon2Hasher(time_cost=time_cost, memory_cost=8 * 1024).hash(password)
+            valid, new_hash = verify_and_update_password(password, old)
+            assert valid is True
+            assert new_hash is not None
+            assert f"m={settings.ARGON2_MEMORY_COST_KIB},t={settings.ARGON2_TIME_COST}" in new_hash
+            assert verify_and_update_password(password, new_hash) == (True, None)
+
+        assert verify_and_update_password("WrongPassword456!", old) == (False, None)
+
+    def test_calibrate_prefers_memory_then_passes(self):
+        """Test the chosen costs against a fake cost model (10 ms per MiB-pass + 5 ms per MiB setup)"""
+        def model(time_cost: int, memory_cost: int, parallelism: int) -> float:
+            mib = memory_cost / 1024
+            return 5 * mib + 10 * mib * time_cost
+
+        chosen = calibrate_argon2(250, max_memory_kib=8 * 1024, parallelism=1, min_memory_kib=1024, measure=model)
+        assert chosen == {"time_cost": 2, "memory_cost": 8 * 1024, "parallelism": 1, "verify_ms": 200.0}
+
+        # One pass over max memory is too slow: memory is halved until it fits
+        chosen = calibrate_argon2(100, max_memory_kib=16 * 1024, parallelism=1, min_memory_kib=1024, measure=model)
+        assert chosen["memory_cost"] == 4 * 1024
+        assert chosen["verify_ms"] <= 100
+
+
+class TestAsyncPasswordFunctions:
+    """Test password hashing offloaded to the worker pool"""
+
+    async def test_async_hash_and_verify(self):
+        """Test that async hashing round-trips with sync verification and vice versa"""
+        password = "AsyncPassword123!"
+        hashed = await get_password_hash_async(password)
+        assert hashed.startswith("$argon2")
+        assert verify_password(password, hashed) is True
+        assert await verify_password_async(password, hashed) is True
+        assert await verify_password_async("WrongPassword456!", hashed) is False
+
+    async def test_pool_rejects_when_full(self):
+        """Test that calls beyond workers + queue size fail fast"""
+        pool = PasswordHashPool("thread", workers=1, queue_size=0)
+        try:
+            first = asyncio.create_task(pool.run(time.sleep, 0.2))
+            await asyncio.sleep(0)  # let the first call take the only slot
+
+            with pytest.raises(PasswordHasherBusyError):
+                await pool.run(time.sleep, 0)
+
+            await first
+            stats = pool.stats()
+            assert stats["rejected"] == 1
+            assert stats["completed"] == 1
+            assert stats["queue_depth"] == 0
+            assert stats["max_queue_depth"] == 1
+            assert stats["max_latency_ms"] >= 200
+        finally:
+            pool.shutdown()
+
+    async def test_pool_keeps_failures_out_of_latency(self):
+        """Test that calls which raise or are cancelled count as failed, not completed"""
+        def boom() -> None:
+            raise RuntimeError("hasher error")
+
+        pool = PasswordHashPool("thread", workers=1, queue_size=1)
+        try:
+            with pytest.raises(RuntimeError):
+                await pool.run(boom)
+
+            slow = asyncio.create_task(pool.run(time.sleep, 0.2))
+            await asyncio.sleep(0.05)
+            slow.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await slow
+            await asyncio.sleep(0.2)  # the worker thread finishes the abandoned call
+
+            await pool.run(time.sleep, 0)
+            stats = pool.stats()
+            assert stats["failed"] == 2
+            assert stats["completed"] == 1
+            assert stats["queue_depth"] == 0
+            assert stats["max_latency_ms"] < 100
+        finally:
+            pool.shutdown()
+
+    def test_pool_rejects_unknown_kind(self):
+        """Test that only thread and process pools are accepted"""
+        with pytest.raises(ValueError):
+            PasswordHashPool("fiber", workers=1, queue_size=0)
+
+
 class TestJWTTokens:
     """Test JWT token creation and decoding"""
 
@@ -235,6 +343,15 @@ class TestSessionManagement:
         assert token is not None
         assert isinstance(token, str)
 
+    def test_session_token_hash(self):
+        """Test that the stored digest is 32 bytes, deterministic and token-specific"""
+        token = create_session_token()
+        digest = hash_session_token(token)
+        assert isinstance(digest, bytes)
+        assert len(digest) == 32
+        assert hash_session_token(token) == digest
+        assert hash_session_token(create_session_token()) != digest
+
     def test_session_token_length(self):
         """Test that session token has correct length (64 hex chars)"""
         token = create_session_token()
@@ -0,0 +1,55 @@
+"""
+Unit tests for backend/app/core/security_headers.py
+Tests the precomputed header block and static path opt-out (plain ASGI, no app)
+"""
+import asyncio
+from typing import Any
+
+from app.core.security_headers import SecurityHeadersMiddleware, build_security_headers
+
+
+async def _endpoint(scope: Any, receive: Any, send: Any) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _response_headers(middleware: SecurityHeadersMiddleware, path: str) -> dict[bytes, bytes]:
+    messages: list[dict] = []
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    asyncio.run(middleware({"type": "http", "path": path, "headers": []}, receive, send))
+    return dict(messages[0]["headers"])
+
+
+class TestSecurityHeaders:
+    """Test the security header block and middleware"""
+
+    def test_hsts_only_in_production(self):
+        """Test that the production block adds HSTS and development does not"""
+        production = dict(build_security_headers("production", "https://example.com"))
+        development = dict(build_security_headers("development", "http://localhost:3000"))
+
+        assert b"strict-transport-security" in production
+        assert b"strict-transport-security" not in development
+        assert b"https://example.com" in production[b"content-security-policy"]
+
+    def test_block_added_once_per_response(self):
+        """Test that every header of the block is added next to the app's own"""
+        block = build_security_headers("development", "http://localhost:3000")
+        headers = _response_headers(SecurityHeadersMiddleware(_endpoint, headers=block), "/api/v1/posts/feed")
+
+        assert headers[b"content-type"] == b"text/plain"
+        for name, value in block:
+            assert headers[name] == value
+
+    def test_excluded_prefixes_pass_through(self):
+        """Test that static asset paths can opt out"""
+        middleware = SecurityHeadersMiddleware(_endpoint, exclude_prefixes=("/static/",))
+
+        assert b"x-frame-options" not in _response_headers(middleware, "/static/app.js")
+        assert b"x-frame-options" in _response_headers(middleware, "/api/v1/health")
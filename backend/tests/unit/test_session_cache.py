@@ -0,0 +1,135 @@
+"""
+Unit tests for backend/app/core/session_cache.py
+Tests TTL expiry, LRU eviction, invalidation and hit-rate counters (without database)
+"""
+from datetime import datetime, timedelta
+
+from app.core.session_cache import SessionCache
+from app.db.models import User
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_user(user_id: int) -> User:
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        full_name=None,
+        is_active=True,
+        created_at=datetime.now(),
+        updated_at=None,
+        hashed_password="$argon2id$secret",
+    )
+
+
+def session_expiry(minutes: int = 60) -> datetime:
+    return datetime.now() + timedelta(minutes=minutes)
+
+
+class TestSessionCache:
+    """Test the session token -> user snapshot cache"""
+
+    def test_hit_returns_detached_copy(self):
+        """Test that a hit returns a new User built from the snapshot"""
+        cache = SessionCache(max_size=10, ttl_seconds=60)
+        user = make_user(1)
+        cache.put("token", user, session_expiry())
+
+        cached = cache.get("token")
+        assert cached is not None
+        assert cached is not user
+        assert cached.id == 1
+        assert cached.username == "user1"
+        # Password hashes never enter the cache
+        assert cached.hashed_password is None
+
+    def test_miss_and_hit_ratio(self):
+        """Test that hits and misses are counted"""
+        cache = SessionCache(max_size=10, ttl_seconds=60)
+        assert cache.get("missing") is None
+        cache.put("token", make_user(1), session_expiry())
+        cache.get("token")
+        cache.get("token")
+        cache.get("token")
+
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.75
+
+    def test_entry_expires_after_ttl(self):
+        """Test that entries expire after the configured TTL"""
+        clock = FakeClock()
+        cache = SessionCache(max_size=10, ttl_seconds=30, clock=clock)
+        cache.put("token", make_user(1), session_expiry())
+
+        clock.now += 29
+        assert cache.get("token") is not None
+        clock.now += 2
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+
+    def test_entry_expires_with_session(self):
+        """Test that a session expiring before the TTL bounds the entry lifetime"""
+        clock = FakeClock()
+        cache = SessionCache(max_size=10, ttl_seconds=3600, clock=clock)
+        cache.put("token", make_user(1), datetime.now() + timedelta(seconds=10))
+
+        clock.now += 11
+        assert cache.get("token") is None
+
+    def test_expired_session_is_not_cached(self):
+        """Test that already expired sessions are ignored"""
+        cache = SessionCache(max_size=10, ttl_seconds=60)
+        cache.put("token", make_user(1), datetime.now() - timedelta(seconds=1))
+        assert cache.get("token") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = SessionCache(max_size=2, ttl_seconds=60)
+        cache.put("a", make_user(1), session_expiry())
+        cache.put("b", make_user(2), session_expiry())
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", make_user(3), session_expiry())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_token(self):
+        """Test that logout drops the entry"""
+        cache = SessionCache(max_size=10, ttl_seconds=60)
+        cache.put("token", make_user(1), session_expiry())
+        cache.invalidate("token")
+        assert cache.get("token") is None
+        # Unknown tokens are ignored
+        cache.invalidate("unknown")
+
+    def test_invalidate_user_drops_all_sessions(self):
+        """Test that deactivating a user drops every session of that user only"""
+        cache = SessionCache(max_size=10, ttl_seconds=60)
+        cache.put("laptop", make_user(1), session_expiry())
+        cache.put("phone", make_user(1), session_expiry())
+        cache.put("other", make_user(2), session_expiry())
+
+        cache.invalidate_user(1)
+
+        assert cache.get("laptop") is None
+        assert cache.get("phone") is None
+        assert cache.get("other") is not None
+
+    def test_disabled_cache_stores_nothing(self):
+        """Test that max_size=0 disables caching"""
+        cache = SessionCache(max_size=0, ttl_seconds=60)
+        cache.put("token", make_user(1), session_expiry())
+        assert cache.get("token") is None
@@ -0,0 +1,114 @@
+"""
+Unit tests for backend/app/core/single_flight.py
+Tests request coalescing without a database
+"""
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+def run_concurrently(group: SingleFlight, key: object, callers: int, load) -> list:
+    async def main() -> list:
+        return await asyncio.gather(
+            *(group.do(key, load) for _ in range(callers)), return_exceptions=True
+        )
+    return asyncio.run(main())
+
+
+class TestSingleFlight:
+    """Test that concurrent identical loads run once"""
+
+    def test_concurrent_callers_share_one_load(self):
+        """Test that one load serves every caller arriving while it runs"""
+        group = SingleFlight()
+        calls = 0
+
+        async def load() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [1, 2, 3]
+
+        results = run_concurrently(group, ("circle", 1), 50, load)
+
+        assert calls == 1
+        assert all(result == [1, 2, 3] for result in results)
+        assert group.stats() == {"in_flight": 0, "leaders": 1, "followers": 49}
+
+    def test_nothing_cached_after_completion(self):
+        """Test that sequential calls each run their own load"""
+        group = SingleFlight()
+        calls = 0
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        async def main() -> list[int]:
+            return [await group.do("key", load), await group.do("key", load)]
+
+        assert asyncio.run(main()) == [1, 2]
+
+    def test_different_keys_not_shared(self):
+        """Test that other parameters get their own load"""
+        group = SingleFlight()
+
+        async def main() -> list[str]:
+            async def load(value: str) -> str:
+                await asyncio.sleep(0.01)
+                return value
+            return await asyncio.gather(group.do("a", lambda: load("a")), group.do("b", lambda: load("b")))
+
+        assert asyncio.run(main()) == ["a", "b"]
+        assert group.leaders == 2
+
+    def test_error_reaches_every_caller(self):
+        """Test that a failed load fails all callers waiting for it"""
+        group = SingleFlight()
+
+        async def load() -> None:
+            await asyncio.sleep(0.01)
+            raise LookupError("Circle not found")
+
+        results = run_concurrently(group, "key", 5, load)
+        assert all(isinstance(result, LookupError) for result in results)
+
+    def test_cancelled_leader_hands_over(self):
+        """Test that followers survive the leader being cancelled"""
+        group = SingleFlight()
+        calls = 0
+
+        async def load() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "page"
+
+        async def main() -> str:
+            leader = asyncio.ensure_future(group.do("key", load))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(group.do("key", load))
+            await asyncio.sleep(0.005)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == "page"
+        assert calls == 2
+
+    def test_disabled(self):
+        """Test that a disabled group runs every load"""
+        group = SingleFlight(enabled=False)
+        calls = 0
+
+        async def load() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        run_concurrently(group, "key", 3, load)
+        assert calls == 3
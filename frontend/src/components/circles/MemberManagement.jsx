@@ -5,14 +5,15 @@ import AddMemberModal from './AddMemberModal';
 import { useCirclePermissions } from '../../hooks/useCirclePermissions';
 import './MemberManagement.css';
 
-const MemberManagement = ({ circle, members, onMemberUpdated, currentUserId }) => {
+const MemberManagement = ({ circle, members, onMemberUpdated, onLoadMore, currentUserId }) => {
   const [isAddModalOpen, setIsAddModalOpen] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const { canManageMembers } = useCirclePermissions(circle);
   
-  // Users roles are determined by the members list, so we find the current user's role from there
+  // members may only hold the first pages, so prefer the role reported by the API
   const getCurrentUserRole = () => {
     const currentUser = members.find(m => m.user_id === currentUserId);
-    return currentUser?.role || null;
+    return circle.current_user_role ?? currentUser?.role ?? null;
   };
 
   const currentUserRole = getCurrentUserRole();
@@ -30,10 +31,21 @@ const MemberManagement = ({ circle, members, onMemberUpdated, currentUserId }) =
     setIsAddModalOpen(false);
   };
 
+  const handleLoadMore = async () => {
+    try {
+      setIsLoadingMore(true);
+      await onLoadMore();
+    } catch (error) {
+      console.error('Failed to load more members:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   return (
     <div className="member-management">
       <div className="member-header">
-        <h3>Members ({members.length})</h3>
+        <h3>Members ({circle.member_count ?? members.length})</h3>
         {canManageMembers && (
           <button 
             className="add-member-btn"
@@ -56,6 +68,16 @@ const MemberManagement = ({ circle, members, onMemberUpdated, currentUserId }) =
           />
         ))}
       </div>
+
+      {circle.members_next_cursor && onLoadMore && (
+        <button
+          className="load-more-members-btn"
+          onClick={handleLoadMore}
+          disabled={isLoadingMore}
+        >
+          {isLoadingMore ? 'Loading...' : `Load more members (${members.length} of ${circle.member_count})`}
+        </button>
+      )}
       
       <AddMemberModal 
         isOpen={isAddModalOpen}
@@ -18,8 +18,9 @@ export const useCirclePermissions = (circle) => {
     };
   }
 
+  // members only holds the first page, so prefer the role reported by the API
   const currentMember = circle.members?.find(m => m.user_id === user.id);
-  const role = currentMember?.role;
+  const role = circle.current_user_role ?? currentMember?.role;
   
   return {
     isOwner: role === 'owner',
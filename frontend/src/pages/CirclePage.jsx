@@ -86,11 +86,25 @@ function CirclePage() {
     }
   };
 
+  // GET /circles/{id} embeds the first page of members; follow the cursor for the rest
+  const handleLoadMoreMembers = async () => {
+    const page = await circleService.getCircleMembers(circle.id, circle.members_next_cursor);
+    setCircle(prev => {
+      const known = new Set(prev.members.map(m => m.user_id));
+      return {
+        ...prev,
+        members: [...prev.members, ...page.members.filter(m => !known.has(m.user_id))],
+        members_next_cursor: page.next_cursor
+      };
+    });
+  };
+
   const handleCircleUpdated = (updatedCircle) => {
     setCircle(updatedCircle);
   };
 
-  const currentUserRole = circle?.members?.find(m => m.user_id === user?.id)?.role;
+  const currentUserRole = circle?.current_user_role
+    ?? circle?.members?.find(m => m.user_id === user?.id)?.role;
   const isOwner = currentUserRole === 'owner';
   const isModerator = currentUserRole === 'moderator';
   const canChangeSettings = isOwner;
@@ -212,6 +226,7 @@ function CirclePage() {
               circle={circle}
               members={circle.members || []}
               onMemberUpdated={handleMemberUpdated}
+              onLoadMore={handleLoadMoreMembers}
               currentUserId={user?.id}
             />
             
@@ -26,6 +26,17 @@ export const circleService = {
     }
   },
 
+  // Fetch the next page of a circle's members (pass the members_next_cursor / next_cursor received)
+  getCircleMembers: async (circleId, cursor) => {
+    try {
+      const response = await api.get(`${BASE_URL}/${circleId}/members`, { params: { cursor } });
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching circle members:', error);
+      throw error;
+    }
+  },
+
   // Create a new circle
   createCircle: async (circleData) => {
     try {
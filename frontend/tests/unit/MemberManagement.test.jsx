@@ -0,0 +1,67 @@
+// frontend/tests/unit/MemberManagement.test.jsx
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { render, screen, fireEvent, waitFor } from '@testing-library/react';
+import MemberManagement from '../../src/components/circles/MemberManagement';
+
+vi.mock('../../src/services/circleMember.service');
+vi.mock('../../src/contexts/useAuth', () => ({
+  useAuth: () => ({ user: { id: 60 } }),
+}));
+
+const member = (userId, role = 'member') => ({
+  circle_id: 5,
+  user_id: userId,
+  username: `user${userId}`,
+  role,
+  badge: '',
+  joined_at: '2026-01-01T00:00:00',
+});
+
+describe('MemberManagement', () => {
+  // First page only: the caller (user 60) is not in it
+  const circle = {
+    id: 5,
+    member_count: 60,
+    members_next_cursor: 'next-page',
+    current_user_role: 'moderator',
+  };
+  const members = Array.from({ length: 50 }, (_, i) => member(i + 1, i === 0 ? 'owner' : 'member'));
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('shows the total member count, not the size of the loaded page', () => {
+    render(<MemberManagement circle={circle} members={members} onMemberUpdated={vi.fn()} onLoadMore={vi.fn()} currentUserId={60} />);
+
+    expect(screen.getByRole('heading', { name: 'Members (60)' })).toBeInTheDocument();
+  });
+
+  it('takes the caller role from current_user_role', () => {
+    render(<MemberManagement circle={circle} members={members} onMemberUpdated={vi.fn()} onLoadMore={vi.fn()} currentUserId={60} />);
+
+    // Moderators can add members even though they are not on the first page
+    expect(screen.getByRole('button', { name: /add member/i })).toBeInTheDocument();
+  });
+
+  it('loads the next page while members_next_cursor is set', async () => {
+    const onLoadMore = vi.fn().mockResolvedValue();
+    const { rerender } = render(
+      <MemberManagement circle={circle} members={members} onMemberUpdated={vi.fn()} onLoadMore={onLoadMore} currentUserId={60} />
+    );
+
+    fireEvent.click(screen.getByRole('button', { name: /load more members/i }));
+    await waitFor(() => expect(onLoadMore).toHaveBeenCalledTimes(1));
+
+    rerender(
+      <MemberManagement
+        circle={{ ...circle, members_next_cursor: null }}
+        members={[...members, ...Array.from({ length: 10 }, (_, i) => member(i + 51))]}
+        onMemberUpdated={vi.fn()}
+        onLoadMore={onLoadMore}
+        currentUserId={60}
+      />
+    );
+    expect(screen.queryByRole('button', { name: /load more members/i })).not.toBeInTheDocument();
+  });
+});